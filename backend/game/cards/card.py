@@ -5,6 +5,9 @@ from game.values.constants import CARD_NAME_KEY, CARD_COST_KEY, CARD_EFFECT_KEY,
 
 
 class Card(ABC):
+    # see KeepCard, cards that are not kept never respond to a Trigger
+    triggers = ()
+
     def __init__(self, name, cost, effect, footnote=None):
         self.name = name
         self.cost = cost
@@ -16,6 +19,13 @@ class Card(ABC):
     def __eq__(self, other):
         return self is other or self.name == other.name
 
+    def __reduce_ex__(self, protocol):
+        # a pickled catalog card is just its id and unpickles to the shared instance again
+        from game.cards import card_catalog
+        if card_catalog.is_shared_card(self):
+            return card_catalog.get_card, (card_catalog.get_card_id(self),)
+        return super().__reduce_ex__(protocol)
+
     def to_dict(self):
         return {
             CARD_NAME_KEY: self.name,
@@ -0,0 +1,128 @@
+"""
+Every card of the game, keyed by a stable integer id.
+
+Cards keep no state of their own, so one instance of each card is created here and shared by every deck, store and
+hand. A card's id is the number of its code in Play.CARD (game/models.py), so "Alien Metabolism" is 2 and is
+recorded as '02'.
+"""
+
+from game.cards.discard_cards.energy_manipulation_cards.energize import Energize
+from game.cards.discard_cards.health_manipulation_cards.fire_blast import FireBlast
+from game.cards.discard_cards.health_manipulation_cards.heal import Heal
+from game.cards.discard_cards.health_manipulation_cards.high_altitude_bombing import HighAltitudeBombing
+from game.cards.discard_cards.multi_manipulation_cards.gas_refinery import GasRefinery
+from game.cards.discard_cards.multi_manipulation_cards.jet_fighters import JetFighters
+from game.cards.discard_cards.multi_manipulation_cards.national_guard import NationalGuard
+from game.cards.discard_cards.multi_manipulation_cards.nuclear_power_plant import NuclearPowerPlant
+from game.cards.discard_cards.multi_manipulation_cards.tanks import Tanks
+from game.cards.discard_cards.multi_manipulation_cards.vast_storm import VastStorm
+from game.cards.discard_cards.turn_manipulation_cards.frenzy import Frenzy
+from game.cards.discard_cards.victory_point_manipulation_cards.apartment_building import ApartmentBuilding
+from game.cards.discard_cards.victory_point_manipulation_cards.commuter_train import CommuterTrain
+from game.cards.discard_cards.victory_point_manipulation_cards.corner_store import CornerStore
+from game.cards.discard_cards.victory_point_manipulation_cards.drop_from_high_altitude import DropFromHighAltitude
+from game.cards.discard_cards.victory_point_manipulation_cards.evacuation_orders import EvacuationOrders
+from game.cards.discard_cards.victory_point_manipulation_cards.skyscraper import Skyscraper
+from game.cards.keep_card import KeepCard
+from game.cards.keep_cards.attack_manipulation_cards.nova_breath import NovaBreath
+from game.cards.keep_cards.attack_manipulation_cards.spiked_tail import SpikedTail
+from game.cards.keep_cards.energy_manipulation_cards.alien_metabolism import AlienMetabolism
+from game.cards.keep_cards.energy_manipulation_cards.energy_hoarder import EnergyHoarder
+from game.cards.keep_cards.energy_manipulation_cards.friend_of_children import FriendOfChildren
+from game.cards.keep_cards.energy_manipulation_cards.solar_powered import SolarPowered
+from game.cards.keep_cards.energy_manipulation_cards.were_only_making_it_stronger import WereOnlyMakingItStronger
+from game.cards.keep_cards.health_manipulation_cards.armor_plating import ArmorPlating
+from game.cards.keep_cards.health_manipulation_cards.even_bigger import EvenBigger
+from game.cards.keep_cards.health_manipulation_cards.it_has_a_child import ItHasAChild
+from game.cards.keep_cards.health_manipulation_cards.regeneration import Regeneration
+from game.cards.keep_cards.turn_manipulation_cards.GiantBrain import GiantBrain
+from game.cards.keep_cards.victory_point_manipulation_cards.alpha_monster import AlphaMonster
+from game.cards.keep_cards.victory_point_manipulation_cards.complete_destruction import CompleteDestruction
+from game.cards.keep_cards.victory_point_manipulation_cards.dedicated_news_team import DedicatedNewsTeam
+from game.cards.keep_cards.victory_point_manipulation_cards.eater_of_the_dead import EaterOfTheDead
+from game.cards.keep_cards.victory_point_manipulation_cards.gourmet import Gourmet
+from game.cards.keep_cards.victory_point_manipulation_cards.omnivore import Omnivore
+from game.cards.keep_cards.victory_point_manipulation_cards.rooting_for_the_underdog import RootingForTheUnderdog
+from game.cards.keep_cards.victory_point_manipulation_cards.urbavore import Urbavore
+
+# Never renumber a card, ids are stored in board snapshots and Play records
+CARD_CLASSES_BY_ID = {
+    2: AlienMetabolism,
+    3: AlphaMonster,
+    4: ApartmentBuilding,
+    5: ArmorPlating,
+    9: CommuterTrain,
+    10: CompleteDestruction,
+    11: CornerStore,
+    12: DedicatedNewsTeam,
+    13: DropFromHighAltitude,
+    14: EaterOfTheDead,
+    15: Energize,
+    16: EnergyHoarder,
+    17: EvacuationOrders,
+    18: EvenBigger,
+    20: FireBlast,
+    23: Frenzy,
+    24: FriendOfChildren,
+    25: GasRefinery,
+    26: GiantBrain,
+    27: Gourmet,
+    28: Heal,
+    32: HighAltitudeBombing,
+    33: ItHasAChild,
+    34: JetFighters,
+    40: NationalGuard,
+    41: NovaBreath,
+    42: NuclearPowerPlant,
+    43: Omnivore,
+    51: Regeneration,
+    52: RootingForTheUnderdog,
+    54: Skyscraper,
+    56: SolarPowered,
+    57: SpikedTail,
+    59: Tanks,
+    61: Urbavore,
+    62: VastStorm,
+    63: WereOnlyMakingItStronger,
+}
+
+CARD_IDS = {card_class: card_id for card_id, card_class in CARD_CLASSES_BY_ID.items()}
+CARDS_BY_ID = {card_id: card_class() for card_id, card_class in CARD_CLASSES_BY_ID.items()}
+
+KEEP_CARD_TYPE_CODE = '1'
+DISCARD_CARD_TYPE_CODE = '0'
+
+
+def get_card(card_id):
+    """Returns the shared instance of the card with the given id."""
+    try:
+        return CARDS_BY_ID[card_id]
+    except KeyError:
+        raise ValueError("There is no card with id {}".format(card_id))
+
+
+def get_shared_card(card_class):
+    return CARDS_BY_ID[CARD_IDS[card_class]]
+
+
+def get_card_id(card):
+    """Takes a card or a card class."""
+    card_class = card if isinstance(card, type) else type(card)
+    try:
+        return CARD_IDS[card_class]
+    except KeyError:
+        raise ValueError("{} is not in the card catalog".format(card_class.__name__))
+
+
+def is_shared_card(card):
+    return CARDS_BY_ID.get(CARD_IDS.get(type(card))) is card
+
+
+def get_card_code(card):
+    """The Play.CARD code of a card."""
+    return "{:02d}".format(get_card_id(card))
+
+
+def get_card_type_code(card):
+    """The Play.CARD_TYPE code of a card."""
+    return KEEP_CARD_TYPE_CODE if isinstance(card, KeepCard) else DISCARD_CARD_TYPE_CODE
@@ -4,6 +4,10 @@ from game.cards.card import Card
 
 
 class KeepCard(Card):
+    # A keep card lists the Trigger members it responds to in triggers, the player holding it indexes the card under
+    # each of them (see Player.card_hooks). Cards of one trigger run from the lowest trigger_order up.
+    trigger_order = 0
+
     def __init__(self, name, cost, effect, footnote=None):
         super().__init__(name, cost, effect, footnote)
         self.card_type = "Keep"
@@ -1,7 +1,10 @@
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
 
 
 class SpikedTail(KeepCard):
+    triggers = (Trigger.ON_ATTACK_ROLL,)
+
     def __init__(self):
         super().__init__("Spiked Tail", 5,
                          "If you roll at least one [attack], add [attack] to your roll")
@@ -14,3 +17,6 @@ class SpikedTail(KeepCard):
             return attack_die_value + 1
         else:
             return attack_die_value
+
+    def on_attack_roll(self, player_that_bought_the_card, attack):
+        return self.attack_dice_special_effect(player_that_bought_the_card, attack)
@@ -1,8 +1,11 @@
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
 from game.values import constants
 
 
 class EnergyHoarder(KeepCard):
+    triggers = (Trigger.ON_TURN_END,)
+
     def __init__(self):
         super().__init__("Energy Hoarder", 3,
                          "You gain 1[Star] for every 6[Energy] you have at the end of your turn.")
@@ -10,3 +13,6 @@ class EnergyHoarder(KeepCard):
     def special_effect(self, player_that_bought_the_card, other_players):
         num_stars = player_that_bought_the_card.energy // constants.ENERGY_HOARDER_DIVIDER
         player_that_bought_the_card.update_victory_points_by(num_stars)
+
+    def on_turn_end(self, player_that_bought_the_card, other_players):
+        self.special_effect(player_that_bought_the_card, other_players)
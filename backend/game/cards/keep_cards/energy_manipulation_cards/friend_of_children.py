@@ -1,7 +1,10 @@
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
 
 
 class FriendOfChildren(KeepCard):
+    triggers = (Trigger.ON_ENERGY_GAIN,)
+
     def __init__(self):
         super().__init__("Friend of Children", 3,
                          "When you gain any [Energy] gain 1 extra [Energy].")
@@ -13,3 +16,6 @@ class FriendOfChildren(KeepCard):
         if change_integer >= 1:
             change_integer += 1
         return change_integer
+
+    def on_energy_gain(self, player_that_bought_the_card, energy):
+        return FriendOfChildren.add_extra_energy(energy)
@@ -1,10 +1,16 @@
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
 
 
 class SolarPowered(KeepCard):
+    triggers = (Trigger.ON_TURN_END,)
+
     def __init__(self):
         super().__init__("Solar Powered", 4, "At the end of your turn gain 1[Energy] if you have no [Energy].")
 
     def special_effect(self, player_that_bought_the_card, other_players):
         if player_that_bought_the_card.energy == 0:
             player_that_bought_the_card.update_energy_by(1)
+
+    def on_turn_end(self, player_that_bought_the_card, other_players):
+        self.special_effect(player_that_bought_the_card, other_players)
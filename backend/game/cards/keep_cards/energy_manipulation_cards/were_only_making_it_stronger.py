@@ -1,10 +1,18 @@
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
 
 
 class WereOnlyMakingItStronger(KeepCard):
+    triggers = (Trigger.ON_HEALTH_CHANGE,)
+
     def __init__(self):
         super().__init__("We're Only Making It Stronger", 3,
                          "When you lose 2[health] or more gain 1[energy].")
 
     def special_effect(self, player_that_bought_the_card, other_players):
         player_that_bought_the_card.update_energy_by(1)
+
+    def on_health_change(self, player_that_bought_the_card, health):
+        if health <= -2:
+            self.special_effect(player_that_bought_the_card, None)
+        return health
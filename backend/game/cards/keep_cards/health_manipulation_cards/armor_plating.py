@@ -1,7 +1,10 @@
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
 
 
 class ArmorPlating(KeepCard):
+    triggers = (Trigger.ON_HEALTH_CHANGE,)
+
     def __init__(self):
         super().__init__("Armor Plating", 4,
                          "Do not lose 1[health] when you lose exactly 1[health]",
@@ -11,3 +14,6 @@ class ArmorPlating(KeepCard):
         if health == -1:
             health = 0
         return health
+
+    def on_health_change(self, player_that_bought_the_card, health):
+        return self.special_effect(player_that_bought_the_card, health)
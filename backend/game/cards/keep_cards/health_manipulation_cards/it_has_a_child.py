@@ -1,8 +1,11 @@
 from game.cards.card import Card
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
 
 
 class ItHasAChild(KeepCard):
+    triggers = (Trigger.ON_DEATH,)
+
     def __init__(self):
         super().__init__("It Has a Child", 7,
                          "If you reach 0[health] discard all your cards and lose all you [star]. Gain 10[health] and continue playing outside Tokyo.")
@@ -13,3 +16,6 @@ class ItHasAChild(KeepCard):
             player_that_bought_the_card.lose_all_stars()
             player_that_bought_the_card.leave_tokyo()
             player_that_bought_the_card.current_health = 10
+
+    def on_death(self, player_that_bought_the_card):
+        self.special_effect(player_that_bought_the_card, None)
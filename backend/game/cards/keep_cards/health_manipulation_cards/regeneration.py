@@ -1,7 +1,10 @@
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
 
 
 class Regeneration(KeepCard):
+    triggers = (Trigger.ON_HEALTH_CHANGE,)
+
     def __init__(self):
         super().__init__("Regeneration", 4,
                          "When you gain [health], gain 1 extra [health]")
@@ -10,3 +13,6 @@ class Regeneration(KeepCard):
         if health >= 1:
             health += 1
         return health
+
+    def on_health_change(self, player_that_bought_the_card, health):
+        return self.special_effect(player_that_bought_the_card, health)
@@ -1,10 +1,18 @@
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
+from game.dice.dice import DieValue
 
 
 class AlphaMonster(KeepCard):
+    triggers = (Trigger.ON_DICE_RESOLVED,)
+
     def __init__(self):
         super().__init__("Alpha Monster", 5,
                          "Gain 1[Star] when you Roll at least one [attack].")
 
     def special_effect(self, player_that_bought_the_card, other_players):
         player_that_bought_the_card.update_victory_points_by(1)
+
+    def on_dice_resolved(self, player_that_bought_the_card, dice_counter, other_players):
+        if dice_counter[DieValue.ATTACK] >= 1:
+            self.special_effect(player_that_bought_the_card, other_players)
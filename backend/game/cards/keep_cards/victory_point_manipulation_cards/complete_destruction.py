@@ -1,10 +1,20 @@
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
+from game.dice.dice import DieValue
 
 
 class CompleteDestruction(KeepCard):
+    triggers = (Trigger.ON_DICE_RESOLVED,)
+
     def __init__(self):
         super().__init__("Complete Destruction", 3,
                          "If you roll [1][2][3][Heart][Attack][Energy] gain 9[Star] in addition to the regular results.")
 
     def special_effect(self, player_that_bought_the_card, other_players):
         player_that_bought_the_card.update_victory_points_by(9)
+
+    def on_dice_resolved(self, player_that_bought_the_card, dice_counter, other_players):
+        if dice_counter[DieValue.ONE] >= 1 and dice_counter[DieValue.TWO] >= 1 and dice_counter[DieValue.THREE] >= 1 and \
+                dice_counter[DieValue.HEAL] >= 1 and dice_counter[DieValue.ATTACK] >= 1 and \
+                dice_counter[DieValue.ENERGY] >= 1:
+            self.special_effect(player_that_bought_the_card, other_players)
@@ -1,10 +1,18 @@
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
+from game.dice.dice import DieValue
 
 
 class Gourmet(KeepCard):
+    triggers = (Trigger.ON_DICE_RESOLVED,)
+
     def __init__(self):
         super().__init__("Gourmet", 4,
                          "When rolling [1][1][1] or more gain 2 extra [Star].")
 
     def special_effect(self, player_that_bought_the_card, other_players):
         player_that_bought_the_card.update_victory_points_by(2)
+
+    def on_dice_resolved(self, player_that_bought_the_card, dice_counter, other_players):
+        if dice_counter[DieValue.ONE] >= 3:
+            self.special_effect(player_that_bought_the_card, other_players)
@@ -1,10 +1,18 @@
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
+from game.dice.dice import DieValue
 
 
 class Omnivore(KeepCard):
+    triggers = (Trigger.ON_DICE_RESOLVED,)
+
     def __init__(self):
         super().__init__("Omnivore", 4,
                          "When you roll at least [1][2][3], gain 2[star]. You can use these dice in other combinations.")
 
     def special_effect(self, player_that_bought_the_card, other_players):
         player_that_bought_the_card.update_victory_points_by(2)
+
+    def on_dice_resolved(self, player_that_bought_the_card, dice_counter, other_players):
+        if dice_counter[DieValue.ONE] >= 1 and dice_counter[DieValue.TWO] >= 1 and dice_counter[DieValue.THREE] >= 1:
+            self.special_effect(player_that_bought_the_card, other_players)
@@ -1,7 +1,12 @@
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
 
 
 class RootingForTheUnderdog(KeepCard):
+    triggers = (Trigger.ON_TURN_END,)
+    # counts the stars the other end of turn cards gave
+    trigger_order = 1
+
     def __init__(self):
         super().__init__("Rooting for the Underdog", 3,
                          "At the end of a turn if you have the fewest [Star] gain 1 [Star].",
@@ -12,3 +17,6 @@ class RootingForTheUnderdog(KeepCard):
             [other_player.victory_points for other_player in other_players])
         if player_that_bought_the_card.victory_points < min_victory_points:
             player_that_bought_the_card.update_victory_points_by(1)
+
+    def on_turn_end(self, player_that_bought_the_card, other_players):
+        self.special_effect(player_that_bought_the_card, other_players)
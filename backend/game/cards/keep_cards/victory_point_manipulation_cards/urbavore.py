@@ -1,8 +1,11 @@
 from game.cards.keep_card import KeepCard
+from game.cards.trigger import Trigger
 from game.values import locations
 
 
 class Urbavore(KeepCard):
+    triggers = (Trigger.ON_TURN_START, Trigger.ON_ATTACK_ROLL)
+
     def __init__(self):
         super().__init__("Urbavore", 4,
                          "Gain 1 extra [star] when beginning your turn in Tokyo. If you are in Tokyo and you roll at least one [attack] add [attack] to your roll")
@@ -16,3 +19,9 @@ class Urbavore(KeepCard):
             return attack_die_value + 1
         else:
             return attack_die_value
+
+    def on_turn_start(self, player_that_bought_the_card, other_players):
+        self.special_effect(player_that_bought_the_card, other_players)
+
+    def on_attack_roll(self, player_that_bought_the_card, attack):
+        return self.attack_dice_special_effect(player_that_bought_the_card, attack)
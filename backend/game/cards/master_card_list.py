@@ -1,3 +1,5 @@
+from game.cards.card_catalog import get_shared_card
+
 # Attack Manipulation Cards
 from game.cards.keep_cards.attack_manipulation_cards.nova_breath import NovaBreath
 from game.cards.keep_cards.attack_manipulation_cards.spiked_tail import SpikedTail
@@ -53,22 +55,23 @@ from game.cards.keep_cards.victory_point_manipulation_cards.rooting_for_the_unde
 
 def get_all_cards():
     """
-    Serves as the master list of all cards to add to the deck.
+    Serves as the master list of all cards to add to the deck. The list is new on every call, the cards in it are
+    the shared instances of the card catalog.
 
-    Create lists to reflect package structure and add individual cards to each list.
+    Create lists to reflect package structure and add individual card classes to each list.
     If a new list is created extend it onto the full_list_of_cards
     """
-    energy_manipulation_cards = [Energize()]
+    energy_manipulation_cards = [Energize]
 
-    health_manipulation_cards = [FireBlast(), HighAltitudeBombing()]
+    health_manipulation_cards = [FireBlast, HighAltitudeBombing]
 
-    multi_manipulation_cards = [GasRefinery(), JetFighters(), NationalGuard(), NuclearPowerPlant(), Tanks(),
-                                VastStorm()]
+    multi_manipulation_cards = [GasRefinery, JetFighters, NationalGuard, NuclearPowerPlant, Tanks,
+                                VastStorm]
 
-    victory_point_manipulation_cards = [ApartmentBuilding(), CommuterTrain(), CornerStore(), DropFromHighAltitude(),
-                                        EvacuationOrders(), Skyscraper()]
+    victory_point_manipulation_cards = [ApartmentBuilding, CommuterTrain, CornerStore, DropFromHighAltitude,
+                                        EvacuationOrders, Skyscraper]
 
-    turn_manipulation_cards = [Frenzy()]
+    turn_manipulation_cards = [Frenzy]
 
     discard_cards = []
     discard_cards.extend(health_manipulation_cards)
@@ -79,19 +82,19 @@ def get_all_cards():
 
     keep_cards = []
 
-    keep_attack_manipulation_cards = [NovaBreath(), SpikedTail()]
+    keep_attack_manipulation_cards = [NovaBreath, SpikedTail]
 
     keep_energy_manipulation_cards = [
-        EnergyHoarder(), FriendOfChildren(), SolarPowered(), WereOnlyMakingItStronger(), AlienMetabolism()]
+        EnergyHoarder, FriendOfChildren, SolarPowered, WereOnlyMakingItStronger, AlienMetabolism]
 
     keep_health_manipulation_cards = [
-        ItHasAChild(), EvenBigger(), Regeneration(), ArmorPlating()]
+        ItHasAChild, EvenBigger, Regeneration, ArmorPlating]
 
 
-    keep_victory_point_manipulation_cards = [AlphaMonster(),
-                                             CompleteDestruction(), DedicatedNewsTeam(), Gourmet(), Omnivore(), EaterOfTheDead()]
+    keep_victory_point_manipulation_cards = [AlphaMonster,
+                                             CompleteDestruction, DedicatedNewsTeam, Gourmet, Omnivore, EaterOfTheDead]
 
-    keep_turn_manipulation_cards = [GiantBrain()]
+    keep_turn_manipulation_cards = [GiantBrain]
 
     keep_cards = []
     keep_cards.extend(keep_attack_manipulation_cards)
@@ -104,4 +107,4 @@ def get_all_cards():
     full_list_of_cards.extend(discard_cards)
     full_list_of_cards.extend(keep_cards)
 
-    return full_list_of_cards
+    return [get_shared_card(card_class) for card_class in full_list_of_cards]
@@ -0,0 +1,52 @@
+import pickle
+
+import pytest
+
+from game.cards import card_catalog, master_card_list
+from game.cards.discard_cards.energy_manipulation_cards.energize import Energize
+from game.cards.keep_cards.energy_manipulation_cards.alien_metabolism import AlienMetabolism
+
+# names the cards were given in Play.CARD
+PLAY_CARD_NAMES = {
+    "Evacuation Orders": "Evacuation Orders (x2)",
+    "We're Only Making It Stronger": "We are Only Making It Stronger",
+}
+
+
+def test_card_ids_match_play_card_codes():
+    # the only check that needs the Django models, the rest of the catalog is plain Python
+    from game.models import Play
+    play_card_names = dict(Play.CARD)
+    for card_id, card in card_catalog.CARDS_BY_ID.items():
+        code = card_catalog.get_card_code(card)
+        assert int(code) == card_id
+        assert play_card_names[code].lower() == PLAY_CARD_NAMES.get(card.name, card.name).lower()
+
+
+def test_master_card_list_holds_shared_cards():
+    first, second = master_card_list.get_all_cards(), master_card_list.get_all_cards()
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+    assert all(card_catalog.is_shared_card(card) for card in first)
+
+
+def test_get_card_id_takes_card_or_class():
+    assert card_catalog.get_card_id(AlienMetabolism) == 2
+    assert card_catalog.get_card_id(AlienMetabolism()) == 2
+    assert card_catalog.get_card_code(Energize()) == '15'
+
+
+def test_card_type_codes():
+    assert card_catalog.get_card_type_code(AlienMetabolism()) == card_catalog.KEEP_CARD_TYPE_CODE
+    assert card_catalog.get_card_type_code(Energize()) == card_catalog.DISCARD_CARD_TYPE_CODE
+
+
+def test_unknown_card_id():
+    with pytest.raises(ValueError):
+        card_catalog.get_card(0)
+
+
+def test_shared_card_pickles_to_itself():
+    card = card_catalog.get_shared_card(Energize)
+    assert pickle.loads(pickle.dumps(card)) is card
+    assert len(pickle.dumps(card)) < len(pickle.dumps(Energize()))
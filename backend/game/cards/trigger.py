@@ -0,0 +1,25 @@
+from enum import Enum
+
+
+class Trigger(Enum):
+    """
+    Moments of a turn a KeepCard can respond to. A card lists its triggers in KeepCard.triggers and implements the
+    matching method:
+
+    ON_TURN_START     on_turn_start(player, other_players)
+    ON_HEALTH_CHANGE  on_health_change(player, change) -> change
+    ON_ENERGY_GAIN    on_energy_gain(player, energy) -> energy
+    ON_ATTACK_ROLL    on_attack_roll(player, attack) -> attack
+    ON_DICE_RESOLVED  on_dice_resolved(player, dice_counter, other_players)
+    ON_PURCHASE       on_purchase(player, card)
+    ON_TURN_END       on_turn_end(player, other_players)
+    ON_DEATH          on_death(player)
+    """
+    ON_TURN_START = 0
+    ON_HEALTH_CHANGE = 1
+    ON_ENERGY_GAIN = 2
+    ON_ATTACK_ROLL = 3
+    ON_DICE_RESOLVED = 4
+    ON_PURCHASE = 5
+    ON_TURN_END = 6
+    ON_DEATH = 7
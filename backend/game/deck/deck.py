@@ -1,14 +1,18 @@
 import random
-from typing import List
+from collections import deque
+from typing import Deque
 
 from game.cards.card import Card
 import game.cards.master_card_list as master_card_list
 
 
 class Deck:
+    """
+    A pile of cards, drawn from the top and added to at the bottom in constant time.
+    """
 
     def __init__(self):
-        self.__card_deck: List[Card] = []
+        self.__card_deck: Deque[Card] = deque()
 
     def __contains__(self, item):
         return self.__card_deck.__contains__(item)
@@ -16,14 +20,20 @@ class Deck:
     def __len__(self):
         return len(self.__card_deck)
 
+    def __iter__(self):
+        return iter(self.__card_deck)
+
     def get_new_deck(self):
-        self.__card_deck: List[Card] = master_card_list.get_all_cards()
+        self.__card_deck: Deque[Card] = deque(master_card_list.get_all_cards())
 
-    def shuffle(self):
-        random.shuffle(self.__card_deck)
+    def shuffle(self, rng=None):
+        # shuffled as a list, indexing into the middle of a deque is not constant time
+        cards = list(self.__card_deck)
+        (rng or random).shuffle(cards)
+        self.__card_deck = deque(cards)
 
     def draw_from(self):
-        return self.__card_deck.pop(0)  # take first item so appending "puts cards_old_dir on the bottom of the pile"
+        return self.__card_deck.popleft()  # take first item so appending "puts cards_old_dir on the bottom of the pile"
 
     def append(self, card: Card):
         self.__card_deck.append(card)
@@ -34,4 +44,15 @@ class Deck:
     def add_card_to_deck(self, card: Card):
         self.__card_deck.append(card)
 
+    def copy(self):
+        """A new deck holding the same cards in the same order."""
+        deck = Deck()
+        deck.__card_deck = self.__card_deck.copy()
+        return deck
+
+    def take_all_from(self, other: 'Deck'):
+        """Puts every card of other, in order, at the bottom of this deck and leaves other empty."""
+        self.__card_deck.extend(other.__card_deck)
+        other.__card_deck.clear()
+
 
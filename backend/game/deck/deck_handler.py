@@ -6,8 +6,8 @@ from game.cards.card import Card
 from game.cards.discard_card import DiscardCard
 from game.cards.discard_cards.victory_point_manipulation_cards.drop_from_high_altitude import DropFromHighAltitude
 from game.cards.keep_card import KeepCard
-from game.cards.keep_cards.victory_point_manipulation_cards.dedicated_news_team import DedicatedNewsTeam
 from game.cards.keep_cards.energy_manipulation_cards.alien_metabolism import AlienMetabolism
+from game.cards.trigger import Trigger
 from game.deck.deck import Deck
 from game.player.player import Player
 from game.values.exceptions import InsufficientFundsException, UnexpectedCardTypeException
@@ -20,18 +20,37 @@ class DeckHandler:
     Use this to purchase power cards_old_dir from the store and discard used cards_old_dir.
     creating a DeckHandler object automatically populates the draw pile from the kot_cards.json.
     The draw pile is automatically re-populated with discarded cards_old_dir upon running out.
+    Every DeckHandler has piles of its own, so any number of games can run side by side in one process.
     """
-    __draw_pile: Deck = Deck()
-    __discard_pile: Deck = Deck()
-    __card_store: List[Card] = list()
 
-    def __init__(self):
-        self.store.clear()
-        self.discard_pile.clear()
+    def __init__(self, rng=None):
+        self.__init_empty_piles(rng)
         self.__draw_pile.get_new_deck()
-        self.__draw_pile.shuffle()
+        self.__draw_pile.shuffle(self.rng)
         self.__fill_card_store()
 
+    @classmethod
+    def with_empty_piles(cls, rng=None):
+        """A DeckHandler without any card, for callers that fill the piles themselves."""
+        deck_handler = cls.__new__(cls)
+        deck_handler.__init_empty_piles(rng)
+        return deck_handler
+
+    def clone(self, rng=None):
+        """A DeckHandler with copies of these piles, drawing from rng. Cards are shared, they hold no state."""
+        deck_handler = DeckHandler.with_empty_piles(rng)
+        deck_handler.__draw_pile = self.__draw_pile.copy()
+        deck_handler.__discard_pile = self.__discard_pile.copy()
+        deck_handler.__card_store = self.__card_store.copy()
+        return deck_handler
+
+    def __init_empty_piles(self, rng):
+        # the game's random.Random, the global one when there is none
+        self.rng = rng
+        self.__draw_pile: Deck = Deck()
+        self.__discard_pile: Deck = Deck()
+        self.__card_store: List[Card] = list()
+
     def __len__(self):
         return len(self.draw_pile) + len(self.store) + len(self.discard_pile)
 
@@ -67,22 +86,20 @@ class DeckHandler:
             self.get_top_draw_pile_card()
 
     def shuffle_discard_pile_to_draw_pile(self):
-        self.__discard_pile.shuffle()
-        while len(self.discard_pile) > 0:
-            self.__draw_pile.append(self.discard_pile.draw_from())
-        self.__discard_pile.clear()
+        self.__discard_pile.shuffle(self.rng)
+        self.__draw_pile.take_all_from(self.__discard_pile)
 
     def buy_card_from_store(self, index, purchasing_player: Player, other_players):
         card_to_buy: Card = self.__card_store[index]
         card_cost = card_to_buy.cost
-        if purchasing_player.has_instance_of_card(AlienMetabolism()):
+        if purchasing_player.has_instance_of_card(AlienMetabolism):
             card_cost = card_to_buy.cost - 1
         if purchasing_player.energy < card_cost:
             raise InsufficientFundsException(constants.INSUFFICIENT_FUNDS_MSG)
         else:
             purchasing_player.update_energy_by(-card_cost)
-            if purchasing_player.has_instance_of_card(DedicatedNewsTeam()):
-                DedicatedNewsTeam().special_effect(purchasing_player, None)
+            for card in purchasing_player.card_hooks[Trigger.ON_PURCHASE]:
+                card.on_purchase(purchasing_player, card_to_buy)
             if isinstance(card_to_buy, DiscardCard):
                 print("{} is a discard card".format(card_to_buy.name))
 
@@ -109,7 +126,7 @@ class DeckHandler:
 
     def sweep_store(self, player_invoking_sweep: Player):
         if player_invoking_sweep.energy < constants.SWEEP_CARD_STORE_COST:
-            raise Exception(constants.INSUFFICIENT_FUNDS_TO_SWEEP_MSG)
+            raise InsufficientFundsException(constants.INSUFFICIENT_FUNDS_TO_SWEEP_MSG)
         else:
             player_invoking_sweep.update_energy_by(
                 -constants.SWEEP_CARD_STORE_COST)
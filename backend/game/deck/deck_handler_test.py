@@ -1,4 +1,6 @@
 import itertools
+import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import pytest
@@ -8,6 +10,7 @@ from game.cards.card import Card
 from game.cards.discard_cards.health_manipulation_cards.heal import Heal
 from game.cards.keep_cards.health_manipulation_cards.even_bigger import EvenBigger
 from game.deck.deck_handler import DeckHandler
+from game.engine.game_random import GameRandom
 from game.player.player import Player
 
 NUMBER_OF_CARDS_IN_GAME = 10
@@ -181,3 +184,63 @@ def test_sweep_store_costs_energy(deck_handler):
 def test_store_refills_after_sweep(deck_handler):
     test_sweep_store_costs_energy(deck_handler)
     assert len(deck_handler.store) == constants.CARD_STORE_SIZE_LIMITER
+
+
+GAMES_IN_PROCESS = 20
+TURNS_PER_GAME = 12
+
+
+def new_game_deck(seed):
+    # a deck handler, the player using it and the choices that player makes
+    return DeckHandler(GameRandom(seed)), Player("player_{}".format(seed)), random.Random(seed)
+
+
+def play_deck_turn(deck_handler, player, choices):
+    player.energy = 100
+    if choices.random() < .25:
+        deck_handler.sweep_store(player)
+    else:
+        deck_handler.buy_card_from_store(choices.randrange(constants.CARD_STORE_SIZE_LIMITER), player, [])
+
+
+def deck_state(deck_handler, player):
+    return [card.name for card in itertools.chain(deck_handler.draw_pile, deck_handler.store,
+                                                  deck_handler.discard_pile, player.cards)]
+
+
+def play_deck_game_alone(seed):
+    deck_handler, player, choices = new_game_deck(seed)
+    for _ in range(TURNS_PER_GAME):
+        play_deck_turn(deck_handler, player, choices)
+    return deck_state(deck_handler, player)
+
+
+def test_deck_handlers_do_not_share_piles():
+    first, second = DeckHandler(), DeckHandler()
+    assert first.store is not second.store
+    assert first.draw_pile is not second.draw_pile
+    assert first.discard_pile is not second.discard_pile
+
+    first.discard(first.store.pop())
+    assert len(second.discard_pile) == 0
+    assert len(second.store) == constants.CARD_STORE_SIZE_LIMITER
+
+
+def test_many_games_in_one_process_stay_isolated():
+    expected = [play_deck_game_alone(seed) for seed in range(GAMES_IN_PROCESS)]
+
+    games = [new_game_deck(seed) for seed in range(GAMES_IN_PROCESS)]
+    for _ in range(TURNS_PER_GAME):
+        for game in games:
+            play_deck_turn(*game)
+
+    assert [deck_state(deck_handler, player) for deck_handler, player, _ in games] == expected
+    for deck_handler, player, _ in games:
+        assert len(deck_handler) + len(player.cards) == len(expected[0])
+
+
+def test_many_games_on_threads_stay_isolated():
+    expected = [play_deck_game_alone(seed) for seed in range(GAMES_IN_PROCESS)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(play_deck_game_alone, range(GAMES_IN_PROCESS))) == expected
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from game.deck.deck import Deck
@@ -25,3 +27,27 @@ def test_draw_card(deck):
     card = deck.draw_from()
     assert not deck.__contains__(card)
     assert len(deck) == original_deck_size - 1
+
+
+def test_draw_takes_cards_from_the_top(deck):
+    deck.get_new_deck()
+    cards = list(deck)
+    assert [deck.draw_from() for _ in range(3)] == cards[:3]
+
+
+def test_take_all_from_keeps_order(deck):
+    other = Deck()
+    other.get_new_deck()
+    cards = list(other)
+    deck.get_new_deck()
+    deck.take_all_from(other)
+    assert len(other) == 0
+    assert list(deck)[-len(cards):] == cards
+
+
+def test_shuffle_matches_list_shuffle(deck):
+    deck.get_new_deck()
+    cards = list(deck)
+    random.Random(5).shuffle(cards)
+    deck.shuffle(random.Random(5))
+    assert list(deck) == cards
@@ -14,9 +14,13 @@ class DieValue(Enum):
         return dict(die_val=self.name)
 
 
-def roll() -> str:
-    return random.choice(list(DieValue))
+DIE_VALUES = list(DieValue)
 
 
-def roll_many(num: int) -> [str]:
-    return [roll() for _ in range(num)]
+def roll(rng=None) -> str:
+    # rng is the game's random.Random, the global one when there is none
+    return (rng or random).choice(DIE_VALUES)
+
+
+def roll_many(num: int, rng=None) -> [str]:
+    return [roll(rng) for _ in range(num)]
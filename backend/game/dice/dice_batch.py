@@ -0,0 +1,69 @@
+"""
+Dice rolled and resolved for many games at once with NumPy, for Monte Carlo evaluation of AI decisions.
+
+A batch is an integer array with one row per game and one column per die, holding DieValue values. Face counts have a
+column per DieValue value (column 0 is unused) so counts[:, DieValue.ATTACK.value] is the attack of every row.
+Resolution matches the scalar dice_resolver.calculate_*_from_dice functions row for row.
+
+Nothing in the game calls it yet: the AI players read the exact re-roll tables (re_roll_table.py), and SimulationGame
+has to draw from a Random the way run_game does to replay its games.
+"""
+
+from collections import namedtuple
+
+import numpy
+
+from game.dice.dice import DieValue
+from game.values import constants
+
+DIE_FACE_COUNT = len(DieValue)
+FACE_COLUMNS = DIE_FACE_COUNT + 1
+VICTORY_DIE_VALUES = (DieValue.ONE.value, DieValue.TWO.value, DieValue.THREE.value)
+DICE_DTYPE = numpy.int8
+
+DiceBatchResult = namedtuple('DiceBatchResult', ['counts', 'victory_points', 'energy', 'heal', 'attack'])
+
+
+def get_batch_rng(seed=None):
+    """A numpy.random.Generator, seed can be an int, None or a Generator to use as is."""
+    return numpy.random.default_rng(seed)
+
+
+def roll_batch(games, dice_count=constants.DEFAULT_DICE_TO_ROLL, rng=None):
+    return get_batch_rng(rng).integers(1, FACE_COLUMNS, size=(games, dice_count), dtype=DICE_DTYPE)
+
+
+def re_roll_batch(dice, re_roll_mask, rng=None):
+    """Re-rolls in place the dice where re_roll_mask, a boolean array shaped like dice, is True."""
+    dice[re_roll_mask] = get_batch_rng(rng).integers(1, FACE_COLUMNS, size=int(re_roll_mask.sum()), dtype=DICE_DTYPE)
+    return dice
+
+
+def count_faces(dice):
+    games = dice.shape[0]
+    # offset every row into its own range of FACE_COLUMNS bins so one bincount counts all rows
+    offsets = numpy.arange(games, dtype=numpy.int64)[:, None] * FACE_COLUMNS
+    counts = numpy.bincount((dice + offsets).ravel(), minlength=games * FACE_COLUMNS)
+    return counts.reshape(games, FACE_COLUMNS)
+
+
+def calculate_victory_points_from_counts(counts):
+    victory_points = numpy.zeros(counts.shape[0], dtype=counts.dtype)
+    for die_value in VICTORY_DIE_VALUES:
+        die_count = counts[:, die_value]
+        victory_points += numpy.where(die_count >= 3, die_value + die_count - 3, 0)
+    return victory_points
+
+
+def resolve_batch(dice):
+    counts = count_faces(dice)
+    return DiceBatchResult(counts=counts,
+                           victory_points=calculate_victory_points_from_counts(counts),
+                           energy=counts[:, DieValue.ENERGY.value],
+                           heal=counts[:, DieValue.HEAL.value],
+                           attack=counts[:, DieValue.ATTACK.value])
+
+
+def dice_values_to_batch(dice_values):
+    """Turns lists of DieValue, one per game, into a batch."""
+    return numpy.array([[die.value for die in dice] for dice in dice_values], dtype=DICE_DTYPE)
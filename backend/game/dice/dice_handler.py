@@ -2,12 +2,19 @@ import game.dice.dice as dice
 
 
 class DiceHandler:
-    def __init__(self):
+    def __init__(self, rng=None):
         self.dice_values = []
         self.re_rolls_left = 0
+        self.rng = rng
+
+    def clone(self, rng=None):
+        dice_handler = DiceHandler(rng)
+        dice_handler.dice_values = self.dice_values.copy()
+        dice_handler.re_rolls_left = self.re_rolls_left
+        return dice_handler
 
     def roll_initial(self, starting_dice_count, re_roll_count):
-        self.dice_values = dice.roll_many(starting_dice_count)
+        self.dice_values = dice.roll_many(starting_dice_count, self.rng)
         self.re_rolls_left = re_roll_count
 
     def re_roll_dice(self, indexes_of_dice_to_re_roll):
@@ -22,7 +29,7 @@ class DiceHandler:
 
         for i in indexes_of_dice_to_re_roll:
             try:
-                temp_values[i] = dice.roll()
+                temp_values[i] = dice.roll(self.rng)
             except IndexError:
                 invalid_indexes.append(i)
 
@@ -36,7 +43,7 @@ class DiceHandler:
 
     def add_bonus_die(self, count_to_add=1):
         for _ in range(count_to_add):
-            self.dice_values.append(dice.roll())
+            self.dice_values.append(dice.roll(self.rng))
 
     def serialize_kot_obj(self):
         return dict(
@@ -1,15 +1,10 @@
 import collections
 
+from game.cards.trigger import Trigger
 from game.dice.dice import DieValue
 from game.turn_actions.attack import get_attackable_players, attack_players
 from game.turn_actions.player_movement import move_to_tokyo_if_empty
 from game.turn_actions.heal import heal_self_from_dice
-from game.cards.keep_cards.attack_manipulation_cards.spiked_tail import SpikedTail
-from game.cards.keep_cards.victory_point_manipulation_cards.alpha_monster import AlphaMonster
-from game.cards.keep_cards.victory_point_manipulation_cards.complete_destruction import CompleteDestruction
-from game.cards.keep_cards.victory_point_manipulation_cards.urbavore import Urbavore
-from game.cards.keep_cards.victory_point_manipulation_cards.gourmet import Gourmet
-from game.cards.keep_cards.victory_point_manipulation_cards.omnivore import Omnivore
 
 
 def get_dice_count(dice):
@@ -41,10 +36,8 @@ def calculate_heal_from_dice(dice_counter):
 
 def resolve_attack_dice(dice_counter, attacking_player, other_players):
     attack = calculate_attack_from_dice(dice_counter)
-    if attacking_player.has_instance_of_card(Urbavore()):
-        attack = Urbavore.attack_dice_special_effect(attacking_player, attack)
-    if attacking_player.has_instance_of_card(SpikedTail()):
-        attack = SpikedTail().attack_dice_special_effect(attacking_player, attack)
+    for card in attacking_player.card_hooks[Trigger.ON_ATTACK_ROLL]:
+        attack = card.on_attack_roll(attacking_player, attack)
     attackable_players = get_attackable_players(
         attacking_player, other_players)
     attack_players(attacking_player, attackable_players, attack)
@@ -65,16 +58,8 @@ def resolve_all_other_dice(dice_counter, player):
 
 
 def card_based_dice_actions(dice_counter, player, other_players):
-    if dice_counter[DieValue.ONE] >= 3 and player.has_instance_of_card(Gourmet()):
-        Gourmet().special_effect(player, other_players)
-    if dice_counter[DieValue.ONE] >= 1 and dice_counter[DieValue.TWO] >= 1 and dice_counter[DieValue.THREE] >= 1 and player.has_instance_of_card(Omnivore()):
-        Omnivore().special_effect(player, other_players)
-    if dice_counter[DieValue.ONE] >= 1 and dice_counter[DieValue.TWO] >= 1 and dice_counter[DieValue.THREE] >= 1 and \
-            dice_counter[DieValue.HEAL] >= 1 and dice_counter[DieValue.ATTACK] >= 1 and dice_counter[DieValue.ENERGY] >= 1 and \
-            player.has_instance_of_card(CompleteDestruction()):
-        CompleteDestruction().special_effect(player, other_players)
-    if dice_counter[DieValue.ATTACK] >= 1 and player.has_instance_of_card(AlphaMonster()):
-        AlphaMonster().special_effect(player, other_players)
+    for card in player.card_hooks[Trigger.ON_DICE_RESOLVED]:
+        card.on_dice_resolved(player, dice_counter, other_players)
 
 
 def dice_resolution(dice, player, other_players):
@@ -0,0 +1,211 @@
+"""
+Exact re-roll decisions for the AI players.
+
+Dice are handled as face counts: a tuple with how many dice show each DieValue, in DieValue order. For a number of
+dice and an objective (what a star, attack, energy and heal are worth to the player) a ReRollTable holds
+
+    the expected objective value of keeping any multiset of dice with any number of re-rolls left, when every
+    later re-roll is played the best way, and
+    the best dice to keep for every roll,
+
+computed exactly from the multinomial distribution of the dice that are rolled again. An AI decision is then one
+dictionary lookup. Tables are built once per process and can be saved to a directory, so processes that start
+often (tournament workers) load them instead.
+"""
+
+import math
+import os
+import pickle
+from collections import namedtuple
+from functools import lru_cache
+
+from game.dice.dice import DieValue
+from game.values import constants
+
+FACE_VALUES = tuple(die.value for die in DieValue)
+FACE_COUNT = len(FACE_VALUES)
+VICTORY_FACES = ((0, DieValue.ONE.value), (1, DieValue.TWO.value), (2, DieValue.THREE.value))
+ATTACK_FACE = FACE_VALUES.index(DieValue.ATTACK.value)
+HEAL_FACE = FACE_VALUES.index(DieValue.HEAL.value)
+ENERGY_FACE = FACE_VALUES.index(DieValue.ENERGY.value)
+
+# ties are broken towards keeping more dice, the only way two exact expectations can differ by this much
+TIE_TOLERANCE = 1e-9
+
+# directory tables are saved to and loaded from when it is set
+TABLE_DIRECTORY = os.environ.get("KOT_RE_ROLL_TABLE_DIR")
+
+ReRollObjective = namedtuple('ReRollObjective', ['stars', 'attack', 'energy', 'heal'])
+STARS_OBJECTIVE = ReRollObjective(stars=1, attack=0, energy=0, heal=0)
+ATTACK_OBJECTIVE = ReRollObjective(stars=0, attack=1, energy=0, heal=0)
+ENERGY_OBJECTIVE = ReRollObjective(stars=0, attack=0, energy=1, heal=0)
+
+
+@lru_cache(maxsize=None)
+def face_count_multisets(dice_count):
+    """Every face count tuple of dice_count dice."""
+    if dice_count == 0:
+        return ((0,) * FACE_COUNT,)
+    multisets = []
+    for first in range(dice_count, -1, -1):
+        multisets.extend((first,) + rest for rest in _multisets_of(dice_count - first, FACE_COUNT - 1))
+    return tuple(multisets)
+
+
+@lru_cache(maxsize=None)
+def _multisets_of(dice_count, faces):
+    if faces == 1:
+        return ((dice_count,),)
+    return tuple((first,) + rest for first in range(dice_count, -1, -1)
+                 for rest in _multisets_of(dice_count - first, faces - 1))
+
+
+@lru_cache(maxsize=None)
+def roll_outcomes(dice_count):
+    """The exact distribution of rolling dice_count dice, as (face counts, probability) pairs."""
+    total = FACE_COUNT ** dice_count
+    outcomes = []
+    for counts in face_count_multisets(dice_count):
+        ways = math.factorial(dice_count)
+        for count in counts:
+            ways //= math.factorial(count)
+        outcomes.append((counts, ways / total))
+    return tuple(outcomes)
+
+
+def face_counts(face_values):
+    counts = [0] * FACE_COUNT
+    for value in face_values:
+        counts[value - 1] += 1
+    return tuple(counts)
+
+
+def re_roll_indexes(face_values, kept):
+    """Indexes of the dice to re-roll to keep the face counts kept, keeping the first dice of each face."""
+    keep = list(kept)
+    re_roll = []
+    for i, value in enumerate(face_values):
+        if keep[value - 1]:
+            keep[value - 1] -= 1
+        else:
+            re_roll.append(i)
+    return re_roll
+
+
+def sub_multisets(counts):
+    """Every multiset of dice that can be kept from face counts, keeping everything first."""
+    subsets = [()]
+    for count in counts:
+        subsets = [subset + (kept,) for subset in subsets for kept in range(count, -1, -1)]
+    return subsets
+
+
+def score(counts, objective):
+    """Value of final dice under an objective, the same star rules as dice_resolver."""
+    stars = 0
+    for face, value in VICTORY_FACES:
+        if counts[face] >= 3:
+            stars += value + counts[face] - 3
+    return (objective.stars * stars + objective.attack * counts[ATTACK_FACE] +
+            objective.energy * counts[ENERGY_FACE] + objective.heal * counts[HEAL_FACE])
+
+
+class ReRollTable:
+    def __init__(self, objective, dice_count=constants.DEFAULT_DICE_TO_ROLL,
+                 re_rolls=constants.DEFAULT_RE_ROLL_COUNT):
+        self.objective = ReRollObjective(*objective)
+        self.dice_count = dice_count
+        self.re_rolls = re_rolls
+        # keep_values[r][kept] is the expected value of keeping kept and rolling the rest with r re-rolls left
+        self.keep_values = {}
+        # best_keeps[r][counts] is the multiset to keep from counts with r re-rolls left
+        self.best_keeps = {}
+        self._build()
+
+    def _build(self):
+        rolls = face_count_multisets(self.dice_count)
+        values = {counts: score(counts, self.objective) for counts in rolls}
+        for re_rolls_left in range(1, self.re_rolls + 1):
+            keep_values = {}
+            for kept_dice in range(self.dice_count + 1):
+                outcomes = roll_outcomes(self.dice_count - kept_dice)
+                for kept in face_count_multisets(kept_dice):
+                    expected = 0.0
+                    for rolled, probability in outcomes:
+                        expected += probability * values[tuple(k + r for k, r in zip(kept, rolled))]
+                    keep_values[kept] = expected
+
+            best_keeps = {}
+            next_values = {}
+            for counts in rolls:
+                best_kept, best_value = None, None
+                for kept in sub_multisets(counts):
+                    value = keep_values[kept]
+                    if best_value is None or value > best_value + TIE_TOLERANCE:
+                        best_kept, best_value = kept, value
+                best_keeps[counts] = best_kept
+                next_values[counts] = best_value
+            self.keep_values[re_rolls_left] = keep_values
+            self.best_keeps[re_rolls_left] = best_keeps
+            values = next_values
+
+    def expected_value(self, counts, re_rolls_left):
+        """Expected final value of a roll with re_rolls_left re-rolls to play."""
+        if re_rolls_left == 0:
+            return score(counts, self.objective)
+        return self.keep_values[re_rolls_left][self.best_keeps[re_rolls_left][counts]]
+
+    def best_keep(self, counts, re_rolls_left):
+        return self.best_keeps[re_rolls_left][counts]
+
+    def dice_to_re_roll(self, face_values, re_rolls_left):
+        """Indexes of the dice to re-roll from face values (DieValue values)."""
+        if re_rolls_left <= 0:
+            return []
+        best_keeps = self.best_keeps[min(re_rolls_left, self.re_rolls)]
+        return re_roll_indexes(face_values, best_keeps[face_counts(face_values)])
+
+    def save(self, directory):
+        path = _table_path(directory, self.objective, self.dice_count, self.re_rolls)
+        temporary_path = path + '.tmp'
+        with open(temporary_path, 'wb') as table_file:
+            pickle.dump(self, table_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
+
+
+_tables = {}
+
+
+def get_re_roll_table(objective, dice_count=constants.DEFAULT_DICE_TO_ROLL, re_rolls=constants.DEFAULT_RE_ROLL_COUNT,
+                      directory=None):
+    """
+    The table for an objective, built once per process. With a directory (TABLE_DIRECTORY by default) a table saved
+    there is loaded instead of built, and a table that had to be built is saved there.
+    """
+    key = (ReRollObjective(*objective), dice_count, re_rolls)
+    table = _tables.get(key)
+    if table is not None:
+        return table
+
+    directory = directory or TABLE_DIRECTORY
+    table = _load_table(key, directory) if directory else None
+    if table is None:
+        table = ReRollTable(*key)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            table.save(directory)
+    _tables[key] = table
+    return table
+
+
+def _table_path(directory, objective, dice_count, re_rolls):
+    return os.path.join(directory, "re_roll_{}_dice_{}_re_rolls_{}.pickle".format(
+        dice_count, re_rolls, "_".join(str(weight) for weight in objective)))
+
+
+def _load_table(key, directory):
+    path = _table_path(directory, *key)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as table_file:
+        return pickle.load(table_file)
@@ -0,0 +1,47 @@
+import collections
+
+import numpy
+
+import game.dice.dice_batch as dice_batch
+import game.dice.dice_resolver as dice_resolver
+from game.dice.dice import DieValue
+
+
+def test_roll_batch_shape_and_faces():
+    dice = dice_batch.roll_batch(1000, 8, rng=1)
+    assert dice.shape == (1000, 8)
+    assert set(numpy.unique(dice)) == {die.value for die in DieValue}
+
+
+def test_roll_batch_same_seed_same_dice():
+    assert numpy.array_equal(dice_batch.roll_batch(50, rng=7), dice_batch.roll_batch(50, rng=7))
+
+
+def test_count_faces():
+    dice = dice_batch.dice_values_to_batch([[DieValue.ONE, DieValue.ONE, DieValue.ATTACK],
+                                            [DieValue.ENERGY, DieValue.ENERGY, DieValue.ENERGY]])
+    counts = dice_batch.count_faces(dice)
+    assert counts[0, DieValue.ONE.value] == 2 and counts[0, DieValue.ATTACK.value] == 1
+    assert counts[1, DieValue.ENERGY.value] == 3
+    assert counts.sum(axis=1).tolist() == [3, 3]
+
+
+def test_batch_resolution_matches_scalar_resolution():
+    dice = dice_batch.roll_batch(2000, rng=3)
+    result = dice_batch.resolve_batch(dice)
+    for row, values in enumerate(dice.tolist()):
+        dice_counter = collections.Counter(DieValue(value) for value in values)
+        assert result.victory_points[row] == dice_resolver.calculate_victory_points_from_dice(dice_counter)
+        assert result.energy[row] == dice_resolver.calculate_energy_from_dice(dice_counter)
+        assert result.heal[row] == dice_resolver.calculate_heal_from_dice(dice_counter)
+        assert result.attack[row] == dice_resolver.calculate_attack_from_dice(dice_counter)
+
+
+def test_re_roll_batch_only_changes_masked_dice():
+    dice = dice_batch.roll_batch(500, rng=4)
+    original = dice.copy()
+    mask = numpy.zeros(dice.shape, dtype=bool)
+    mask[:, :2] = True
+    dice_batch.re_roll_batch(dice, mask, rng=5)
+    assert numpy.array_equal(dice[:, 2:], original[:, 2:])
+    assert not numpy.array_equal(dice[:, :2], original[:, :2])
@@ -0,0 +1,59 @@
+import itertools
+import math
+
+import game.dice.re_roll_table as re_roll_table
+from game.dice.dice import DieValue
+from game.dice.re_roll_table import ATTACK_OBJECTIVE, STARS_OBJECTIVE, ReRollTable, face_counts
+
+
+def test_roll_outcomes_are_a_distribution():
+    for dice_count in (6, 7, 8):
+        outcomes = re_roll_table.roll_outcomes(dice_count)
+        assert len(outcomes) == math.comb(dice_count + 5, 5)
+        assert abs(sum(probability for _, probability in outcomes) - 1) < 1e-12
+
+
+def test_attack_expectation_is_exact():
+    # every die gets three tries at an attack
+    table = ReRollTable(ATTACK_OBJECTIVE, 6)
+    expected = sum(probability * table.expected_value(counts, 2) for counts, probability in
+                   re_roll_table.roll_outcomes(6))
+    assert abs(expected - 6 * (1 - (5 / 6) ** 3)) < 1e-12
+
+
+def test_best_keep_matches_brute_force():
+    table = ReRollTable(STARS_OBJECTIVE, 3, re_rolls=1)
+    faces = [die.value for die in DieValue]
+    for roll in itertools.product(faces, repeat=3):
+        best = 0
+        for keep_mask in itertools.product([True, False], repeat=3):
+            kept = [value for value, keep in zip(roll, keep_mask) if keep]
+            outcomes = list(itertools.product(faces, repeat=3 - len(kept)))
+            expected = sum(re_roll_table.score(face_counts(kept + list(rolled)), STARS_OBJECTIVE)
+                           for rolled in outcomes) / len(outcomes)
+            best = max(best, expected)
+        assert abs(table.expected_value(face_counts(roll), 1) - best) < 1e-12
+
+
+def test_dice_to_re_roll_for_attack():
+    table = ReRollTable(ATTACK_OBJECTIVE, 6)
+    dice = [DieValue.ATTACK.value, 1, DieValue.ATTACK.value, 2, DieValue.ENERGY.value, DieValue.HEAL.value]
+    assert table.dice_to_re_roll(dice, 2) == [1, 3, 4, 5]
+
+
+def test_keeps_a_triple_for_stars():
+    table = ReRollTable(STARS_OBJECTIVE, 6)
+    assert table.dice_to_re_roll([3, 3, 3, 1, 4, 5], 1) == [3, 4, 5]
+    assert table.dice_to_re_roll([3, 3, 3, 1, 4, 5], 0) == []
+
+
+def test_tables_are_saved_and_loaded(tmp_path, monkeypatch):
+    monkeypatch.setattr(re_roll_table, "_tables", {})
+    built = re_roll_table.get_re_roll_table(STARS_OBJECTIVE, 7, directory=str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 1
+
+    monkeypatch.setattr(re_roll_table, "_tables", {})
+    loaded = re_roll_table.get_re_roll_table(STARS_OBJECTIVE, 7, directory=str(tmp_path))
+    assert loaded is not built
+    assert loaded.best_keeps == built.best_keeps
+    assert re_roll_table.get_re_roll_table(STARS_OBJECTIVE, 7) is loaded
@@ -1,26 +1,57 @@
 import game.values.constants as constants
-from game.cards.keep_cards.energy_manipulation_cards.energy_hoarder import EnergyHoarder
-from game.cards.keep_cards.energy_manipulation_cards.solar_powered import SolarPowered
-from game.cards.keep_cards.victory_point_manipulation_cards.urbavore import Urbavore
-from game.cards.keep_cards.victory_point_manipulation_cards.rooting_for_the_underdog import RootingForTheUnderdog
+from game.cards.trigger import Trigger
 from game.deck.deck_handler import DeckHandler
 from game.dice.dice_handler import DiceHandler
+from game.engine.board_clone import clone_board
+from game.engine.game_random import GameRandom
 from game.engine.player_queue import GamePlayers
+from game.engine.snapshot import board_to_bytes, board_from_bytes
+from game.engine.turn import apply_action
 from game.turn_actions.player_movement import yield_tokyo
 from game.values.status import Status
+from game.values.turn_phase import TurnPhase
 
 
 class BoardGame:
+    # called with every turn action played on the board once it is applied and the number of words the game's
+    # GameRandom had drawn before it, see apply
+    action_listener = None
 
-    def __init__(self):
+    def __init__(self, seed=None):
+        # dice, deck and AI players all draw from the game's own generator, see seed
+        self.rng = GameRandom(seed)
         self.players = GamePlayers()
         self.status = Status.SETUP
         self.winner = None
-        self.deck_handler = DeckHandler()
-        self.dice_handler = DiceHandler()
+        self.turn_phase = TurnPhase.ROLL
+        self.deck_handler = DeckHandler(self.rng)
+        self.dice_handler = DiceHandler(self.rng)
+
+    @property
+    def seed(self):
+        return self.rng.initial_seed
+
+    def to_bytes(self):
+        return board_to_bytes(self)
+
+    @classmethod
+    def from_bytes(cls, data):
+        return board_from_bytes(data, cls)
+
+    def clone(self, rng=None):
+        return clone_board(self, rng)
+
+    def apply(self, action):
+        """Plays a turn action (see game/engine/turn.py) and returns its result."""
+        words_drawn = self.rng.words_drawn
+        result = apply_action(self, action)
+        if self.action_listener is not None:
+            self.action_listener(action, words_drawn)
+        return result
 
     def add_player(self, player):
         self.players.add_player_to_game(player)
+        player.attach_to_board(self)
 
     def start_game(self):
         self.players.set_player_order()
@@ -40,32 +71,28 @@ class BoardGame:
 
     def end_game(self):
         self.status = Status.COMPLETED
+        self.turn_phase = TurnPhase.GAME_OVER
 
-    def start_turn_actions(self, active_player):
-        player_dice_count = constants.DEFAULT_DICE_TO_ROLL
+    def start_turn_actions(self, active_player, player_dice_count=constants.DEFAULT_DICE_TO_ROLL):
         player_re_roll_count = constants.DEFAULT_RE_ROLL_COUNT
         if active_player != self.players.get_current_player():
             raise Exception("It is not %s's turn" % (id(active_player)))
-        # TODO, refactor to other method
-        if active_player.has_instance_of_card(Urbavore()):
-            Urbavore.special_effect(
-                active_player, self.players.get_all_alive_players_minus_current_player())
+        hooks = active_player.card_hooks[Trigger.ON_TURN_START]
+        if hooks:
+            other_players = self.players.get_all_alive_players_minus_current_player()
+            for card in hooks:
+                card.on_turn_start(active_player, other_players)
         self.dice_handler.roll_initial(player_dice_count, player_re_roll_count)
 
     def re_roll(self, indexes_to_re_roll):
         self.dice_handler.re_roll_dice(indexes_to_re_roll)
 
     def post_roll_actions(self, active_player):
-        # TODO, refactor to other method
-        if active_player.has_instance_of_card(EnergyHoarder()):
-            EnergyHoarder().special_effect(
-                active_player, self.players.get_all_alive_players_minus_current_player())
-        if active_player.has_instance_of_card(SolarPowered()):
-            SolarPowered().special_effect(
-                active_player, self.players.get_all_alive_players_minus_current_player())
-        if active_player.has_instance_of_card(RootingForTheUnderdog()):
-            RootingForTheUnderdog().special_effect(
-                active_player, self.players.get_all_alive_players_minus_current_player())
+        hooks = active_player.card_hooks[Trigger.ON_TURN_END]
+        if hooks:
+            other_players = self.players.get_all_alive_players_minus_current_player()
+            for card in hooks:
+                card.on_turn_end(active_player, other_players)
 
         self.check_if_winner(active_player)
 
@@ -0,0 +1,112 @@
+"""
+Compact encodings for an append-only log of the changes made to a BoardGame.
+
+An event records the turn actions (game/engine/turn.py) a command played and the change it made to the board as a
+delta between the board's snapshots (game/engine/snapshot.py) before and after. Deltas are replayed on top of the
+latest full snapshot to recover a board, actions are kept for replays and analytics. Deltas cover every change,
+including the ones made outside of turn actions such as players joining or the game starting.
+
+Layout (little endian) of encoded actions:
+
+    count:B { type:B username:str arguments }
+
+with arguments RerollAction dice:B { index:B }, BuyAction store_index:B, YieldAction leave_tokyo:B and nothing for
+the other actions. str is a length prefixed utf-8 string.
+
+A delta is the list of runs of the old snapshot to replace, in order:
+
+    { offset:H removed:H inserted:H bytes }
+
+offsets being in the old snapshot. Runs are found with difflib and the ones less than a run header apart are merged.
+"""
+
+import difflib
+import struct
+
+from game.engine.turn import RollAction, RerollAction, ResolveAction, BuyAction, SweepAction, YieldAction, \
+    EndTurnAction
+
+ACTION_TYPES = [RollAction, RerollAction, ResolveAction, BuyAction, SweepAction, YieldAction, EndTurnAction]
+ACTION_CODES = {action_type: code for code, action_type in enumerate(ACTION_TYPES)}
+
+RUN_HEADER = struct.Struct("<HHH")
+
+
+def encode_actions(actions):
+    buffer = bytearray(struct.pack("<B", len(actions)))
+    for action in actions:
+        username = action.username.encode("utf-8")
+        buffer += struct.pack("<BH", ACTION_CODES[type(action)], len(username)) + username
+        if isinstance(action, RerollAction):
+            buffer += struct.pack("<B", len(action.dice_indexes)) + bytes(action.dice_indexes)
+        elif isinstance(action, BuyAction):
+            buffer += struct.pack("<B", action.store_index)
+        elif isinstance(action, YieldAction):
+            buffer += struct.pack("<B", action.leave_tokyo)
+    return bytes(buffer)
+
+
+def decode_actions(data):
+    data = bytes(data)
+    actions = []
+    offset = 1
+    for _ in range(data[0] if data else 0):
+        code, length = struct.unpack_from("<BH", data, offset)
+        offset += 3
+        username = data[offset:offset + length].decode("utf-8")
+        offset += length
+        action_type = ACTION_TYPES[code]
+        if action_type is RerollAction:
+            count = data[offset]
+            actions.append(RerollAction(username, list(data[offset + 1:offset + 1 + count])))
+            offset += 1 + count
+        elif action_type is BuyAction:
+            actions.append(BuyAction(username, data[offset]))
+            offset += 1
+        elif action_type is YieldAction:
+            actions.append(YieldAction(username, bool(data[offset])))
+            offset += 1
+        else:
+            actions.append(action_type(username))
+    return actions
+
+
+def snapshot_delta(old, new):
+    """Returns the delta turning snapshot old into snapshot new, b"" when they are equal."""
+    if old == new:
+        return b""
+    runs = []
+    for tag, old_start, old_end, new_start, new_end in difflib.SequenceMatcher(None, old, new, False).get_opcodes():
+        if tag == "equal":
+            continue
+        if runs and old_start - runs[-1][1] < RUN_HEADER.size:
+            # cheaper to rewrite the few equal bytes in between than to start a run
+            runs[-1][1], runs[-1][3] = old_end, new_end
+        else:
+            runs.append([old_start, old_end, new_start, new_end])
+    delta = bytearray()
+    for old_start, old_end, new_start, new_end in runs:
+        delta += RUN_HEADER.pack(old_start, old_end - old_start, new_end - new_start) + new[new_start:new_end]
+    return bytes(delta)
+
+
+def apply_snapshot_delta(old, delta):
+    """Returns snapshot old with delta (see snapshot_delta) applied."""
+    old = bytes(old)
+    delta = bytes(delta)
+    new = bytearray()
+    copied = offset = 0
+    while offset < len(delta):
+        start, removed, inserted = RUN_HEADER.unpack_from(delta, offset)
+        offset += RUN_HEADER.size
+        new += old[copied:start] + delta[offset:offset + inserted]
+        offset += inserted
+        copied = start + removed
+    return bytes(new + old[copied:])
+
+
+def replay_deltas(snapshot, deltas):
+    """Returns the snapshot reached by applying deltas, in order, on top of snapshot."""
+    for delta in deltas:
+        snapshot = apply_snapshot_delta(snapshot, delta)
+    return snapshot
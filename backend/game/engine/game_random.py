@@ -0,0 +1,62 @@
+import random
+
+SEED_BITS = 64
+WORD_BITS = 32
+
+
+class GameRandom(random.Random):
+    """
+    The random number generator of one game, shared by its dice, deck and AI players.
+
+    It remembers the seed it started from and how many 32 bit words it has drawn since, which is all a snapshot
+    needs to put a new GameRandom in the same state (see restore) instead of the whole Mersenne Twister state.
+    """
+
+    def __init__(self, seed=None):
+        self.initial_seed = None
+        self.words_drawn = 0
+        super().__init__(seed)
+
+    def seed(self, a=None, version=2):
+        if a is None:
+            # every game gets a seed it can be replayed from, even when nobody asked for one
+            a = random.SystemRandom().getrandbits(SEED_BITS)
+        if not isinstance(a, int) or not 0 <= a < 2 ** SEED_BITS:
+            raise ValueError("A game seed is an integer from 0 to 2**{} - 1".format(SEED_BITS))
+        super().seed(a, version)
+        self.initial_seed = a
+        self.words_drawn = 0
+
+    def getrandbits(self, k):
+        self.words_drawn += (k + WORD_BITS - 1) // WORD_BITS
+        return super().getrandbits(k)
+
+    def random(self):
+        # random() is built from two 32 bit words
+        self.words_drawn += 2
+        return super().random()
+
+    def skip(self, words):
+        """Draws and drops words 32 bit words, as if they had been used by the game."""
+        if words > 0:
+            super().getrandbits(words * WORD_BITS)
+            self.words_drawn += words
+
+    def getstate(self):
+        return super().getstate(), self.initial_seed, self.words_drawn
+
+    def setstate(self, state):
+        random_state, self.initial_seed, self.words_drawn = state
+        super().setstate(random_state)
+
+    def copy(self):
+        """A GameRandom in the same state, drawing the same numbers from here on."""
+        game_random = type(self)(0)
+        game_random.setstate(self.getstate())
+        return game_random
+
+    @classmethod
+    def restore(cls, seed, words_drawn):
+        game_random = cls(seed)
+        game_random.skip(words_drawn)
+        return game_random
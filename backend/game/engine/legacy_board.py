@@ -0,0 +1,124 @@
+"""
+Reads the pickled BoardGame that GameState.board held before boards were stored as snapshots (game/engine/snapshot.py).
+
+The pickle is loaded without running any game code: every game class it names is swapped for a plain record holding
+the attributes the board had when it was pickled, and the board is rebuilt from those records. The players, whose
+turn it is, the dice on the table and the winner carry over. The piles of the deck were class attributes and never
+made it into the pickle, so the board gets a new deck without the cards the players hold.
+"""
+
+import io
+import pickle
+from enum import Enum
+
+from game.cards import card_catalog
+from game.cards.card import Card
+from game.player.player import Player
+from game.values.status import Status
+from game.values.turn_phase import TurnPhase
+
+PICKLE_PROTOCOL_2 = b"\x80"
+
+
+class _LegacyRecord:
+    # the real class of the pickled object, None when it does not exist anymore
+    legacy_class = None
+
+
+class _LegacyCycle:
+    # GamePlayers.player_cycle was an itertools.cycle, only whether it was set is of any use
+    def __init__(self, *args):
+        pass
+
+    def __setstate__(self, state):
+        pass
+
+
+class _LegacyUnpickler(pickle.Unpickler):
+    def __init__(self, file):
+        super().__init__(file)
+        self.records = {}
+
+    def find_class(self, module, name):
+        if (module, name) == ('itertools', 'cycle'):
+            return _LegacyCycle
+        if not module.startswith('game.'):
+            return super().find_class(module, name)
+        try:
+            found = super().find_class(module, name)
+        except (ImportError, AttributeError):
+            found = None
+        if isinstance(found, type) and issubclass(found, Enum) or found is not None and not isinstance(found, type):
+            # enums and functions (card_catalog.get_card) are read as they are
+            return found
+        record = self.records.get((module, name))
+        if record is None:
+            record = self.records[(module, name)] = type(name, (_LegacyRecord,), {'legacy_class': found})
+        return record
+
+
+def is_legacy_pickle(data):
+    return bytes(data[:len(PICKLE_PROTOCOL_2)]) == PICKLE_PROTOCOL_2
+
+
+def _card(card):
+    if isinstance(card, Card):
+        return card
+    if card.legacy_class is None or card.legacy_class not in card_catalog.CARD_IDS:
+        raise ValueError("Pickled board holds an unknown card {}".format(type(card).__name__))
+    return card_catalog.get_shared_card(card.legacy_class)
+
+
+def _player(legacy_player):
+    player = Player(legacy_player.username)
+    for field in ('monster_name', 'maximum_health', 'current_health', 'location', 'is_alive', 'victory_points',
+                  'energy', 'allowed_to_yield', 'gets_bonus_turn', 'newly_dead'):
+        if hasattr(legacy_player, field):
+            setattr(player, field, getattr(legacy_player, field))
+    player.set_cards([_card(card) for card in getattr(legacy_player, 'cards', [])])
+    return player
+
+
+def _remove_held_cards(deck_handler, held):
+    draw_pile = [card for card in deck_handler.draw_pile if card not in held]
+    deck_handler.draw_pile.clear()
+    for card in draw_pile:
+        deck_handler.draw_pile.append(card)
+    for index, card in enumerate(deck_handler.store):
+        if card in held:
+            deck_handler.store[index] = deck_handler.draw_pile.draw_from()
+
+
+def board_from_pickle(data, board_class):
+    try:
+        legacy = _LegacyUnpickler(io.BytesIO(bytes(data))).load()
+        legacy_players = legacy.players.players
+    except (pickle.UnpicklingError, AttributeError, EOFError) as error:
+        raise ValueError("Data is not a pickled KOT board") from error
+
+    board = board_class()
+    for legacy_player in legacy_players:
+        board.add_player(_player(legacy_player))
+    players = board.players.players
+    held = [card for player in players for card in player.cards]
+    if held:
+        _remove_held_cards(board.deck_handler, held)
+
+    seat_of = {id(legacy_player): seat for seat, legacy_player in enumerate(legacy_players)}
+    current_seat = seat_of.get(id(legacy.players.current_player))
+    board.players.order_set = isinstance(getattr(legacy.players, 'player_cycle', None), _LegacyCycle)
+    if current_seat is not None:
+        board.players.current_player = players[current_seat]
+        # the cycle had already moved past the current player
+        board.players.next_in_order = (current_seat + 1) % len(players)
+    winner_seat = seat_of.get(id(legacy.winner))
+    board.winner = players[winner_seat] if winner_seat is not None else None
+    board.status = legacy.status
+
+    board.dice_handler.dice_values = list(legacy.dice_handler.dice_values)
+    board.dice_handler.re_rolls_left = legacy.dice_handler.re_rolls_left
+    if board.status == Status.COMPLETED:
+        board.turn_phase = TurnPhase.GAME_OVER
+    else:
+        board.turn_phase = TurnPhase.RE_ROLL if board.dice_handler.dice_values else TurnPhase.ROLL
+    return board
@@ -0,0 +1,154 @@
+"""
+Monte Carlo search over the decisions of one player, on SimulationGame rollouts.
+
+A decision (ReRollDecision, YieldDecision) lists the actions a player can take and plays one of them on a clone of the
+game. The search is UCB1 over those actions: every iteration picks an action, plays it on a clone of the game and lets
+every player's SimulationStrategy finish the game, counting a win when the searching player wins. It stops after a
+number of iterations or when its time budget runs out, and the action played most often is the decision.
+
+The n-th rollout of every action draws from the same seed, so actions are compared on the same dice and a few hundred
+rollouts already tell them apart. For the same reason a re-roll is not searched over every multiset of dice it could
+keep (up to 64) but over the best keeps of a few objectives, read from the exact re-roll tables.
+
+With workers, independent searches with their own seeds run on a process pool and their counts are added up (root
+parallelism), so a decision gets workers times the rollouts in the same time.
+"""
+
+import math
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from game.dice.re_roll_table import ReRollObjective, face_counts, get_re_roll_table, re_roll_indexes
+from game.engine.simulation import roll_dice
+
+DEFAULT_EXPLORATION = math.sqrt(2)
+
+SearchResult = namedtuple('SearchResult', ['visits', 'wins'])
+
+# every mix of stars, attack, energy and heal, each one giving a keep worth trying
+CANDIDATE_OBJECTIVES = tuple(ReRollObjective(stars, attack, energy, heal)
+                             for stars in (1, 0) for attack in (1, 0) for energy in (1, 0) for heal in (1, 0)
+                             if stars or attack or energy or heal)
+
+
+class ReRollDecision:
+    """Which dice to keep, out of face values, with re_rolls_left re-rolls left."""
+
+    def __init__(self, face_values, re_rolls_left):
+        self.face_values = list(face_values)
+        self.re_rolls_left = re_rolls_left
+
+    def actions(self):
+        # keeping everything, then the best keep of every candidate objective, without repeats
+        counts = face_counts(self.face_values)
+        keeps = [counts]
+        for objective in CANDIDATE_OBJECTIVES:
+            table = get_re_roll_table(objective, len(self.face_values))
+            kept = table.best_keep(counts, min(self.re_rolls_left, table.re_rolls))
+            if kept not in keeps:
+                keeps.append(kept)
+        return keeps
+
+    def play(self, game, kept):
+        dice = self.face_values[:]
+        roll_dice(game.rng.getrandbits, dice, re_roll_indexes(dice, kept))
+        game.play_re_rolls(dice, self.re_rolls_left - 1)
+        game.resolve_dice(game.current, dice)
+        game.play_yield()
+        game.end_turn()
+
+    def dice_to_re_roll(self, kept):
+        return re_roll_indexes(self.face_values, kept)
+
+
+class YieldDecision:
+    """Whether the player attacked in Tokyo leaves it."""
+
+    def actions(self):
+        return [True, False]
+
+    def play(self, game, leave_tokyo):
+        game.play_yield(leave_tokyo)
+        game.end_turn()
+
+
+def _pick_action(visits, wins, iteration, exploration):
+    best, best_value = 0, None
+    log_iterations = math.log(iteration)
+    for action, action_visits in enumerate(visits):
+        if not action_visits:
+            return action
+        value = wins[action] / action_visits + exploration * math.sqrt(log_iterations / action_visits)
+        if best_value is None or value > best_value:
+            best, best_value = action, value
+    return best
+
+
+def search(game, seat, decision, iterations=None, time_budget=None, seed=None, exploration=DEFAULT_EXPLORATION):
+    """
+    Runs the search for the player in seat and returns a SearchResult with the visits and wins of every action of
+    decision.actions(), in that order. Needs iterations, time_budget (seconds) or both.
+    """
+    if iterations is None and time_budget is None:
+        raise ValueError("A search needs an iteration count or a time budget")
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    rng = random.Random(seed)
+    rollout_seeds = []
+    actions = decision.actions()
+    visits = [0] * len(actions)
+    wins = [0] * len(actions)
+
+    iteration = 0
+    while iterations is None or iteration < iterations:
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        iteration += 1
+        action = _pick_action(visits, wins, iteration, exploration)
+        if visits[action] == len(rollout_seeds):
+            rollout_seeds.append(rng.getrandbits(64))
+        rollout = game.clone(random.Random(rollout_seeds[visits[action]]))
+        decision.play(rollout, actions[action])
+        visits[action] += 1
+        if rollout.play() == seat:
+            wins[action] += 1
+    return SearchResult(visits, wins)
+
+
+class MonteCarloSearch:
+    """Runs searches in this process or, with workers, on a process pool kept until close()."""
+
+    def __init__(self, iterations=None, time_budget=None, workers=None, exploration=DEFAULT_EXPLORATION):
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.workers = workers
+        self.exploration = exploration
+        self.executor = None
+
+    def best_action(self, game, seat, decision, seed=None):
+        actions = decision.actions()
+        if len(actions) == 1:
+            return actions[0]
+        result = self.run(game, seat, decision, seed)
+        best = max(range(len(actions)), key=lambda action: (result.visits[action], result.wins[action]))
+        return actions[best]
+
+    def run(self, game, seat, decision, seed=None):
+        if not self.workers or self.workers < 2:
+            return search(game, seat, decision, self.iterations, self.time_budget, seed, self.exploration)
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        seeds = random.Random(seed)
+        iterations = None if self.iterations is None else -(-self.iterations // self.workers)
+        futures = [self.executor.submit(search, game, seat, decision, iterations, self.time_budget,
+                                        seeds.getrandbits(64), self.exploration) for _ in range(self.workers)]
+        results = [future.result() for future in futures]
+        return SearchResult([sum(counts) for counts in zip(*(result.visits for result in results))],
+                            [sum(counts) for counts in zip(*(result.wins for result in results))])
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
@@ -1,16 +1,63 @@
-import itertools
-
 from game.cards.keep_cards.victory_point_manipulation_cards.eater_of_the_dead import EaterOfTheDead
 from game.player.player import Player
 from game.values.locations import Locations
 
 
 class GamePlayers:
+    """
+    The players of a game and whose turn it is.
+
+    Turn order is an index into players: next_in_order is the seat handed the next turn once the order is set.
+    next_alive[seat] is the first alive seat after seat, going round the table, so finding the next player is one
+    lookup. It and alive_count are rebuilt whenever a player dies or comes back, which players report through
+    player_alive_changed.
+
+    The alive players, the alive players other than the current one and how many of those are in Tokyo are kept
+    once worked out, until a death, a move in or out of Tokyo (player_location_changed) or a new current player.
+    The lists handed out are never changed afterwards, callers must not change them either.
+    """
 
     def __init__(self):
         self.players = []
-        self.current_player = None
-        self.player_cycle = []
+        self._current_player = None
+        self.order_set = False
+        self.next_in_order = 0
+        self.next_alive = []
+        self.alive_count = 0
+        self._alive_players = None
+        self._other_alive_players = None
+        self._others_in_tokyo_count = None
+
+    @property
+    def current_player(self):
+        return self._current_player
+
+    @current_player.setter
+    def current_player(self, player):
+        if player is not self._current_player:
+            self._current_player = player
+            self._other_alive_players = None
+            self._others_in_tokyo_count = None
+
+    def clone(self):
+        """
+        A GamePlayers with clones of every player, at the same point of the turn order. Players that keep a
+        player_queue (the AI players) get the new one.
+        """
+        player_queue = GamePlayers()
+        for player in self.players:
+            clone = player.clone()
+            clone.game_players = player_queue
+            if getattr(clone, 'player_queue', None) is self:
+                clone.player_queue = player_queue
+            player_queue.players.append(clone)
+        if self.current_player is not None:
+            player_queue.current_player = player_queue.players[self.current_player.seat]
+        player_queue.order_set = self.order_set
+        player_queue.next_in_order = self.next_in_order
+        player_queue.next_alive = self.next_alive.copy()
+        player_queue.alive_count = self.alive_count
+        return player_queue
 
     def add_player_to_game(self, new_player):
         if not issubclass(type(new_player), Player):
@@ -18,10 +65,39 @@ class GamePlayers:
                 "Object passed in was not an instance of Player")
         if new_player in self.players:
             raise Exception("Player has already been added to game")
+        new_player.seat = len(self.players)
+        new_player.game_players = self
         self.players.append(new_player)
+        self.player_alive_changed(new_player)
+
+    def player_alive_changed(self, player):
+        self._build_alive_ring()
+        self._alive_players = None
+        self._other_alive_players = None
+        self._others_in_tokyo_count = None
+
+    def player_location_changed(self, player):
+        self._others_in_tokyo_count = None
+
+    def _build_alive_ring(self):
+        count = len(self.players)
+        self.next_alive = [None] * count
+        next_alive = None
+        # two laps backwards, so the seats after the last alive one wrap round to the first
+        for seat in reversed(range(2 * count)):
+            seat %= count
+            self.next_alive[seat] = next_alive
+            if self.players[seat].is_alive:
+                next_alive = seat
+        self.alive_count = sum(1 for player in self.players if player.is_alive)
 
     def set_player_order(self):
-        self.player_cycle = itertools.cycle(self.players)
+        self.order_set = True
+        self.next_in_order = 0
+
+    def distance_to_turn(self, player):
+        """How many seats round the table player sits from the current player."""
+        return (player.seat - self.current_player.seat) % len(self.players)
 
     def get_current_player(self):
         if not self.current_player:
@@ -42,34 +118,45 @@ class GamePlayers:
         if self.current_player and self.current_player.gets_bonus_turn:
             self.current_player.gets_bonus_turn = False
         else:
-            self.current_player = self._cycle_next_alive_player()
+            self.current_player = self._next_alive_player_in_order()
 
     def get_alive_players(self):
-        return [player for player in self.players if player.is_alive]
+        if self._alive_players is None:
+            self._alive_players = [player for player in self.players if player.is_alive]
+        return self._alive_players
 
     def get_dead_players(self):
         return [player for player in self.players if not player.is_alive]
 
     def get_all_alive_players_minus_current_player(self):
-        return [player for player in self.get_alive_players() if
-                self.current_player != player]
+        if self._other_alive_players is None:
+            self._other_alive_players = [player for player in self.get_alive_players() if
+                                         self.current_player != player]
+        return self._other_alive_players
 
     def is_last_player_alive(self, possible_last_player):
-        return [possible_last_player] == self.get_alive_players()
+        return (self.alive_count == 1 and possible_last_player.is_alive and
+                possible_last_player.game_players is self)
 
-    def _cycle_next_alive_player(self):
-        if not self.get_alive_players():
+    def _next_alive_player_in_order(self):
+        if not self.alive_count:
             raise Exception("There are no alive players left")
-        for player in self.player_cycle:
-            if player.is_alive:
-                return player
+        if not self.order_set:
+            return None
+        seat = self.next_in_order
+        if not self.players[seat].is_alive:
+            seat = self.next_alive[seat]
+        self.next_in_order = (seat + 1) % len(self.players)
+        return self.players[seat]
 
     def get_count_in_tokyo_ignore_current_player(self):
-        return len([player for player in self.get_all_alive_players_minus_current_player() if
-                    player.location != Locations.OUTSIDE])
+        if self._others_in_tokyo_count is None:
+            self._others_in_tokyo_count = len([player for player in self.get_all_alive_players_minus_current_player()
+                                               if player.location != Locations.OUTSIDE])
+        return self._others_in_tokyo_count
 
     def check_for_eater_of_dead_holders(self):
-        return [player for player in self.get_alive_players() if player.has_instance_of_card(EaterOfTheDead())]
+        return [player for player in self.get_alive_players() if player.has_instance_of_card(EaterOfTheDead)]
 
     def check_for_newly_dead_players(self):
         return [player for player in self.players if player.is_newly_dead]
@@ -0,0 +1,152 @@
+"""
+Deterministic replays of recorded games, headless and without a websocket stack.
+
+An ActionLog holds what it takes to play a game again: the seed of its BoardGame, its players in seat order, the
+turn actions played (game/engine/turn.py) and state hashes taken along the way. Each action is logged with the number
+of words the game's GameRandom had drawn before it, the words AI players drew between two actions are skipped on
+replay, so every player is replayed as a plain Player and dice and cards come out as they did.
+
+A checkpoint maps a number of actions played to the state hash of the board right after them (see state_hash).
+GameRecorder takes one at the end of every turn, action logs of web rooms (lobby.game_event_log.room_action_log)
+after every command. A replay that does not reach the recorded hash raises ReplayDivergenceException.
+
+Turns are counted from 1 and every EndTurnAction ends one, bonus turns included. Turn N starts right after the
+(N - 1)th EndTurnAction, before its RollAction.
+"""
+
+import hashlib
+import json
+
+from game.engine.board import BoardGame
+from game.engine.event_log import ACTION_TYPES
+from game.engine.turn import EndTurnAction
+from game.player.player import Player
+from game.values.exceptions import ReplayDivergenceException
+
+ACTION_TYPES_BY_NAME = {action_type.__name__: action_type for action_type in ACTION_TYPES}
+
+
+def snapshot_hash(snapshot):
+    return hashlib.blake2b(snapshot, digest_size=8).hexdigest()
+
+
+def state_hash(board):
+    """Short hash of the board's snapshot."""
+    return snapshot_hash(board.to_bytes())
+
+
+class ActionLog:
+    """
+    players are (username, monster_name) pairs, actions (words_drawn, action) pairs where words_drawn is None when
+    nothing may be drawn between the previous action and this one.
+    """
+
+    def __init__(self, seed, players, actions=None, checkpoints=None):
+        self.seed = seed
+        self.players = players
+        self.actions = actions if actions is not None else []
+        self.checkpoints = checkpoints if checkpoints is not None else {}
+
+    def to_json(self):
+        return json.dumps({
+            'seed': self.seed,
+            'players': self.players,
+            'actions': [[words_drawn, type(action).__name__, *action] for words_drawn, action in self.actions],
+            'checkpoints': self.checkpoints,
+        })
+
+    @classmethod
+    def from_json(cls, text):
+        data = json.loads(text)
+        actions = [(words_drawn, ACTION_TYPES_BY_NAME[name](*fields))
+                   for words_drawn, name, *fields in data['actions']]
+        return cls(data['seed'], [tuple(player) for player in data['players']], actions,
+                   {int(count): hash_value for count, hash_value in data['checkpoints'].items()})
+
+    def save(self, path):
+        with open(path, 'w') as log_file:
+            log_file.write(self.to_json())
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as log_file:
+            return cls.from_json(log_file.read())
+
+
+class GameRecorder:
+    """Logs the actions played on a board that has all its players, with a checkpoint at the end of every turn."""
+
+    def __init__(self, board):
+        self.board = board
+        self.log = ActionLog(board.seed, [(player.username, player.monster_name) for player in board.players.players])
+
+    def __enter__(self):
+        self.board.action_listener = self.record
+        return self.log
+
+    def __exit__(self, *exc_info):
+        del self.board.action_listener
+
+    def record(self, action, words_drawn):
+        self.log.actions.append((words_drawn, action))
+        if isinstance(action, EndTurnAction):
+            self.log.checkpoints[len(self.log.actions)] = state_hash(self.board)
+
+
+def record_game(board, play_game):
+    """Plays the game with play_game(board), e.g. run_offline_game.run_game. Returns its result and ActionLog."""
+    with GameRecorder(board) as log:
+        result = play_game(board)
+    return result, log
+
+
+class GameReplay:
+    """Plays an ActionLog back on a new board, checking its state hashes when verify is set."""
+
+    def __init__(self, log: ActionLog, verify=True):
+        self.log = log
+        self.verify = verify
+        self.board = BoardGame(log.seed)
+        for username, monster_name in log.players:
+            player = Player(username)
+            player.set_monster_name(monster_name)
+            self.board.add_player(player)
+        self.board.start_game()
+        self.played = 0
+        self.turn = 1
+
+    @property
+    def done(self):
+        return self.played == len(self.log.actions)
+
+    def step(self):
+        """Plays the next action and returns its result."""
+        words_drawn, action = self.log.actions[self.played]
+        if words_drawn is not None:
+            self.board.rng.skip(words_drawn - self.board.rng.words_drawn)
+        result = self.board.apply(action)
+        self.played += 1
+        if isinstance(action, EndTurnAction):
+            self.turn += 1
+        expected = self.log.checkpoints.get(self.played)
+        if self.verify and expected is not None and state_hash(self.board) != expected:
+            raise ReplayDivergenceException("Replay diverged after action {} {}".format(self.played, action))
+        return result
+
+    def run_to_turn(self, turn):
+        """Plays up to the start of turn (or the end of the log) and returns the board."""
+        while not self.done and self.turn < turn:
+            self.step()
+        return self.board
+
+    def run(self):
+        """Plays the rest of the log and returns the board."""
+        while not self.done:
+            self.step()
+        return self.board
+
+
+def replay_game(log, turn=None, verify=True):
+    """Returns the board of the logged game at the start of turn, at its end without one."""
+    replay = GameReplay(log, verify)
+    return replay.run() if turn is None else replay.run_to_turn(turn)
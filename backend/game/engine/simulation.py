@@ -0,0 +1,300 @@
+"""
+Headless AI vs AI games for strategy tuning.
+
+SimulationGame plays the same rules as run_offline_game.run_game (dice only, no card purchases) on a compact
+representation: every player is a seat index into flat lists of health, victory points and energy, dice are ints
+matching DieValue values and Tokyo is the seat holding it. One game object is reused for any number of games,
+reset() only refills those lists and reseeds the game's own Random.
+
+AI players are mapped to strategies that make the same decisions from the same random draws, so a simulation drawing
+from a Random in the same state as the board's GameRandom when run_game starts ends the same way.
+"""
+
+import copy
+import random
+from abc import ABC, abstractmethod
+from collections import Counter
+
+from game.dice.dice import DieValue
+from game.dice.re_roll_table import STARS_OBJECTIVE, get_re_roll_table
+from game.player.ai_players.attack_ai_player import Attack_AI_Player
+from game.player.ai_players.chaos_ai_player import Chaos_AI_Player
+from game.player.ai_players.final_ai_player import Final_AI_Player
+from game.player.ai_players.points_ai_player import Points_AI_Player
+from game.values import constants
+
+DIE_FACES = tuple(die.value for die in DieValue)
+ONE = DieValue.ONE.value
+TWO = DieValue.TWO.value
+THREE = DieValue.THREE.value
+ATTACK = DieValue.ATTACK.value
+HEAL = DieValue.HEAL.value
+ENERGY = DieValue.ENERGY.value
+DIE_FACE_COUNT = len(DIE_FACES)
+DIE_BITS = DIE_FACE_COUNT.bit_length()
+
+ALL_DICE = range(constants.DEFAULT_DICE_TO_ROLL)
+
+NOBODY = -1
+
+
+# The draws below are Random.choice(DIE_FACES) and Random.choice((True, False)) unrolled: the same rejection sampling
+# on getrandbits, so a game draws exactly what the dice and AI players would draw from a Random seeded the same way.
+def roll_dice(getrandbits, dice, indexes):
+    for i in indexes:
+        r = getrandbits(DIE_BITS)
+        while r >= DIE_FACE_COUNT:
+            r = getrandbits(DIE_BITS)
+        dice[i] = DIE_FACES[r]
+
+
+def _pick_at_random(getrandbits, indexes):
+    # keeps every index that wins a coin flip
+    picked = []
+    for i in indexes:
+        r = getrandbits(2)
+        while r >= 2:
+            r = getrandbits(2)
+        if not r:
+            picked.append(i)
+    return picked
+
+
+class SimulationStrategy(ABC):
+    @abstractmethod
+    def choose_dice_to_re_roll(self, game, seat, dice, re_rolls_left):
+        """Returns the indexes of the dice the player at seat re-rolls, drawing from game.rng only."""
+
+    def decide_to_yield(self, game, seat):
+        return True
+
+
+class ChaosStrategy(SimulationStrategy):
+    def choose_dice_to_re_roll(self, game, seat, dice, re_rolls_left):
+        return _pick_at_random(game.rng.getrandbits, range(len(dice)))
+
+
+class AttackStrategy(SimulationStrategy):
+    def choose_dice_to_re_roll(self, game, seat, dice, re_rolls_left):
+        return _pick_at_random(game.rng.getrandbits, [i for i, die in enumerate(dice) if die != ATTACK])
+
+
+def _re_roll_for_points(dice, re_rolls_left):
+    return get_re_roll_table(STARS_OBJECTIVE, len(dice)).dice_to_re_roll(dice, re_rolls_left)
+
+
+class PointsStrategy(SimulationStrategy):
+    def choose_dice_to_re_roll(self, game, seat, dice, re_rolls_left):
+        return _re_roll_for_points(dice, re_rolls_left)
+
+
+class FinalStrategy(SimulationStrategy):
+    def __init__(self, passiveness=.5):
+        self.passiveness = passiveness
+
+    def plays_for_stars(self, game, seat):
+        # same heuristics as Final_AI_Player.get_current_policy
+        current, alive = game.current, game.alive
+        attack_distance = sum(health for other, health in enumerate(game.health) if alive[other] and other != current)
+        star_distance = constants.VICTORY_POINTS_TO_WIN - game.victory_points[seat]
+        return star_distance * (1 - self.passiveness) < attack_distance * self.passiveness
+
+    def decide_to_yield(self, game, seat):
+        distance_to_next_turn = (seat - game.current) % game.player_count
+        if self.plays_for_stars(game, seat):
+            return distance_to_next_turn * 2 > game.health[seat]
+        return distance_to_next_turn > 0
+
+    def choose_dice_to_re_roll(self, game, seat, dice, re_rolls_left):
+        if self.plays_for_stars(game, seat):
+            return _re_roll_for_points(dice, re_rolls_left)
+        return [i for i, die in enumerate(dice) if die != ATTACK]
+
+
+def strategy_for_player(player):
+    """Returns the SimulationStrategy playing like the given AI player."""
+    if isinstance(player, Final_AI_Player):
+        return FinalStrategy(player.passiveness)
+    for player_class, strategy_class in ((Chaos_AI_Player, ChaosStrategy), (Attack_AI_Player, AttackStrategy),
+                                         (Points_AI_Player, PointsStrategy)):
+        if isinstance(player, player_class):
+            return strategy_class()
+    raise TypeError("{} can not be simulated".format(type(player).__name__))
+
+
+class SimulationGame:
+    def __init__(self, strategies, usernames=None, seed=None):
+        if not strategies:
+            raise ValueError("A simulation needs at least one player")
+        self.strategies = list(strategies)
+        self.player_count = len(self.strategies)
+        self.usernames = list(usernames) if usernames else ["player_{}".format(i) for i in range(self.player_count)]
+        self.own_rng = random.Random()
+        self.reset(seed)
+
+    @classmethod
+    def from_players(cls, players, seed=None):
+        return cls([strategy_for_player(player) for player in players], [player.username for player in players], seed)
+
+    @classmethod
+    def from_player_queue(cls, player_queue, strategies):
+        """
+        A simulation at the point of the given game the players are in, with the current player to move. Cards are
+        not simulated, a player's cards are ignored.
+        """
+        players = player_queue.players
+        game = cls(strategies, [player.username for player in players])
+        game.health = [player.current_health for player in players]
+        game.victory_points = [player.victory_points for player in players]
+        game.energy = [player.energy for player in players]
+        game.alive = [player.is_alive for player in players]
+        game.alive_count = sum(game.alive)
+        for seat, player in enumerate(players):
+            if player.is_in_tokyo():
+                game.tokyo = seat
+            if player.allowed_to_yield:
+                game.allowed_to_yield = seat
+            if player is player_queue.current_player:
+                game.current = seat
+        return game
+
+    def clone(self, rng=None):
+        """A copy to play on without touching this game, drawing from rng (this game's Random when None)."""
+        game = copy.copy(self)
+        game.health = self.health[:]
+        game.victory_points = self.victory_points[:]
+        game.energy = self.energy[:]
+        game.alive = self.alive[:]
+        game.rng = rng or self.rng
+        return game
+
+    def reset(self, seed=None, rng=None):
+        """
+        Puts every player back at the start of a game. The game draws from rng when given, otherwise from its own
+        Random reseeded with seed.
+        """
+        count = self.player_count
+        self.health = [constants.DEFAULT_HEALTH] * count
+        self.victory_points = [constants.DEATH_HIT_POINT] * count
+        self.energy = [constants.DEFAULT_ENERGY_CUBE] * count
+        self.alive = [True] * count
+        self.alive_count = count
+        self.tokyo = NOBODY
+        self.current = 0
+        self.turns = 0
+        self.winner = NOBODY
+        self.allowed_to_yield = NOBODY
+        if rng is None:
+            rng = self.own_rng
+            rng.seed(seed)
+        self.rng = rng
+
+    def alive_seats(self):
+        alive = self.alive
+        return [seat for seat in range(self.player_count) if alive[seat]]
+
+    @property
+    def winner_username(self):
+        return self.usernames[self.winner] if self.winner != NOBODY else None
+
+    def play(self):
+        """Plays the game to the end and returns the seat of the winner."""
+        play_turn = self.play_turn
+        while self.winner == NOBODY:
+            play_turn()
+        return self.winner
+
+    def play_turn(self):
+        current = self.current
+        self.turns += 1
+        dice = [0] * constants.DEFAULT_DICE_TO_ROLL
+        roll_dice(self.rng.getrandbits, dice, ALL_DICE)
+        self.play_re_rolls(dice, constants.DEFAULT_RE_ROLL_COUNT)
+        self.resolve_dice(current, dice)
+        self.play_yield()
+        self.end_turn()
+
+    def play_re_rolls(self, dice, re_rolls_left):
+        """Lets the current player play its re-rolls left on dice."""
+        getrandbits = self.rng.getrandbits
+        current = self.current
+        strategy = self.strategies[current]
+        for re_rolls in range(re_rolls_left, 0, -1):
+            roll_dice(getrandbits, dice, strategy.choose_dice_to_re_roll(self, current, dice, re_rolls))
+
+    def play_yield(self, decision=None):
+        """The player attacked in Tokyo leaves it when decision, or its strategy when there is no decision, says so."""
+        yielding = self.allowed_to_yield
+        if yielding == NOBODY or not self.alive[yielding]:
+            return
+        if decision is None:
+            decision = self.strategies[yielding].decide_to_yield(self, yielding)
+        if decision:
+            self.take_tokyo(self.current)
+
+    def end_turn(self):
+        current = self.current
+        if (self.victory_points[current] >= constants.VICTORY_POINTS_TO_WIN or
+                self.alive_count == 1):
+            self.winner = current
+            return
+
+        alive = self.alive
+        next_seat = (current + 1) % self.player_count
+        while not alive[next_seat]:
+            next_seat = (next_seat + 1) % self.player_count
+        self.current = next_seat
+
+    def resolve_dice(self, current, dice):
+        # same order as dice_resolver.dice_resolution
+        count = dice.count
+        for face in (ONE, TWO, THREE):
+            face_count = count(face)
+            if face_count >= 3:
+                self.victory_points[current] += face + face_count - 3
+        self.energy[current] += count(ENERGY)
+
+        tokyo = self.tokyo
+        if tokyo != current:
+            self.health[current] = min(self.health[current] + count(HEAL), constants.DEFAULT_HEALTH)
+
+        attack = count(ATTACK)
+        self.allowed_to_yield = NOBODY
+        if attack == 0:
+            return
+        if tokyo == current:
+            for seat in self.alive_seats():
+                if seat != current:
+                    self.damage(seat, attack)
+        elif tokyo != NOBODY:
+            self.damage(tokyo, attack)
+            if self.alive[tokyo]:
+                self.allowed_to_yield = tokyo
+            else:
+                self.take_tokyo(current)
+        else:
+            self.take_tokyo(current)
+
+    def damage(self, seat, attack):
+        self.health[seat] -= attack
+        if self.health[seat] <= 0:
+            self.alive[seat] = False
+            self.alive_count -= 1
+
+    def take_tokyo(self, seat):
+        self.tokyo = seat
+        self.victory_points[seat] += 1
+
+
+def simulate_games(players, count, seed=None):
+    """
+    Plays count games between the given AI players on one reused SimulationGame and returns the wins per username.
+    Game i is seeded with seed + i, so any game of a run can be replayed on its own.
+    """
+    game = SimulationGame.from_players(players)
+    usernames = game.usernames
+    win_counts = Counter()
+    for i in range(count):
+        game.reset(None if seed is None else seed + i)
+        win_counts[usernames[game.play()]] += 1
+    return win_counts
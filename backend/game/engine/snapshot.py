@@ -0,0 +1,185 @@
+"""
+Compact, versioned binary snapshot of a BoardGame.
+
+Cards are stored as their card catalog id, dice as their DieValue and the turn order as the seat handed the next
+turn (GamePlayers.next_in_order). Layout (little endian):
+
+    b"KOT" version:B status:B winner:b seed:Q words_drawn:Q
+    players:B { username:str monster_name:str? max_health:h health:h location:B flags:B victory_points:h
+                energy:h cards:ids }
+    current_player:b order_set:B next_in_order:B
+    dice:B { value:B } re_rolls_left:B
+    draw_pile:ids store:ids discard_pile:ids
+    turn_phase:B
+
+where str is a length prefixed utf-8 string (length 0xFFFF for None) and ids is a count followed by card ids.
+seed and words_drawn restore the game's GameRandom. Boards pickled before there were snapshots are read by
+game/engine/legacy_board.py.
+"""
+
+import struct
+
+from game.cards import card_catalog
+from game.deck.deck_handler import DeckHandler
+from game.dice.dice import DieValue
+from game.dice.dice_handler import DiceHandler
+from game.engine.game_random import GameRandom
+from game.engine.legacy_board import board_from_pickle, is_legacy_pickle
+from game.engine.player_queue import GamePlayers
+from game.player.player import Player
+from game.values.locations import Locations
+from game.values.status import Status
+from game.values.turn_phase import TurnPhase
+
+SNAPSHOT_MAGIC = b"KOT"
+SNAPSHOT_VERSION = 1
+
+NO_INDEX = -1
+NONE_STRING_LENGTH = 0xFFFF
+
+ALIVE_FLAG = 1
+ALLOWED_TO_YIELD_FLAG = 2
+BONUS_TURN_FLAG = 4
+NEWLY_DEAD_FLAG = 8
+
+
+class _SnapshotWriter:
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def pack(self, fmt, *values):
+        self.buffer += struct.pack("<" + fmt, *values)
+
+    def string(self, value):
+        if value is None:
+            self.pack("H", NONE_STRING_LENGTH)
+            return
+        encoded = value.encode("utf-8")
+        self.pack("H", len(encoded))
+        self.buffer += encoded
+
+    def cards(self, cards):
+        cards = list(cards)
+        self.pack("H", len(cards))
+        for card in cards:
+            self.pack("B", card_catalog.get_card_id(card))
+
+
+class _SnapshotReader:
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, fmt):
+        fmt = "<" + fmt
+        values = struct.unpack_from(fmt, self.data, self.offset)
+        self.offset += struct.calcsize(fmt)
+        return values if len(values) > 1 else values[0]
+
+    def string(self):
+        length = self.unpack("H")
+        if length == NONE_STRING_LENGTH:
+            return None
+        value = bytes(self.data[self.offset:self.offset + length]).decode("utf-8")
+        self.offset += length
+        return value
+
+    def cards(self):
+        return [card_catalog.get_card(self.unpack("B")) for _ in range(self.unpack("H"))]
+
+
+def _index_of(players, player):
+    for index, candidate in enumerate(players):
+        if candidate is player:
+            return index
+    return NO_INDEX
+
+
+def board_to_bytes(board):
+    writer = _SnapshotWriter()
+    players = board.players.players
+    writer.buffer += SNAPSHOT_MAGIC
+    writer.pack("BBb", SNAPSHOT_VERSION, board.status.value, _index_of(players, board.winner))
+    writer.pack("QQ", board.rng.initial_seed, board.rng.words_drawn)
+
+    writer.pack("B", len(players))
+    for player in players:
+        flags = ((ALIVE_FLAG if player.is_alive else 0) |
+                 (ALLOWED_TO_YIELD_FLAG if player.allowed_to_yield else 0) |
+                 (BONUS_TURN_FLAG if player.gets_bonus_turn else 0) |
+                 (NEWLY_DEAD_FLAG if player.newly_dead else 0))
+        writer.string(player.username)
+        writer.string(player.monster_name)
+        writer.pack("hhBBhh", player.maximum_health, player.current_health, player.location.value, flags,
+                    player.victory_points, player.energy)
+        writer.cards(player.cards)
+
+    writer.pack("bBB", _index_of(players, board.players.current_player), board.players.order_set,
+                board.players.next_in_order)
+
+    dice_values = board.dice_handler.dice_values
+    writer.pack("B", len(dice_values))
+    for die in dice_values:
+        writer.pack("B", die.value)
+    writer.pack("B", board.dice_handler.re_rolls_left)
+
+    writer.cards(board.deck_handler.draw_pile)
+    writer.cards(board.deck_handler.store)
+    writer.cards(board.deck_handler.discard_pile)
+    writer.pack("B", board.turn_phase.value)
+    return bytes(writer.buffer)
+
+
+def is_board_snapshot(data):
+    return bytes(data[:len(SNAPSHOT_MAGIC)]) == SNAPSHOT_MAGIC
+
+
+def board_from_bytes(data, board_class):
+    if not is_board_snapshot(data):
+        if is_legacy_pickle(data):
+            # boards saved before snapshots, see game/engine/legacy_board.py
+            return board_from_pickle(data, board_class)
+        raise ValueError("Data is not a KOT board snapshot")
+    reader = _SnapshotReader(data)
+    reader.offset = len(SNAPSHOT_MAGIC)
+    version, status, winner_index = reader.unpack("BBb")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError("Unsupported KOT board snapshot version {}".format(version))
+
+    # skip __init__, which would build and shuffle a brand new deck
+    board = board_class.__new__(board_class)
+    board.rng = GameRandom.restore(*reader.unpack("QQ"))
+    board.status = Status(status)
+    board.players = GamePlayers()
+
+    for _ in range(reader.unpack("B")):
+        player = Player(reader.string())
+        player.monster_name = reader.string()
+        (player.maximum_health, player.current_health, location, flags, player.victory_points,
+         player.energy) = reader.unpack("hhBBhh")
+        player.location = Locations(location)
+        player.is_alive = bool(flags & ALIVE_FLAG)
+        player.allowed_to_yield = bool(flags & ALLOWED_TO_YIELD_FLAG)
+        player.gets_bonus_turn = bool(flags & BONUS_TURN_FLAG)
+        player.newly_dead = bool(flags & NEWLY_DEAD_FLAG)
+        player.set_cards(reader.cards())
+        board.players.add_player_to_game(player)
+
+    players = board.players.players
+    current_index, order_set, next_in_order = reader.unpack("bBB")
+    board.players.current_player = players[current_index] if current_index != NO_INDEX else None
+    board.players.order_set = bool(order_set)
+    board.players.next_in_order = next_in_order
+    board.winner = players[winner_index] if winner_index != NO_INDEX else None
+
+    board.dice_handler = DiceHandler(board.rng)
+    board.dice_handler.dice_values = [DieValue(reader.unpack("B")) for _ in range(reader.unpack("B"))]
+    board.dice_handler.re_rolls_left = reader.unpack("B")
+
+    board.deck_handler = DeckHandler.with_empty_piles(board.rng)
+    for pile in (board.deck_handler.draw_pile, board.deck_handler.store, board.deck_handler.discard_pile):
+        for card in reader.cards():
+            pile.append(card)
+
+    board.turn_phase = TurnPhase(reader.unpack("B"))
+    return board
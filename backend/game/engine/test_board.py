@@ -1,6 +1,8 @@
 import pickle
 
+from game.cards.keep_cards.victory_point_manipulation_cards.urbavore import Urbavore
 from game.engine.board import BoardGame
+from game.player.ai_players.chaos_ai_player import Chaos_AI_Player
 from game.player.player import Player
 from game.values.constants import VICTORY_POINTS_TO_WIN
 from game.values.status import Status
@@ -145,3 +147,34 @@ def test_decode_selected_dice_indexes():
             indexes.append(i)
         i += 1
     assert indexes == [0, 2, 4]
+
+
+def test_same_seed_same_game():
+    first = BoardGame(seed=8)
+    first_store = [card.name for card in first.deck_handler.store]
+    second = BoardGame(seed=8)
+    assert [card.name for card in second.deck_handler.store] == first_store
+    first.dice_handler.roll_initial(6, 2)
+    second.dice_handler.roll_initial(6, 2)
+    assert first.dice_handler.dice_values == second.dice_handler.dice_values
+
+
+def test_ai_players_use_the_game_random():
+    game = BoardGame(seed=8)
+    ai_player = Chaos_AI_Player(game.players, "chaos")
+    game.add_player(ai_player)
+    assert ai_player.rng is game.rng
+
+
+def test_turn_start_cards_take_effect():
+    player1 = Player("urbavore")
+    game = BoardGame()
+    game.add_player(player1)
+    game.add_player(Player("other"))
+    game.start_game()
+    current_player = game.players.get_current_player()
+    current_player.add_card(Urbavore())
+    current_player.move_to_tokyo()
+
+    game.start_turn_actions(current_player)
+    assert current_player.victory_points == 1
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+import game.dice.dice as dice
+from game.cards.keep_cards.energy_manipulation_cards.solar_powered import SolarPowered
+from game.cards.trigger import Trigger
+from game.dice.dice import DieValue
+from game.engine.board import BoardGame
+from game.engine.game_random import GameRandom
+from game.engine.terminal_board import TerminalBoardGame
+from game.player.ai_players.attack_ai_player import Attack_AI_Player
+from game.player.ai_players.points_ai_player import Points_AI_Player
+from game.player.player import Player
+from run_offline_game import run_game
+
+
+@pytest.fixture(params=[BoardGame, TerminalBoardGame])
+def game(request):
+    game = request.param(7)
+    game.add_player(Player("human"))
+    game.add_player(Attack_AI_Player(game.players, "Attack AI Gandhi"))
+    game.add_player(Points_AI_Player(game.players, "Points AI Trump"))
+    game.start_game()
+    game.dice_handler.roll_initial(6, 2)
+    return game
+
+
+def test_clone_has_the_same_state(game):
+    game.players.players[1].add_card(SolarPowered())
+    game.players.players[2].move_to_tokyo()
+
+    clone = game.clone()
+
+    assert type(clone) is type(game)
+    assert clone.status == game.status
+    assert [player.generate_player_status_as_dictionary() for player in clone.players.players] == \
+        [player.generate_player_status_as_dictionary() for player in game.players.players]
+    assert clone.players.current_player == game.players.current_player
+    assert clone.dice_handler.dice_values == game.dice_handler.dice_values
+    assert list(clone.deck_handler.draw_pile) == list(game.deck_handler.draw_pile)
+    assert clone.deck_handler.store == game.deck_handler.store
+    assert clone.players.players[1].has_instance_of_card(SolarPowered)
+
+
+def test_playing_on_a_clone_leaves_the_board_alone(game):
+    before = game.clone()
+    clone = game.clone()
+    player = clone.players.players[0]
+    player.update_health_by(-4)
+    player.add_card(SolarPowered())
+    clone.dice_handler.re_roll_dice([0, 1, 2])
+    clone.deck_handler.discard(clone.deck_handler.store[0], clone.deck_handler.store)
+    clone.get_next_player_turn()
+
+    assert game.players.players[0].current_health == before.players.players[0].current_health
+    assert not game.players.players[0].cards
+    assert not game.players.players[0].card_hooks[Trigger.ON_TURN_END]
+    assert game.dice_handler.re_rolls_left == 2
+    assert len(game.deck_handler.store) == len(before.deck_handler.store)
+    assert not game.deck_handler.discard_pile
+    assert game.players.current_player is game.players.players[0]
+
+
+def test_ai_players_play_on_the_clone(game):
+    clone = game.clone()
+    ai_player = clone.players.players[1]
+
+    assert ai_player.player_queue is clone.players
+    assert ai_player.rng is clone.rng
+    assert game.players.players[1].player_queue is game.players
+
+
+def test_clone_continues_the_turn_order(game):
+    clone = game.clone()
+    for _ in range(5):
+        assert clone.get_next_player_turn() == game.get_next_player_turn()
+
+
+def test_clone_plays_out_like_the_board(monkeypatch):
+    # dice_handler_test swaps dice.roll for a Mock when it is collected
+    monkeypatch.setattr(dice, "roll", lambda rng=None: (rng or random).choice(list(DieValue)))
+    game = TerminalBoardGame(3)
+    game.add_player(Attack_AI_Player(game.players, "Attack AI Gandhi"))
+    game.add_player(Points_AI_Player(game.players, "Points AI Trump"))
+
+    clone = game.clone()
+
+    assert run_game(clone).username == run_game(game).username
+    assert [player.victory_points for player in clone.players.players] == \
+        [player.victory_points for player in game.players.players]
+
+
+def test_clone_draws_from_a_given_generator(game):
+    rng = GameRandom(11)
+    clone = game.clone(rng)
+
+    assert clone.rng is rng
+    assert clone.dice_handler.rng is rng
+    assert clone.deck_handler.rng is rng
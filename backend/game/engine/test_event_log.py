@@ -0,0 +1,70 @@
+import pytest
+
+from game.engine.board import BoardGame
+from game.engine.event_log import encode_actions, decode_actions, snapshot_delta, apply_snapshot_delta, \
+    replay_deltas
+from game.engine.turn import RollAction, RerollAction, ResolveAction, BuyAction, SweepAction, YieldAction, \
+    EndTurnAction
+from game.player.player import Player
+from game.values.exceptions import IllegalActionException
+
+
+@pytest.fixture
+def game():
+    game = BoardGame(7)
+    for username in ["alice", "bob", "carol"]:
+        game.add_player(Player(username))
+    game.start_game()
+    return game
+
+
+def test_actions_round_trip():
+    actions = [RollAction("alice"), RerollAction("alice", [0, 3, 5]), ResolveAction("alice"), BuyAction("alice", 2),
+               SweepAction("alice"), YieldAction("bob", True), YieldAction("carol", False), EndTurnAction("alice")]
+
+    assert decode_actions(encode_actions(actions)) == actions
+    assert decode_actions(encode_actions([])) == []
+
+
+@pytest.mark.parametrize("old, new", [(b"abcdef", b"abcdef"), (b"abcdef", b"abXYef"), (b"abcdef", b"abcdefgh"),
+                                      (b"abcdef", b"ef"), (b"", b"abc"), (b"aaaa", b"aa")])
+def test_delta_turns_old_into_new(old, new):
+    assert apply_snapshot_delta(old, snapshot_delta(old, new)) == new
+
+
+def test_deltas_are_smaller_than_snapshots(game):
+    before = game.to_bytes()
+    game.players.players[1].update_health_by(-2)
+
+    delta = snapshot_delta(before, game.to_bytes())
+
+    assert len(delta) < len(before) // 4
+
+
+def test_replayed_deltas_recover_the_board(game):
+    snapshot = game.to_bytes()
+    deltas = []
+    previous = snapshot
+    for action in [RollAction("alice"), ResolveAction("alice"), EndTurnAction("alice"), RollAction("bob")]:
+        game.apply(action)
+        current = game.to_bytes()
+        deltas.append(snapshot_delta(previous, current))
+        previous = current
+
+    recovered = BoardGame.from_bytes(replay_deltas(snapshot, deltas))
+
+    assert recovered.to_bytes() == game.to_bytes()
+    assert recovered.players.current_player.username == "bob"
+    assert recovered.dice_handler.dice_values == game.dice_handler.dice_values
+
+
+def test_action_listener_hears_applied_actions_only(game):
+    actions = []
+    game.action_listener = lambda action, words_drawn: actions.append((action, words_drawn))
+
+    words_drawn = game.rng.words_drawn
+    game.apply(RollAction("alice"))
+    with pytest.raises(IllegalActionException):
+        game.apply(RollAction("alice"))
+
+    assert actions == [(RollAction("alice"), words_drawn)]
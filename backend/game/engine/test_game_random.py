@@ -0,0 +1,54 @@
+import copy
+import pickle
+
+import pytest
+
+from game.engine.game_random import GameRandom
+
+
+def test_same_seed_same_draws():
+    assert [GameRandom(7).random() for _ in range(3)] == [GameRandom(7).random() for _ in range(3)]
+
+
+def test_draws_match_random_with_the_same_seed():
+    import random
+    game_random, reference = GameRandom(11), random.Random(11)
+    deck, reference_deck = list(range(20)), list(range(20))
+    game_random.shuffle(deck)
+    reference.shuffle(reference_deck)
+    assert deck == reference_deck
+    assert game_random.choice("abcdef") == reference.choice("abcdef")
+
+
+def test_restore_continues_where_the_game_stopped():
+    game_random = GameRandom(1234)
+    game_random.shuffle(list(range(40)))
+    for _ in range(25):
+        game_random.choice([True, False])
+        game_random.random()
+
+    restored = GameRandom.restore(game_random.initial_seed, game_random.words_drawn)
+
+    assert [restored.randint(1, 6) for _ in range(20)] == [game_random.randint(1, 6) for _ in range(20)]
+
+
+def test_games_without_a_seed_get_one():
+    first, second = GameRandom(), GameRandom()
+    assert first.initial_seed is not None
+    assert first.initial_seed != second.initial_seed
+    assert GameRandom.restore(first.initial_seed, 0).random() == first.random()
+
+
+def test_copies_keep_seed_and_position():
+    game_random = GameRandom(5)
+    game_random.random()
+    for clone in (copy.deepcopy(game_random), pickle.loads(pickle.dumps(game_random))):
+        assert clone.initial_seed == 5
+        assert clone.words_drawn == game_random.words_drawn
+        assert clone.getstate() == game_random.getstate()
+
+
+@pytest.mark.parametrize("seed", [-1, 2 ** 64, "seed", 1.5])
+def test_rejects_seeds_a_snapshot_can_not_store(seed):
+    with pytest.raises(ValueError):
+        GameRandom(seed)
@@ -0,0 +1,85 @@
+import itertools
+import pickle
+
+import pytest
+
+from game.cards.discard_cards.energy_manipulation_cards.energize import Energize
+from game.cards.keep_cards.energy_manipulation_cards.solar_powered import SolarPowered
+from game.deck.deck_handler import DeckHandler
+from game.dice.dice import DieValue
+from game.dice.dice_handler import DiceHandler
+from game.engine.board import BoardGame
+from game.engine.player_queue import GamePlayers
+from game.player.player import Player
+from game.values.locations import Locations
+from game.values.status import Status
+from game.values.turn_phase import TurnPhase
+
+
+def legacy(cls, **fields):
+    # an object laid out as the game classes were when boards were pickled
+    obj = cls.__new__(cls)
+    obj.__dict__.update(fields)
+    return obj
+
+
+def legacy_player(username, **fields):
+    player = dict(username=username, monster_name=None, maximum_health=10, current_health=10,
+                  location=Locations.OUTSIDE, is_alive=True, victory_points=0, energy=0, cards=[],
+                  allowed_to_yield=False, gets_bonus_turn=False, newly_dead=False)
+    player.update(fields)
+    return legacy(Player, **player)
+
+
+@pytest.fixture
+def pickled_board():
+    alice = legacy_player('alice', monster_name='Godzilla', current_health=7, location=Locations.TOKYO,
+                          victory_points=4, energy=3, cards=[SolarPowered()])
+    bob = legacy_player('bob')
+    player_cycle = itertools.cycle([alice, bob])
+    next(player_cycle)
+    next(player_cycle)
+    players = legacy(GamePlayers, players=[alice, bob], current_player=bob, player_cycle=player_cycle)
+    dice_handler = legacy(DiceHandler, dice_values=[DieValue.ONE, DieValue.ATTACK, DieValue.ENERGY],
+                          re_rolls_left=1)
+    board = legacy(BoardGame, players=players, status=Status.ACTIVE, winner=None, deck_handler=legacy(DeckHandler),
+                   dice_handler=dice_handler)
+    return pickle.dumps(board, protocol=3)
+
+
+def test_reads_a_pickled_board(pickled_board):
+    board = BoardGame.from_bytes(pickled_board)
+
+    alice, bob = board.players.players
+    assert (alice.username, alice.monster_name, alice.current_health, alice.victory_points, alice.energy) == \
+        ('alice', 'Godzilla', 7, 4, 3)
+    assert alice.location == Locations.TOKYO
+    assert [card.name for card in alice.cards] == [SolarPowered().name]
+    assert board.players.current_player is bob
+    assert board.status == Status.ACTIVE
+    assert board.turn_phase == TurnPhase.RE_ROLL
+    assert board.dice_handler.dice_values == [DieValue.ONE, DieValue.ATTACK, DieValue.ENERGY]
+    assert board.dice_handler.re_rolls_left == 1
+
+
+def test_cards_held_are_left_out_of_the_new_deck(pickled_board):
+    board = BoardGame.from_bytes(pickled_board)
+
+    piles = list(board.deck_handler.draw_pile) + board.deck_handler.store
+    assert SolarPowered() not in piles
+    assert Energize() in piles
+    assert len(board.deck_handler.store) == 3
+
+
+def test_turn_order_goes_on_after_the_current_player(pickled_board):
+    board = BoardGame.from_bytes(pickled_board)
+
+    board.players.get_next_player()
+
+    assert board.players.current_player.username == 'alice'
+
+
+def test_converted_board_round_trips(pickled_board):
+    board = BoardGame.from_bytes(pickled_board)
+
+    assert BoardGame.from_bytes(board.to_bytes()).to_bytes() == board.to_bytes()
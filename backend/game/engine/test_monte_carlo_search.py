@@ -0,0 +1,123 @@
+import pytest
+
+from game.dice.dice import DieValue
+from game.engine.monte_carlo_search import MonteCarloSearch, ReRollDecision, YieldDecision, search
+from game.engine.simulation import FinalStrategy, PointsStrategy, SimulationGame, NOBODY
+from game.engine.terminal_board import TerminalBoardGame
+from game.player.ai_players.attack_ai_player import Attack_AI_Player
+from game.player.ai_players.mcts_ai_player import MCTS_AI_Player
+from game.player.ai_players.points_ai_player import Points_AI_Player
+from game.values import constants
+
+
+def two_player_game(seed=0):
+    return SimulationGame([FinalStrategy(), PointsStrategy()], seed=seed)
+
+
+def test_clone_does_not_touch_the_game():
+    game = two_player_game()
+    clone = game.clone()
+    clone.play()
+
+    assert game.winner == NOBODY
+    assert game.health == [constants.DEFAULT_HEALTH] * 2
+    assert game.victory_points == [0, 0]
+    assert clone.winner != NOBODY
+
+
+def test_re_roll_decision_tries_the_best_keeps():
+    decision = ReRollDecision([1, 1, 1, 5, 5, 6], 2)
+    actions = decision.actions()
+
+    assert actions[0] == (3, 0, 0, 0, 2, 1)
+    assert len(set(actions)) == len(actions)
+    # the stars table keeps the three ones, the energy table only the energy die
+    assert (3, 0, 0, 0, 0, 0) in actions
+    assert (0, 0, 0, 0, 0, 1) in actions
+    assert decision.dice_to_re_roll(actions[0]) == []
+    assert decision.dice_to_re_roll((0, 0, 0, 0, 0, 1)) == [0, 1, 2, 3, 4]
+
+
+def test_search_counts_every_iteration():
+    decision = ReRollDecision([1, 2, 3, 4, 5, 6], 1)
+    result = search(two_player_game(), 0, decision, iterations=200, seed=3)
+
+    assert sum(result.visits) == 200
+    assert all(wins <= visits for wins, visits in zip(result.wins, result.visits))
+
+
+def test_search_needs_a_budget():
+    with pytest.raises(ValueError):
+        search(two_player_game(), 0, YieldDecision())
+
+
+def test_same_seed_same_decision():
+    decision = ReRollDecision([4, 4, 4, 1, 2, 6], 2)
+    first = search(two_player_game(), 0, decision, iterations=100, seed=7)
+
+    assert search(two_player_game(), 0, decision, iterations=100, seed=7) == first
+
+
+def test_time_budget_stops_the_search():
+    result = search(two_player_game(), 0, YieldDecision(), time_budget=.05)
+
+    assert sum(result.visits) > 0
+
+
+def test_leaves_tokyo_when_staying_loses():
+    game = two_player_game()
+    game.tokyo = 1
+    game.allowed_to_yield = 1
+    game.health = [constants.DEFAULT_HEALTH, 1]
+
+    assert MonteCarloSearch(iterations=200).best_action(game, 1, YieldDecision(), seed=0) is True
+
+
+def test_keeps_the_winning_stars():
+    game = two_player_game()
+    game.victory_points = [constants.VICTORY_POINTS_TO_WIN - 3, 0]
+    decision = ReRollDecision([3, 3, 3, 5, 5, 6], 2)
+
+    kept = MonteCarloSearch(iterations=300).best_action(game, 0, decision, seed=0)
+    assert kept[2] == 3
+
+
+def test_workers_add_up_their_searches():
+    monte_carlo_search = MonteCarloSearch(iterations=40, workers=2)
+    try:
+        result = monte_carlo_search.run(two_player_game(), 0, YieldDecision(), seed=1)
+    finally:
+        monte_carlo_search.close()
+
+    assert sum(result.visits) == 40
+
+
+def test_mcts_player_searches_from_the_board():
+    game_state = TerminalBoardGame(5)
+    player = MCTS_AI_Player(game_state.players, "MCTS AI Ada", iterations=50)
+    game_state.add_player(player)
+    game_state.add_player(Attack_AI_Player(game_state.players, "Attack AI Gandhi"))
+    game_state.add_player(Points_AI_Player(game_state.players, "Points AI Trump"))
+    game_state.start_game()
+    game_state.players.current_player = player
+    player.victory_points = constants.VICTORY_POINTS_TO_WIN - 3
+
+    dice = [DieValue.THREE, DieValue.THREE, DieValue.THREE, DieValue.ATTACK, DieValue.HEAL, DieValue.ENERGY]
+    to_re_roll = player.choose_dice_to_re_roll(dice, re_rolls_left=1)
+
+    assert not {0, 1, 2} & set(to_re_roll)
+    assert player.choose_dice_to_re_roll(dice, re_rolls_left=0) == []
+
+
+def test_mcts_player_built_without_a_queue_plays_the_game_it_joins():
+    game_state = TerminalBoardGame(5)
+    player = MCTS_AI_Player(None, "MCTS AI Ada", iterations=20)
+    with pytest.raises(ValueError):
+        player.decide_to_yield()
+
+    game_state.add_player(player)
+    game_state.add_player(Attack_AI_Player(None, "Attack AI Gandhi"))
+    game_state.start_game()
+
+    assert player.player_queue is game_state.players
+    assert player.decide_to_yield() in (True, False)
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from game.engine.player_queue import GamePlayers
@@ -107,3 +109,97 @@ def test_if_not_last_player_alive():
     player_queue.add_player_to_game(player2)
     assert player_queue.is_last_player_alive(player2) is False
 
+
+
+def test_next_player_skips_dead_players():
+    players = [Player(str(i)) for i in range(4)]
+    player_queue = GamePlayers()
+    for player in players:
+        player_queue.add_player_to_game(player)
+    player_queue.set_player_order()
+    player_queue.get_current_player()
+    players[1].update_health_by(-100)
+    players[2].is_alive = False
+
+    player_queue.get_next_player()
+    assert player_queue.current_player is players[3]
+    player_queue.get_next_player()
+    assert player_queue.current_player is players[0]
+
+
+def test_alive_count_follows_deaths():
+    players = [Player(str(i)) for i in range(3)]
+    player_queue = GamePlayers()
+    for player in players:
+        player_queue.add_player_to_game(player)
+    assert player_queue.alive_count == 3
+
+    players[0].update_health_by(-100)
+    players[2].update_health_by(-100)
+    assert player_queue.alive_count == 1
+    assert player_queue.is_last_player_alive(players[1])
+    assert not player_queue.is_last_player_alive(players[0])
+
+
+def test_distance_to_turn():
+    players = [Player(str(i)) for i in range(4)]
+    player_queue = GamePlayers()
+    for player in players:
+        player_queue.add_player_to_game(player)
+    player_queue.set_player_order()
+    player_queue.get_next_player()
+    player_queue.get_next_player()
+
+    assert [player_queue.distance_to_turn(player) for player in players] == [3, 0, 1, 2]
+
+
+def test_turn_order_is_plain_data():
+    players = [Player(str(i)) for i in range(3)]
+    player_queue = GamePlayers()
+    for player in players:
+        player_queue.add_player_to_game(player)
+    player_queue.set_player_order()
+    player_queue.get_next_player()
+
+    restored = pickle.loads(pickle.dumps(player_queue))
+    restored.players[1].is_alive = False
+    restored.get_next_player()
+
+    assert restored.current_player is restored.players[2]
+    assert restored.alive_count == 2
+
+
+def test_views_are_kept_until_something_changes():
+    players = [Player(str(i)) for i in range(4)]
+    player_queue = GamePlayers()
+    for player in players:
+        player_queue.add_player_to_game(player)
+    player_queue.set_player_order()
+    player_queue.get_current_player()
+
+    others = player_queue.get_all_alive_players_minus_current_player()
+    assert player_queue.get_all_alive_players_minus_current_player() is others
+    assert player_queue.get_alive_players() is player_queue.get_alive_players()
+    assert others == players[1:]
+
+
+def test_views_follow_deaths_moves_and_turns():
+    players = [Player(str(i)) for i in range(4)]
+    player_queue = GamePlayers()
+    for player in players:
+        player_queue.add_player_to_game(player)
+    player_queue.set_player_order()
+    player_queue.get_current_player()
+    assert player_queue.get_count_in_tokyo_ignore_current_player() == 0
+
+    players[2].move_to_tokyo()
+    assert player_queue.get_count_in_tokyo_ignore_current_player() == 1
+
+    players[3].update_health_by(-100)
+    assert player_queue.get_alive_players() == players[:3]
+    assert player_queue.get_all_alive_players_minus_current_player() == players[1:3]
+
+    player_queue.get_next_player()
+    player_queue.get_next_player()
+    assert player_queue.get_all_alive_players_minus_current_player() == players[:2]
+    assert player_queue.get_count_in_tokyo_ignore_current_player() == 0
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+import game.dice.dice as dice
+from game.dice.dice import DieValue
+from game.engine.board import BoardGame
+from game.engine.replay import ActionLog, GameReplay, record_game, replay_game, state_hash
+from game.engine.turn import RollAction
+from game.player.ai_players.attack_ai_player import Attack_AI_Player
+from game.player.ai_players.chaos_ai_player import Chaos_AI_Player
+from game.player.ai_players.final_ai_player import Final_AI_Player
+from game.player.ai_players.points_ai_player import Points_AI_Player
+from game.values.exceptions import ReplayDivergenceException
+from run_offline_game import run_game
+
+
+@pytest.fixture(autouse=True)
+def real_dice(monkeypatch):
+    # dice_handler_test swaps dice.roll for a Mock when it is collected
+    monkeypatch.setattr(dice, "roll", lambda rng=None: (rng or random).choice(list(DieValue)))
+
+
+def recorded_game(seed):
+    board = BoardGame(seed)
+    # the Chaos AI draws from the game's generator between actions
+    board.add_player(Chaos_AI_Player(board.players, "CHAOS AI George"))
+    board.add_player(Final_AI_Player(board.players, "Final AI Bob"))
+    board.add_player(Attack_AI_Player(board.players, "Attack AI Gandhi"))
+    board.add_player(Points_AI_Player(board.players, "Points AI Trump"))
+    winner, log = record_game(board, run_game)
+    return board, winner, log
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_replay_ends_like_the_recorded_game(seed):
+    board, winner, log = recorded_game(seed)
+
+    replayed = replay_game(log)
+
+    assert replayed.winner.username == winner.username
+    assert state_hash(replayed) == state_hash(board)
+    assert board.action_listener is None
+
+
+def test_log_round_trips_through_json(tmp_path):
+    board, winner, log = recorded_game(1)
+    path = str(tmp_path / "game.json")
+    log.save(path)
+
+    loaded = ActionLog.load(path)
+
+    assert loaded.actions == log.actions
+    assert loaded.checkpoints == log.checkpoints
+    assert state_hash(replay_game(loaded)) == state_hash(board)
+
+
+def test_jumps_to_the_start_of_a_turn():
+    board, winner, log = recorded_game(2)
+    replay = GameReplay(log)
+
+    replay.run_to_turn(4)
+
+    assert replay.turn == 4
+    third_turn_end = sorted(log.checkpoints)[2]
+    assert replay.played == third_turn_end
+    assert state_hash(replay.board) == log.checkpoints[third_turn_end]
+    assert type(log.actions[replay.played][1]) is RollAction
+
+
+def test_diverging_replay_is_reported():
+    board, winner, log = recorded_game(3)
+    first_turn_end = min(log.checkpoints)
+    log.checkpoints[first_turn_end] = "0" * 16
+
+    with pytest.raises(ReplayDivergenceException):
+        replay_game(log)
+    assert replay_game(log, verify=False).winner.username == winner.username
@@ -0,0 +1,122 @@
+import copy
+import random
+
+import pytest
+
+import game.dice.dice as dice
+from game.dice.dice import DieValue
+from game.engine.game_random import GameRandom
+from game.engine.simulation import SimulationGame, SimulationStrategy, simulate_games, strategy_for_player, \
+    FinalStrategy, NOBODY
+from game.engine.terminal_board import TerminalBoardGame
+from game.player.ai_players.attack_ai_player import Attack_AI_Player
+from game.player.ai_players.chaos_ai_player import Chaos_AI_Player
+from game.player.ai_players.final_ai_player import Final_AI_Player
+from game.player.ai_players.points_ai_player import Points_AI_Player
+from game.player.player import Player
+from game.values import constants
+from run_offline_game import run_game
+
+
+@pytest.fixture(autouse=True)
+def players():
+    return [Final_AI_Player(None, "Final AI Bob", passiveness=.3),
+            Chaos_AI_Player(None, "CHAOS AI George"),
+            Attack_AI_Player(None, "Attack AI Gandhi"),
+            Points_AI_Player(None, "Points AI Trump")]
+
+
+@pytest.fixture
+def real_dice(monkeypatch):
+    # dice_handler_test swaps dice.roll for a Mock when it is collected
+    monkeypatch.setattr(dice, "roll", lambda rng=None: (rng or random).choice(list(DieValue)))
+
+
+class AlwaysKeep(SimulationStrategy):
+    def choose_dice_to_re_roll(self, game, seat, dice, re_rolls_left):
+        return []
+
+
+def test_plays_the_same_games_as_run_game(players, real_dice):
+    simulation = SimulationGame.from_players(players)
+    for seed in range(50):
+        game_state = TerminalBoardGame(seed)
+        for player in copy.deepcopy(players):
+            player.player_queue = game_state.players
+            game_state.add_player(player)
+        # pick up the board's generator after the deck shuffle
+        simulation.reset(rng=GameRandom.restore(seed, game_state.rng.words_drawn))
+        winner = run_game(game_state)
+
+        simulation.play()
+
+        assert simulation.winner_username == winner.username
+        assert simulation.victory_points == [player.victory_points for player in game_state.players.players]
+        assert simulation.health == [player.current_health for player in game_state.players.players]
+
+
+def test_same_seed_same_game(players):
+    simulation = SimulationGame.from_players(players, seed=42)
+    simulation.play()
+    first = (simulation.winner, simulation.turns, simulation.victory_points, simulation.health)
+
+    simulation.reset(42)
+    simulation.play()
+    assert (simulation.winner, simulation.turns, simulation.victory_points, simulation.health) == first
+
+
+def test_reset_starts_a_new_game(players):
+    simulation = SimulationGame.from_players(players, seed=1)
+    simulation.play()
+    simulation.reset(2)
+
+    assert simulation.winner == NOBODY
+    assert simulation.tokyo == NOBODY
+    assert simulation.current == 0
+    assert simulation.turns == 0
+    assert simulation.health == [constants.DEFAULT_HEALTH] * 4
+    assert simulation.victory_points == [0] * 4
+    assert all(simulation.alive)
+
+
+def test_simulate_games_counts_every_game(players):
+    win_counts = simulate_games(players, 30, seed=7)
+    assert sum(win_counts.values()) == 30
+    assert set(win_counts) <= {player.username for player in players}
+    assert simulate_games(players, 30, seed=7) == win_counts
+
+
+def test_killed_monster_is_out_of_the_game():
+    simulation = SimulationGame([AlwaysKeep(), AlwaysKeep()], seed=3)
+    simulation.health[1] = 1
+    simulation.tokyo = 0
+    simulation.resolve_dice(0, [4, 1, 2, 3, 5, 6])
+    assert not simulation.alive[1]
+    assert simulation.alive_count == 1
+
+
+def test_attacking_empty_tokyo_takes_it():
+    simulation = SimulationGame([AlwaysKeep(), AlwaysKeep(), AlwaysKeep()])
+    simulation.resolve_dice(0, [4, 4, 1, 2, 5, 6])
+    assert simulation.tokyo == 0
+    assert simulation.victory_points[0] == 1
+    assert simulation.energy[0] == 1
+
+
+def test_attacked_tokyo_monster_may_yield():
+    simulation = SimulationGame([AlwaysKeep(), AlwaysKeep()])
+    simulation.tokyo = 1
+    simulation.resolve_dice(0, [4, 4, 1, 2, 5, 6])
+    assert simulation.allowed_to_yield == 1
+    assert simulation.health[1] == constants.DEFAULT_HEALTH - 2
+
+
+def test_final_ai_keeps_its_passiveness():
+    strategy = strategy_for_player(Final_AI_Player(None, "final", passiveness=.8))
+    assert isinstance(strategy, FinalStrategy)
+    assert strategy.passiveness == .8
+
+
+def test_only_ai_players_can_be_simulated():
+    with pytest.raises(TypeError):
+        strategy_for_player(Player("human"))
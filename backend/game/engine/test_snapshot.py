@@ -0,0 +1,140 @@
+import pickle
+
+import pytest
+
+from game.cards import card_catalog
+from game.cards.keep_cards.energy_manipulation_cards.solar_powered import SolarPowered
+from game.cards.keep_cards.health_manipulation_cards.even_bigger import EvenBigger
+from game.dice.dice import DieValue
+from game.engine.board import BoardGame
+from game.player.player import Player
+from game.values.locations import Locations
+from game.values.status import Status
+
+
+@pytest.fixture(autouse=True)
+def game():
+    game = BoardGame()
+    for username in ["Awesome_player_1", "Please don't pickle me", "third"]:
+        game.add_player(Player(username))
+    game.start_game()
+    game.dice_handler.roll_initial(6, 2)
+    return game
+
+
+def test_round_trip_keeps_player_status(game):
+    player = game.players.players[1]
+    player.set_monster_name("Godzilla")
+    player.update_health_by(-3)
+    player.update_energy_by(7)
+    player.update_victory_points_by(4)
+    player.move_to_tokyo()
+    player.allowed_to_yield = True
+    player.add_card(EvenBigger())
+    player.add_card(SolarPowered())
+
+    restored = BoardGame.from_bytes(game.to_bytes()).players.players[1]
+
+    assert restored.username == "Please don't pickle me"
+    assert restored.monster_name == "Godzilla"
+    assert restored.current_health == player.current_health
+    assert restored.energy == 7
+    assert restored.victory_points == 4
+    assert restored.location == Locations.TOKYO
+    assert restored.allowed_to_yield
+    assert restored.is_alive
+    assert [type(card) for card in restored.cards] == [EvenBigger, SolarPowered]
+
+
+def test_round_trip_keeps_dice_and_status(game):
+    game.dice_handler.dice_values = [DieValue.ONE, DieValue.ATTACK, DieValue.HEAL,
+                                     DieValue.ENERGY, DieValue.TWO, DieValue.THREE]
+    game.dice_handler.re_rolls_left = 1
+
+    restored = BoardGame.from_bytes(game.to_bytes())
+
+    assert restored.status == Status.ACTIVE
+    assert restored.dice_handler.dice_values == game.dice_handler.dice_values
+    assert restored.dice_handler.re_rolls_left == 1
+    assert restored.winner is None
+
+
+def test_round_trip_keeps_turn_order(game):
+    game.get_next_player_turn()
+    restored = BoardGame.from_bytes(game.to_bytes())
+
+    assert restored.players.current_player == game.players.current_player
+    for _ in range(5):
+        assert restored.get_next_player_turn() == game.get_next_player_turn()
+
+
+def test_round_trip_keeps_winner(game):
+    winner = game.players.players[2]
+    winner.update_victory_points_by(20)
+    game.check_if_winner(winner)
+
+    restored = BoardGame.from_bytes(game.to_bytes())
+
+    assert restored.status == Status.COMPLETED
+    assert restored.winner == winner
+
+
+def test_round_trip_keeps_deck_order(game):
+    draw_pile = [card.name for card in game.deck_handler.draw_pile]
+    store = [card.name for card in game.deck_handler.store]
+
+    restored = BoardGame.from_bytes(game.to_bytes())
+
+    assert [card.name for card in restored.deck_handler.draw_pile] == draw_pile
+    assert [card.name for card in restored.deck_handler.store] == store
+
+
+def test_round_trip_keeps_random_state():
+    game = BoardGame(seed=99)
+    game.add_player(Player("first"))
+    game.start_game()
+    game.dice_handler.roll_initial(6, 2)
+
+    restored = BoardGame.from_bytes(game.to_bytes())
+
+    assert restored.seed == 99
+    game.dice_handler.re_roll_dice([0, 1, 2, 3, 4, 5])
+    restored.dice_handler.re_roll_dice([0, 1, 2, 3, 4, 5])
+    assert restored.dice_handler.dice_values == game.dice_handler.dice_values
+
+
+def test_restored_cards_are_the_shared_catalog_cards(game):
+    game.players.players[0].add_card(card_catalog.get_shared_card(EvenBigger))
+
+    restored = BoardGame.from_bytes(game.to_bytes())
+
+    assert restored.players.players[0].cards[0] is card_catalog.get_shared_card(EvenBigger)
+    assert all(card is card_catalog.get_card(card_catalog.get_card_id(card)) for card in restored.deck_handler.store)
+
+
+def test_snapshot_before_game_starts():
+    game = BoardGame()
+    game.add_player(Player("waiting"))
+
+    restored = BoardGame.from_bytes(game.to_bytes())
+
+    assert restored.status == Status.SETUP
+    assert restored.players.current_player is None
+    restored.start_game()
+    assert restored.players.get_current_player().username == "waiting"
+
+
+def test_snapshot_is_smaller_than_pickle(game):
+    assert len(game.to_bytes()) < len(pickle.dumps(game))
+
+
+def test_rejects_data_that_is_not_a_snapshot():
+    with pytest.raises(ValueError):
+        BoardGame.from_bytes(b"not a board")
+
+
+def test_rejects_unknown_snapshot_version(game):
+    data = bytearray(game.to_bytes())
+    data[3] = 99
+    with pytest.raises(ValueError):
+        BoardGame.from_bytes(bytes(data))
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from game.engine.simulation import simulate_games
+from game.engine.tournament import Scenario, run_tournament, iter_tournament, wilson_interval
+from game.player.ai_players.attack_ai_player import Attack_AI_Player
+from game.player.ai_players.chaos_ai_player import Chaos_AI_Player
+from game.player.ai_players.final_ai_player import Final_AI_Player
+
+
+@pytest.fixture(autouse=True)
+def scenarios():
+    final_ai = Final_AI_Player(None, "Final AI Bob")
+    return [Scenario("vs chaos", [final_ai, Chaos_AI_Player(None, "CHAOS AI George")]),
+            Scenario("vs attack", [final_ai, Attack_AI_Player(None, "Attack AI Gandhi")])]
+
+
+def test_wilson_interval_contains_the_win_rate():
+    low, high = wilson_interval(30, 100)
+    assert low < .3 < high
+    assert wilson_interval(0, 10)[0] == 0.0
+    assert wilson_interval(10, 10)[1] == 1.0
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_results_do_not_depend_on_sharding(scenarios):
+    results = run_tournament(scenarios, 40, seed=3, shard_size=7, workers=2)
+    for scenario in scenarios:
+        assert results[scenario.title].win_counts == simulate_games(scenario.players, 40, seed=3)
+        assert results[scenario.title].games == 40
+
+
+def test_shards_are_streamed(scenarios):
+    shards = list(iter_tournament(scenarios, 20, shard_size=10, workers=2))
+    assert sorted((shard.title, shard.shard) for shard in shards) == \
+        [("vs attack", 0), ("vs attack", 1), ("vs chaos", 0), ("vs chaos", 1)]
+
+
+def test_resume_skips_finished_shards(scenarios, tmp_path):
+    checkpoint_path = str(tmp_path / "sweep.json")
+    first_run = list(iter_tournament(scenarios[:1], 20, shard_size=10, workers=1, checkpoint_path=checkpoint_path))
+    assert len(first_run) == 2
+
+    checkpoint = json.loads(open(checkpoint_path).read())
+    del checkpoint["shards"]["vs chaos#1"]
+    with open(checkpoint_path, "w") as checkpoint_file:
+        json.dump(checkpoint, checkpoint_file)
+
+    played = []
+    results = run_tournament(scenarios[:1], 20, shard_size=10, workers=1, checkpoint_path=checkpoint_path,
+                             on_shard=played.append)
+    assert [shard.shard for shard in played] == [1]
+    assert results["vs chaos"].win_counts == simulate_games(scenarios[0].players, 20, seed=0)
+
+
+def test_checkpoint_from_other_settings_is_rejected(scenarios, tmp_path):
+    checkpoint_path = str(tmp_path / "sweep.json")
+    run_tournament(scenarios, 10, workers=1, checkpoint_path=checkpoint_path)
+    with pytest.raises(ValueError):
+        run_tournament(scenarios, 10, seed=1, workers=1, checkpoint_path=checkpoint_path)
+
+
+def test_titles_must_be_unique(scenarios):
+    with pytest.raises(ValueError):
+        run_tournament([scenarios[0], scenarios[0]], 10)
+
+
+def test_win_rate_and_confidence_interval(scenarios):
+    result = run_tournament(scenarios[:1], 50, workers=1)["vs chaos"]
+    rate = result.win_rate("Final AI Bob")
+    low, high = result.confidence_interval("Final AI Bob")
+    assert low <= rate <= high
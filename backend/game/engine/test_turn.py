@@ -0,0 +1,115 @@
+import pytest
+
+from game.dice.dice import DieValue
+from game.engine.board import BoardGame
+from game.engine.turn import RollAction, RerollAction, ResolveAction, BuyAction, SweepAction, YieldAction, \
+    EndTurnAction
+from game.player.player import Player
+from game.values import constants
+from game.values.exceptions import IllegalActionException, InsufficientFundsException
+from game.values.status import Status
+from game.values.turn_phase import TurnPhase
+
+ATTACK_DICE = [DieValue.ATTACK] * 2 + [DieValue.ONE, DieValue.TWO, DieValue.THREE, DieValue.HEAL]
+
+
+@pytest.fixture
+def game():
+    game = BoardGame(3)
+    for username in ["alice", "bob", "carol"]:
+        game.add_player(Player(username))
+    game.start_game()
+    return game
+
+
+def test_a_turn_goes_through_every_phase(game):
+    assert game.turn_phase == TurnPhase.ROLL
+
+    dice = game.apply(RollAction("alice"))
+    assert len(dice) == constants.DEFAULT_DICE_TO_ROLL
+    assert game.turn_phase == TurnPhase.RE_ROLL
+
+    game.apply(RerollAction("alice", [0, 1]))
+    assert game.dice_handler.re_rolls_left == constants.DEFAULT_RE_ROLL_COUNT - 1
+
+    game.dice_handler.dice_values = ATTACK_DICE
+    assert game.apply(ResolveAction("alice")) == []
+    assert game.turn_phase == TurnPhase.RESOLVED
+    assert game.players.players[0].is_in_tokyo()
+
+    assert game.apply(EndTurnAction("alice")).username == "bob"
+    assert game.turn_phase == TurnPhase.ROLL
+
+
+def test_only_the_current_player_plays(game):
+    with pytest.raises(IllegalActionException):
+        game.apply(RollAction("bob"))
+    assert game.turn_phase == TurnPhase.ROLL
+    assert game.dice_handler.dice_values == []
+
+
+@pytest.mark.parametrize("action", [RerollAction("alice", [0]), ResolveAction("alice"), EndTurnAction("alice"),
+                                    YieldAction("bob", True)])
+def test_actions_out_of_phase_are_refused(game, action):
+    with pytest.raises(IllegalActionException):
+        game.apply(action)
+
+
+def test_turn_can_not_end_before_the_dice_are_resolved(game):
+    game.apply(RollAction("alice"))
+    with pytest.raises(IllegalActionException):
+        game.apply(EndTurnAction("alice"))
+
+
+def test_attacked_player_in_tokyo_yields(game):
+    bob = game.players.players[1]
+    bob.move_to_tokyo()
+    game.apply(RollAction("alice"))
+    game.dice_handler.dice_values = ATTACK_DICE
+
+    assert game.apply(ResolveAction("alice")) == [bob]
+    with pytest.raises(IllegalActionException):
+        game.apply(YieldAction("carol", True))
+    assert game.apply(YieldAction("bob", True)) == []
+
+    assert not bob.is_in_tokyo()
+    assert game.players.players[0].is_in_tokyo()
+    with pytest.raises(IllegalActionException):
+        game.apply(YieldAction("bob", False))
+
+
+def test_buying_and_sweeping_need_energy(game):
+    game.apply(RollAction("alice"))
+    with pytest.raises(InsufficientFundsException):
+        game.apply(BuyAction("alice", 0))
+    with pytest.raises(InsufficientFundsException):
+        game.apply(SweepAction("alice"))
+
+    game.players.players[0].update_energy_by(constants.SWEEP_CARD_STORE_COST)
+    store = game.deck_handler.store.copy()
+    assert game.apply(SweepAction("alice")) == store
+
+
+def test_winning_ends_the_game(game):
+    game.apply(RollAction("alice"))
+    game.players.players[0].update_victory_points_by(constants.VICTORY_POINTS_TO_WIN)
+    game.dice_handler.dice_values = ATTACK_DICE
+    game.apply(ResolveAction("alice"))
+
+    assert game.apply(EndTurnAction("alice")) is None
+    assert game.status == Status.COMPLETED
+    assert game.turn_phase == TurnPhase.GAME_OVER
+    assert game.winner.username == "alice"
+    with pytest.raises(IllegalActionException):
+        game.apply(RollAction("bob"))
+
+
+def test_snapshots_keep_the_turn_phase(game):
+    game.apply(RollAction("alice"))
+    game.dice_handler.dice_values = ATTACK_DICE
+    game.apply(ResolveAction("alice"))
+
+    restored = BoardGame.from_bytes(game.to_bytes())
+
+    assert restored.turn_phase == TurnPhase.RESOLVED
+    assert restored.apply(EndTurnAction("alice")).username == "bob"
@@ -0,0 +1,143 @@
+"""
+Parallel AI tournaments on top of the headless simulation engine.
+
+Every scenario is split into shards of consecutive games that run on a process pool. Game i of a scenario is always
+seeded with seed + i, whatever the shard size or worker count, so a sweep gives the same results on any machine.
+Finished shards are streamed back as they complete and, when a checkpoint path is given, recorded there so an
+interrupted sweep picks up where it stopped.
+"""
+
+import json
+import math
+import os
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from game.engine.simulation import simulate_games
+
+DEFAULT_SHARD_SIZE = 500
+CONFIDENCE_Z = 1.96
+
+Scenario = namedtuple('Scenario', ['title', 'players'])
+ShardResult = namedtuple('ShardResult', ['title', 'shard', 'win_counts'])
+
+
+def wilson_interval(wins, games, z=CONFIDENCE_Z):
+    """Wilson score interval of a win rate, 95% by default."""
+    if games == 0:
+        return 0.0, 1.0
+    rate = wins / games
+    denominator = 1 + z * z / games
+    centre = (rate + z * z / (2 * games)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+class ScenarioResult:
+    def __init__(self, title):
+        self.title = title
+        self.win_counts = Counter()
+
+    @property
+    def games(self):
+        return sum(self.win_counts.values())
+
+    def win_rate(self, username):
+        return self.win_counts[username] / self.games if self.games else 0.0
+
+    def confidence_interval(self, username, z=CONFIDENCE_Z):
+        return wilson_interval(self.win_counts[username], self.games, z)
+
+
+class TournamentCheckpoint:
+    """Win counts of finished shards, kept in a JSON file that is rewritten after every shard."""
+
+    def __init__(self, path, settings):
+        self.path = path
+        self.settings = settings
+        self.shards = {}
+        if path and os.path.exists(path):
+            with open(path) as checkpoint_file:
+                saved = json.load(checkpoint_file)
+            if saved['settings'] != settings:
+                raise ValueError("Checkpoint {} was written by a tournament with other settings".format(path))
+            self.shards = saved['shards']
+
+    @staticmethod
+    def key(title, shard):
+        return '{}#{}'.format(title, shard)
+
+    def __contains__(self, title_and_shard):
+        return self.key(*title_and_shard) in self.shards
+
+    def results(self):
+        for key, win_counts in self.shards.items():
+            title, shard = key.rsplit('#', 1)
+            yield ShardResult(title, int(shard), Counter(win_counts))
+
+    def record(self, result):
+        self.shards[self.key(result.title, result.shard)] = dict(result.win_counts)
+        if not self.path:
+            return
+        temporary_path = self.path + '.tmp'
+        with open(temporary_path, 'w') as checkpoint_file:
+            json.dump({'settings': self.settings, 'shards': self.shards}, checkpoint_file)
+        os.replace(temporary_path, self.path)
+
+
+def _play_shard(title, shard, players, first_game, count, seed):
+    return ShardResult(title, shard, simulate_games(players, count, seed + first_game))
+
+
+def _open_checkpoint(scenarios, games_per_scenario, seed, shard_size, checkpoint_path):
+    titles = [scenario.title for scenario in scenarios]
+    if len(set(titles)) != len(titles):
+        raise ValueError("Scenario titles must be unique")
+    return TournamentCheckpoint(checkpoint_path, {
+        'games_per_scenario': games_per_scenario, 'seed': seed, 'shard_size': shard_size, 'scenarios': titles})
+
+
+def _play_pending_shards(scenarios, games_per_scenario, seed, shard_size, workers, checkpoint):
+    pending = []
+    for scenario in scenarios:
+        for shard, first_game in enumerate(range(0, games_per_scenario, shard_size)):
+            if (scenario.title, shard) not in checkpoint:
+                count = min(shard_size, games_per_scenario - first_game)
+                pending.append((scenario.title, shard, scenario.players, first_game, count, seed))
+    if not pending:
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_play_shard, *shard) for shard in pending]
+        for future in as_completed(futures):
+            result = future.result()
+            checkpoint.record(result)
+            yield result
+
+
+def iter_tournament(scenarios, games_per_scenario, seed=0, shard_size=DEFAULT_SHARD_SIZE, workers=None,
+                    checkpoint_path=None):
+    """
+    Plays every scenario on a process pool and yields a ShardResult for each shard as soon as it finishes.
+    Shards already recorded in the checkpoint are not played again and not yielded.
+    """
+    checkpoint = _open_checkpoint(scenarios, games_per_scenario, seed, shard_size, checkpoint_path)
+    yield from _play_pending_shards(scenarios, games_per_scenario, seed, shard_size, workers, checkpoint)
+
+
+def run_tournament(scenarios, games_per_scenario, seed=0, shard_size=DEFAULT_SHARD_SIZE, workers=None,
+                   checkpoint_path=None, on_shard=None):
+    """
+    Plays every scenario and returns a ScenarioResult per title, including shards finished by an earlier run with
+    the same checkpoint. on_shard is called with each newly played ShardResult as it streams in.
+    """
+    checkpoint = _open_checkpoint(scenarios, games_per_scenario, seed, shard_size, checkpoint_path)
+    results = {scenario.title: ScenarioResult(scenario.title) for scenario in scenarios}
+    for result in checkpoint.results():
+        results[result.title].win_counts.update(result.win_counts)
+
+    for result in _play_pending_shards(scenarios, games_per_scenario, seed, shard_size, workers, checkpoint):
+        results[result.title].win_counts.update(result.win_counts)
+        if on_shard:
+            on_shard(result)
+    return results
@@ -0,0 +1,132 @@
+"""
+The turn of a game as a state machine driven by actions.
+
+Every change a turn makes to a board goes through apply_action, from the websocket consumers and from run_game
+alike. The board's turn_phase says which actions can be played:
+
+    ROLL      RollAction (the current player rolls, turn start cards take effect)
+    RE_ROLL   RerollAction, ResolveAction, BuyAction, SweepAction
+    RESOLVED  YieldAction (players attacked in Tokyo), BuyAction, SweepAction, EndTurnAction
+    GAME_OVER nothing
+
+Actions are named tuples holding the username of the player playing them. Only the current player plays actions
+other than YieldAction. An action that is not allowed raises IllegalActionException and leaves the board untouched;
+an action that is allowed returns what it did (see the handlers below).
+"""
+
+from collections import namedtuple
+
+from game.dice.dice_resolver import dice_resolution
+from game.values.exceptions import IllegalActionException
+from game.values.status import Status
+from game.values.turn_phase import TurnPhase
+
+RollAction = namedtuple('RollAction', ['username'])
+RerollAction = namedtuple('RerollAction', ['username', 'dice_indexes'])
+ResolveAction = namedtuple('ResolveAction', ['username'])
+BuyAction = namedtuple('BuyAction', ['username', 'store_index'])
+SweepAction = namedtuple('SweepAction', ['username'])
+YieldAction = namedtuple('YieldAction', ['username', 'leave_tokyo'])
+EndTurnAction = namedtuple('EndTurnAction', ['username'])
+
+
+def _roll(board, current_player, action):
+    """Returns the dice rolled."""
+    board.start_turn_actions(current_player, current_player.dice_allowed)
+    board.turn_phase = TurnPhase.RE_ROLL
+    return board.dice_handler.dice_values
+
+
+def _re_roll(board, current_player, action):
+    """Returns the dice after the re-roll. Raises ValueError without re-rolls left or with a bad index."""
+    return board.dice_handler.re_roll_dice(action.dice_indexes)
+
+
+def _resolve(board, current_player, action):
+    """Returns the players that may now yield Tokyo to the current player."""
+    dice_resolution(board.dice_handler.dice_values, current_player,
+                    board.players.get_all_alive_players_minus_current_player())
+    board.turn_phase = TurnPhase.RESOLVED
+    return _players_allowed_to_yield(board)
+
+
+def _buy(board, current_player, action):
+    """Returns the card bought. Raises InsufficientFundsException."""
+    return board.deck_handler.buy_card_from_store(action.store_index, current_player,
+                                                  board.players.get_all_alive_players_minus_current_player())
+
+
+def _sweep(board, current_player, action):
+    """Returns the cards swept out of the store. Raises InsufficientFundsException."""
+    swept = board.deck_handler.store.copy()
+    board.deck_handler.sweep_store(current_player)
+    return swept
+
+
+def _yield(board, current_player, action):
+    """Returns the players still to decide whether to yield Tokyo."""
+    player = board.players.get_player_by_username_from_alive(action.username)
+    if action.leave_tokyo:
+        board.yield_tokyo_to_current_player(player)
+    player.allowed_to_yield = False
+    return _players_allowed_to_yield(board)
+
+
+def _end_turn(board, current_player, action):
+    """
+    Returns the player whose turn it is next, None once the game is over. Players that have not decided whether to
+    yield Tokyo keep it.
+    """
+    board.post_roll_actions(current_player)
+    for player in board.players.get_alive_players():
+        if not board.is_game_active() or board.check_if_winner(player):
+            board.turn_phase = TurnPhase.GAME_OVER
+            return None
+    board.turn_phase = TurnPhase.ROLL
+    return board.get_next_player_turn()
+
+
+def _players_allowed_to_yield(board):
+    return [player for player in board.players.players if player.allowed_to_yield]
+
+
+ACTION_HANDLERS = {
+    RollAction: _roll,
+    RerollAction: _re_roll,
+    ResolveAction: _resolve,
+    BuyAction: _buy,
+    SweepAction: _sweep,
+    YieldAction: _yield,
+    EndTurnAction: _end_turn,
+}
+
+ALLOWED_ACTIONS = {
+    TurnPhase.ROLL: (RollAction,),
+    TurnPhase.RE_ROLL: (RerollAction, ResolveAction, BuyAction, SweepAction),
+    TurnPhase.RESOLVED: (YieldAction, BuyAction, SweepAction, EndTurnAction),
+    TurnPhase.GAME_OVER: (),
+}
+
+
+def check_action(board, action):
+    """Raises IllegalActionException when the action can not be played on the board now."""
+    action_type = type(action)
+    if action_type not in ACTION_HANDLERS:
+        raise IllegalActionException("{} is not a turn action".format(action_type.__name__))
+    if board.status != Status.ACTIVE:
+        raise IllegalActionException("The game is not in progress")
+    if action_type not in ALLOWED_ACTIONS[board.turn_phase]:
+        raise IllegalActionException("{} can not be played during {}".format(action_type.__name__,
+                                                                             board.turn_phase.name))
+    if action_type is YieldAction:
+        player = board.players.get_player_by_username_from_alive(action.username)
+        if player is None or not player.allowed_to_yield:
+            raise IllegalActionException("{} can not yield Tokyo".format(action.username))
+    elif board.players.current_player.username != action.username:
+        raise IllegalActionException("It is not {}'s turn".format(action.username))
+
+
+def apply_action(board, action):
+    """Plays action on board and returns its result, see the handlers."""
+    check_action(board, action)
+    return ACTION_HANDLERS[type(action)](board, board.players.current_player, action)
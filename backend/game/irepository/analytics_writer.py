@@ -0,0 +1,150 @@
+import atexit
+import logging
+import threading
+
+from django.db import close_old_connections, transaction
+
+from game.irepository.irepository_dice import IRepositoryDice
+from game.irepository.irepository_play import IRepositoryPlay
+from game.models import Dice, Play, User
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 5.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+class AnalyticsWriter:
+    """
+    Buffers the Dice and Play rows of the game rooms and writes them with bulk_create, off the request path.
+
+    save_dice, save_play_card_purchased and save_play_card_swept take the arguments of their IRepositoryDice and
+    IRepositoryPlay namesakes but only queue an unsaved row, stamped with the time of the call. A background flusher
+    writes the queued rows every flush_interval seconds, and as soon as batch_size rows are waiting. The User primary
+    key of every (room, username) is looked up once, by the flusher, and cached until forget_room(room).
+
+    Rows of users that do not exist are dropped with a warning. Without a flush_interval there is no flusher and a
+    full batch is written by the call that fills it. A batch that fails to be written goes back to the front of the
+    queue for the next flush, and its rows are dropped once they failed max_attempts times.
+    """
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self.__rows = []
+        self.__user_ids = {}
+        self.__lock = threading.Lock()
+        self.__flush_lock = threading.Lock()
+        self.__flusher = None
+        self.__wake_flusher = threading.Event()
+        self.__stop_flusher = threading.Event()
+
+    def __len__(self):
+        """Number of rows waiting to be written."""
+        return len(self.__rows)
+
+    def save_dice(self, username, room, *dice_fields):
+        self.__queue(username, room, IRepositoryDice.build_dice(None, *dice_fields))
+
+    def save_play_card_purchased(self, username, room, *play_fields):
+        self.__queue(username, room, IRepositoryPlay.build_play_card_purchased(None, *play_fields))
+
+    def save_play_card_swept(self, username, room, *play_fields):
+        self.__queue(username, room, IRepositoryPlay.build_play_card_swept(None, *play_fields))
+
+    def forget_room(self, room):
+        with self.__lock:
+            for key in [key for key in list(self.__user_ids) if key[0] == room]:
+                del self.__user_ids[key]
+
+    def __queue(self, username, room, row):
+        with self.__lock:
+            self.__rows.append((room, username, row, 0))
+            batch_full = len(self.__rows) >= self.batch_size
+        self.start_flusher()
+        if not batch_full:
+            return
+        if self.flush_interval is None:
+            self.flush()
+        else:
+            self.__wake_flusher.set()
+
+    def __user_id(self, room, username):
+        user_id = self.__user_ids.get((room, username))
+        if user_id is None:
+            user_id = User.objects.filter(username=username, game__room_name=room).values_list('pk', flat=True) \
+                .first()
+            if user_id is not None:
+                with self.__lock:
+                    self.__user_ids[(room, username)] = user_id
+        return user_id
+
+    def flush(self):
+        with self.__flush_lock:
+            with self.__lock:
+                rows, self.__rows = self.__rows, []
+            try:
+                self.__write(rows)
+            except Exception:
+                self.__requeue(rows)
+                raise
+
+    def __write(self, rows):
+        batches = {Dice: [], Play: []}
+        for room, username, row, failures in rows:
+            row.user_id = self.__user_id(room, username)
+            if row.user_id is None:
+                logging.warning('Dropping analytics of unknown user %s in room %s', username, room)
+                continue
+            batches[type(row)].append(row)
+        with transaction.atomic():
+            for model, batch in batches.items():
+                if batch:
+                    model.objects.bulk_create(batch, batch_size=self.batch_size)
+
+    def __requeue(self, rows):
+        retries = []
+        for room, username, row, failures in rows:
+            if failures + 1 >= self.max_attempts:
+                logging.error('Dropping analytics of user %s in room %s after %s failed writes', username, room,
+                              failures + 1)
+                continue
+            # the insert was rolled back, ids bulk_create may have set are not taken
+            row.pk = None
+            retries.append((room, username, row, failures + 1))
+        with self.__lock:
+            self.__rows[:0] = retries
+
+    def start_flusher(self):
+        if self.__flusher is not None or self.flush_interval is None:
+            return
+        with self.__lock:
+            if self.__flusher is not None:
+                return
+            self.__flusher = threading.Thread(target=self.__run_flusher, name='kot-analytics-flusher', daemon=True)
+            self.__flusher.start()
+        atexit.register(self.flush)
+
+    def stop_flusher(self):
+        if self.__flusher is None:
+            return
+        self.__stop_flusher.set()
+        self.__wake_flusher.set()
+        self.__flusher.join()
+        self.__flusher = None
+        self.__stop_flusher.clear()
+        self.flush()
+
+    def __run_flusher(self):
+        while not self.__stop_flusher.is_set():
+            self.__wake_flusher.wait(self.flush_interval)
+            self.__wake_flusher.clear()
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                # the batch was queued again for the next flush, analytics never hold up a game
+                logging.exception('Unable to write analytics')
+            finally:
+                close_old_connections()
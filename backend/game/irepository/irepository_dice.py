@@ -12,8 +12,17 @@ class IRepositoryDice:
         self.dice = None
 
     def save_dice(self, username, room, dice1, dice2, dice3, dice4, dice5, dice6, dice7, dice8, re_rolls_left, re_roll_selected_dice):
-        self.dice = Dice(
-            user=User.objects.get(username=username, game=Game.objects.get(room_name=room)),
+        self.dice = self.build_dice(User.objects.get(username=username, game=Game.objects.get(room_name=room)).id,
+                                    dice1, dice2, dice3, dice4, dice5, dice6, dice7, dice8, re_rolls_left,
+                                    re_roll_selected_dice)
+        self.dice.save()
+        return self.dice
+
+    @staticmethod
+    def build_dice(user_id, dice1, dice2, dice3, dice4, dice5, dice6, dice7, dice8, re_rolls_left, re_roll_selected_dice):
+        # unsaved row, see game.irepository.analytics_writer for batched saves
+        return Dice(
+            user_id=user_id,
             re_rolls_left=re_rolls_left,
             dice1=dice1,
             dice2=dice2,
@@ -25,8 +34,6 @@ class IRepositoryDice:
             dice8=dice8,
             re_roll_selected_dice=re_roll_selected_dice,
             date_created=datetime.datetime.now())
-        self.dice.save()
-        return self.dice
 
     def get_dice_by_id(self, dice_id):
         self.dice = Dice.objects.get(id=dice_id)
@@ -14,33 +14,49 @@ class IRepositoryPlay:
 
     def save_play_card_swept(self, username, room, card1, card1_type, card2, card2_type, card3, card3_type, location,
                              victory_points, energy, health):
-        self.play = Play(user=User.objects.get(username=username, game=Game.objects.get(room_name=room)),
-                         card1_swept=card1,
-                         card1_swept_type=card1_type,
-                         card2_swept=card2,
-                         card2_swept_type=card2_type,
-                         card3_swept=card3,
-                         card3_swept_type=card3_type,
-                         location=location,
-                         victory_points=victory_points,
-                         energy_cube=energy,
-                         health_points=health,
-                         date_created=datetime.datetime.now())
+        self.play = self.build_play_card_swept(User.objects.get(username=username,
+                                                                game=Game.objects.get(room_name=room)).id,
+                                               card1, card1_type, card2, card2_type, card3, card3_type, location,
+                                               victory_points, energy, health)
         self.play.save()
         return self.play
 
     def save_play_card_purchased(self, username, room, card, card_type, location, victory_points, energy, health):
-        self.play = Play(user=User.objects.get(username=username, game=Game.objects.get(room_name=room)),
-                         card_purchased=card,
-                         card_purchased_type=card_type,
-                         location=location,
-                         victory_points=victory_points,
-                         energy_cube=energy,
-                         health_points=health,
-                         date_created=datetime.datetime.now())
+        self.play = self.build_play_card_purchased(User.objects.get(username=username,
+                                                                    game=Game.objects.get(room_name=room)).id,
+                                                   card, card_type, location, victory_points, energy, health)
         self.play.save()
         return self.play
 
+    # unsaved rows, see game.irepository.analytics_writer for batched saves
+
+    @staticmethod
+    def build_play_card_swept(user_id, card1, card1_type, card2, card2_type, card3, card3_type, location,
+                              victory_points, energy, health):
+        return Play(user_id=user_id,
+                    card1_swept=card1,
+                    card1_swept_type=card1_type,
+                    card2_swept=card2,
+                    card2_swept_type=card2_type,
+                    card3_swept=card3,
+                    card3_swept_type=card3_type,
+                    location=location,
+                    victory_points=victory_points,
+                    energy_cube=energy,
+                    health_points=health,
+                    date_created=datetime.datetime.now())
+
+    @staticmethod
+    def build_play_card_purchased(user_id, card, card_type, location, victory_points, energy, health):
+        return Play(user_id=user_id,
+                    card_purchased=card,
+                    card_purchased_type=card_type,
+                    location=location,
+                    victory_points=victory_points,
+                    energy_cube=energy,
+                    health_points=health,
+                    date_created=datetime.datetime.now())
+
     def save_move_in_and_out_tokyo(self, username, room, location, victory_points, energy, health):
         self.play = Play(user=User.objects.get(username=username, game=Game.objects.get(room_name=room)),
                          location=location,
@@ -0,0 +1,139 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from game.dice.dice import DieValue
+from game.irepository.analytics_writer import AnalyticsWriter
+from game.irepository.irepository_game import IRepositoryGame
+from game.irepository.irepository_player import IRepositoryPlayer
+from game.models import Dice, Play
+from game.values.locations import Locations
+
+DICE = [DieValue.ONE, DieValue.TWO, DieValue.THREE, DieValue.ATTACK, DieValue.HEAL, DieValue.ENERGY, None, None]
+
+
+def save_dice(writer, username, room):
+    writer.save_dice(username, room, *DICE, 1, None)
+
+
+@pytest.fixture
+def room():
+    IRepositoryGame().save_game('Room1')
+    IRepositoryPlayer().save_player('Godzilla', 'Room1')
+    IRepositoryPlayer().save_player('Kong', 'Room1')
+    return 'Room1'
+
+
+@pytest.mark.django_db
+def test_rows_wait_for_a_flush(room):
+    writer = AnalyticsWriter(flush_interval=None)
+    with CaptureQueriesContext(connection) as queries:
+        save_dice(writer, 'Godzilla', room)
+        writer.save_play_card_purchased('Kong', room, '01', '1', Locations.TOKYO, 3, 2, 10)
+    assert len(queries) == 0
+    assert len(writer) == 2
+
+    writer.flush()
+
+    assert len(writer) == 0
+    dice = Dice.objects.get()
+    assert dice.user.username == 'Godzilla'
+    assert dice.dice4 == 'DieValue.ATTACK'
+    play = Play.objects.get()
+    assert play.user.username == 'Kong'
+    assert play.card_purchased == '01'
+
+
+@pytest.mark.django_db
+def test_users_are_looked_up_once_per_room(room):
+    writer = AnalyticsWriter(flush_interval=None)
+    for _ in range(3):
+        save_dice(writer, 'Godzilla', room)
+    writer.flush()
+
+    with CaptureQueriesContext(connection) as queries:
+        for _ in range(3):
+            save_dice(writer, 'Godzilla', room)
+            writer.save_play_card_swept('Godzilla', room, '01', '1', '02', '1', '03', '2', Locations.OUTSIDE, 1, 0, 9)
+        writer.flush()
+
+    # no user lookups, one bulk insert per model
+    statements = [query['sql'].split()[0] for query in queries.captured_queries]
+    assert statements.count('INSERT') == 2
+    assert 'SELECT' not in statements
+    assert Dice.objects.count() == 6
+    assert Play.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_full_batch_is_written(room):
+    writer = AnalyticsWriter(batch_size=3, flush_interval=None)
+    save_dice(writer, 'Godzilla', room)
+    save_dice(writer, 'Kong', room)
+    assert Dice.objects.count() == 0
+
+    save_dice(writer, 'Godzilla', room)
+
+    assert Dice.objects.count() == 3
+    assert len(writer) == 0
+
+
+@pytest.mark.django_db
+def test_unknown_users_are_dropped(room):
+    writer = AnalyticsWriter(flush_interval=None)
+    save_dice(writer, 'Nobody', room)
+    save_dice(writer, 'Godzilla', room)
+
+    writer.flush()
+
+    assert [dice.user.username for dice in Dice.objects.all()] == ['Godzilla']
+
+
+@pytest.mark.django_db(transaction=True)
+def test_flusher_takes_the_rows():
+    # rows of unknown users, nothing is written that would move the ids other tests expect
+    writer = AnalyticsWriter(batch_size=1, flush_interval=60)
+
+    save_dice(writer, 'Nobody', 'Room1')
+    writer.stop_flusher()
+
+    assert len(writer) == 0
+    assert Dice.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_failed_batch_is_queued_again(room, monkeypatch):
+    writer = AnalyticsWriter(flush_interval=None)
+    save_dice(writer, 'Godzilla', room)
+    save_dice(writer, 'Kong', room)
+
+    def bulk_create(*args, **kwargs):
+        raise IOError("database is locked")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Dice.objects, 'bulk_create', bulk_create)
+        with pytest.raises(IOError):
+            writer.flush()
+    save_dice(writer, 'Godzilla', room)
+    assert len(writer) == 3
+
+    writer.flush()
+
+    assert len(writer) == 0
+    assert [dice.user.username for dice in Dice.objects.order_by('pk')] == ['Godzilla', 'Kong', 'Godzilla']
+
+
+@pytest.mark.django_db
+def test_rows_are_dropped_after_max_attempts(room, monkeypatch):
+    writer = AnalyticsWriter(flush_interval=None, max_attempts=2)
+    save_dice(writer, 'Godzilla', room)
+
+    def bulk_create(*args, **kwargs):
+        raise IOError("database is locked")
+
+    monkeypatch.setattr(Dice.objects, 'bulk_create', bulk_create)
+    for _ in range(2):
+        with pytest.raises(IOError):
+            writer.flush()
+
+    assert len(writer) == 0
@@ -161,3 +161,19 @@ class Play(models.Model):
 class GameState(models.Model):
     room_name = models.CharField(max_length=30)
     board = models.BinaryField()
+    # last GameEvent folded into board, the events after it are replayed on top of it, see lobby.game_event_log
+    event_sequence = models.IntegerField(default=0)
+
+
+class GameEvent(models.Model):
+    room_name = models.CharField(max_length=30, db_index=True)
+    sequence = models.IntegerField()
+    command = models.CharField(max_length=30)
+    # turn actions played and snapshot delta, encoded by game.engine.event_log
+    actions = models.BinaryField()
+    changes = models.BinaryField()
+    date_created = models.DateTimeField(default=timezone.now, blank=True)
+
+    class Meta:
+        unique_together = ('room_name', 'sequence')
+        ordering = ['room_name', 'sequence']
@@ -1,15 +1,15 @@
 from game.player.ai_players.master_ai_player import Master_AI_Player
-import random
+from game.values import constants
 from game.dice.dice import DieValue
 
 
 class Attack_AI_Player(Master_AI_Player):
 
-    def choose_dice_to_re_roll(self, dice, verbose=False):
+    def choose_dice_to_re_roll(self, dice, verbose=False, re_rolls_left=constants.DEFAULT_RE_ROLL_COUNT):
         reroll = []
         for i in range(len(dice)):
             if dice[i] == DieValue.ATTACK:
                 continue
-            if random.choice([True, False]):
+            if self.random_source.choice([True, False]):
                 reroll.append(i)
         return reroll
@@ -1,12 +1,12 @@
 from game.player.ai_players.master_ai_player import Master_AI_Player
-import random
+from game.values import constants
 
 
 class Chaos_AI_Player(Master_AI_Player):
 
-    def choose_dice_to_re_roll(self, dice, verbose=False):
+    def choose_dice_to_re_roll(self, dice, verbose=False, re_rolls_left=constants.DEFAULT_RE_ROLL_COUNT):
         saved = []
         for i in range(len(dice)):
-            if random.choice([True, False]):
+            if self.random_source.choice([True, False]):
                 saved.append(i)
         return saved
@@ -1,7 +1,8 @@
 from enum import Enum
 from game.player.ai_players.master_ai_player import Master_AI_Player
-import random
 from game.dice.dice import DieValue
+from game.dice.re_roll_table import STARS_OBJECTIVE, get_re_roll_table
+from game.values import constants
 
 
 class turn_policy(Enum):
@@ -37,7 +38,7 @@ class Final_AI_Player(Master_AI_Player):
 
         return False
 
-    def choose_dice_to_re_roll(self, dice, verbose=False):
+    def choose_dice_to_re_roll(self, dice, verbose=False, re_rolls_left=constants.DEFAULT_RE_ROLL_COUNT):
         reroll = []
 
         strategy = self.get_current_policy()
@@ -46,23 +47,8 @@ class Final_AI_Player(Master_AI_Player):
             print(f"{self.username} strategy: {strategy}")
 
         if strategy == turn_policy.star:
-            die_enum = DieValue.THREE
-            current_count = dice.count(DieValue.THREE)
-
-            if dice.count(DieValue.TWO) > current_count:
-                current_count = dice.count(DieValue.TWO)
-                die_enum = DieValue.TWO
-
-            if dice.count(DieValue.ONE) > current_count:
-                current_count = dice.count(DieValue.ONE)
-                die_enum = DieValue.ONE
-
-            for i in range(len(dice)):
-                if dice[i] == die_enum:
-                    continue
-                if random.choice([True, False]):
-                    reroll.append(i)
-            return reroll
+            table = get_re_roll_table(STARS_OBJECTIVE, len(dice))
+            return table.dice_to_re_roll([die.value for die in dice], re_rolls_left)
         else:
             for i in range(len(dice)):
                 if dice[i] == DieValue.ATTACK:
@@ -1,13 +1,27 @@
+import random
+
 from game.player.player import Player
 from game.values import constants
 from game.engine.player_queue import GamePlayers
 
 
 class Master_AI_Player(Player):
-    def __init__(self, player_queue, username=None, passiveness=.5):
-        super().__init__(username=username)
+    def __init__(self, player_queue, username=None, passiveness=.5, rng=None):
+        super().__init__(username=username, rng=rng)
         self.player_queue: GamePlayers = player_queue
         self.passiveness = passiveness
+        # the game's random.Random, set by the board the player is added to
+        self.rng = rng
+
+    def attach_to_board(self, board):
+        self.rng = board.rng
+        # AI players built without a player queue play against the players of the game they join
+        if self.player_queue is None:
+            self.player_queue = board.players
+
+    @property
+    def random_source(self):
+        return self.rng or random
 
     def acknowledge(self):
         return
@@ -25,20 +39,7 @@ class Master_AI_Player(Player):
         return True
 
     def distance_to_next_turn(self):
-        i = 0
-
-        current_index = self.player_queue.players.index(
-            self.player_queue.current_player)
-
-        turn_order = self.player_queue.players.copy()
-        turn_order += self.player_queue.players.copy()
-
-        for j in range(current_index, len(turn_order)):
-            if turn_order[j] == self:
-                break
-            else:
-                i += 1
-        return i
+        return self.player_queue.distance_to_turn(self)
 
     def attackable_players(self):
         attackables = []
@@ -0,0 +1,60 @@
+from game.engine.monte_carlo_search import DEFAULT_EXPLORATION, MonteCarloSearch, ReRollDecision, YieldDecision
+from game.engine.simulation import FinalStrategy, SimulationGame, strategy_for_player
+from game.player.ai_players.master_ai_player import Master_AI_Player
+from game.values import constants
+
+DEFAULT_TIME_BUDGET = .5
+
+
+class MCTS_AI_Player(Master_AI_Player):
+    """
+    Plays every re-roll and yield by Monte Carlo search: each choice is tried on simulations of the rest of the game
+    (game/engine/monte_carlo_search.py) and the one that wins most is played. A decision takes time_budget seconds,
+    or iterations rollouts when that is set, spread over workers processes when there is more than one.
+    """
+
+    def __init__(self, player_queue, username=None, passiveness=.5, rng=None, time_budget=DEFAULT_TIME_BUDGET,
+                 iterations=None, workers=None, exploration=DEFAULT_EXPLORATION):
+        super().__init__(player_queue, username=username, passiveness=passiveness, rng=rng)
+        self.search = MonteCarloSearch(iterations=iterations, time_budget=None if iterations else time_budget,
+                                       workers=workers, exploration=exploration)
+
+    def rollout_strategy(self, player):
+        # other AI players are simulated as they play, humans and other searching players as the Final AI would
+        if player is self:
+            return FinalStrategy(self.passiveness)
+        try:
+            return strategy_for_player(player)
+        except TypeError:
+            return FinalStrategy()
+
+    def simulation(self):
+        if self.player_queue is None:
+            raise ValueError("{} has no player queue to search, add it to a game first".format(self.username))
+        strategies = [self.rollout_strategy(player) for player in self.player_queue.players]
+        return SimulationGame.from_player_queue(self.player_queue, strategies)
+
+    def choose_dice_to_re_roll(self, dice, verbose=False, re_rolls_left=constants.DEFAULT_RE_ROLL_COUNT):
+        if re_rolls_left <= 0:
+            return []
+        decision = ReRollDecision([die.value for die in dice], re_rolls_left)
+        kept = self.search.best_action(self.simulation(), self.seat, decision,
+                                       self.random_source.getrandbits(64))
+        if verbose:
+            print(f"{self.username} keeps {kept}")
+        return decision.dice_to_re_roll(kept)
+
+    def decide_to_yield(self):
+        return self.search.best_action(self.simulation(), self.seat, YieldDecision(),
+                                       self.random_source.getrandbits(64))
+
+    def close(self):
+        """Stops the search's worker processes."""
+        self.search.close()
+
+    def __getstate__(self):
+        # a deep copied player starts its own worker processes
+        state = self.__dict__.copy()
+        state['search'] = MonteCarloSearch(self.search.iterations, self.search.time_budget, self.search.workers,
+                                           self.search.exploration)
+        return state
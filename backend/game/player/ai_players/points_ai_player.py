@@ -1,27 +1,11 @@
+from game.dice.re_roll_table import STARS_OBJECTIVE, get_re_roll_table
 from game.player.ai_players.master_ai_player import Master_AI_Player
-import random
-from game.dice.dice import DieValue
+from game.values import constants
 
 
 class Points_AI_Player(Master_AI_Player):
 
-    def choose_dice_to_re_roll(self, dice, verbose=False):
-        reroll = []
-
-        die_enum = DieValue.THREE
-        current_count = dice.count(DieValue.THREE)
-
-        if dice.count(DieValue.TWO) > current_count:
-            current_count = dice.count(DieValue.TWO)
-            die_enum = DieValue.TWO
-
-        if dice.count(DieValue.ONE) > current_count:
-            current_count = dice.count(DieValue.ONE)
-            die_enum = DieValue.ONE
-
-        for i in range(len(dice)):
-            if dice[i] == die_enum:
-                continue
-            if random.choice([True, False]):
-                reroll.append(i)
-        return reroll
+    def choose_dice_to_re_roll(self, dice, verbose=False, re_rolls_left=constants.DEFAULT_RE_ROLL_COUNT):
+        # keeps the dice with the most expected stars once every re-roll left is played
+        table = get_re_roll_table(STARS_OBJECTIVE, len(dice))
+        return table.dice_to_re_roll([die.value for die in dice], re_rolls_left)
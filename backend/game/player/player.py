@@ -1,39 +1,76 @@
+import copy
 import random
 from typing import List
 
 from game.cards.card import Card
-from game.cards.keep_cards.energy_manipulation_cards.friend_of_children import FriendOfChildren
-from game.cards.keep_cards.energy_manipulation_cards.were_only_making_it_stronger import WereOnlyMakingItStronger
-from game.cards.keep_cards.health_manipulation_cards.it_has_a_child import ItHasAChild
-from game.cards.keep_cards.health_manipulation_cards.regeneration import Regeneration
 from game.cards.keep_cards.turn_manipulation_cards.GiantBrain import GiantBrain
-from game.cards.keep_cards.health_manipulation_cards.armor_plating import ArmorPlating
+from game.cards.trigger import Trigger
 from game.player.player_status_resolver import json_players_hand
 from game.values import constants
 from game.values.locations import Locations
 
 
 class Player:
-    def __init__(self, username=None):
+    def __init__(self, username=None, rng=None):
         if username is None:
-            self.username = "guest_{}".format(random.randint(1000, 9999))
+            self.username = "guest_{}".format((rng or random).randint(1000, 9999))
         else:
             self.username = username
         self.monster_name = None
         self.maximum_health = self.current_health = constants.DEFAULT_HEALTH
-        self.location = Locations.OUTSIDE
-        self.is_alive = True
+        # index in and back reference to the GamePlayers the player was added to
+        self.seat = None
+        self.game_players = None
+        self._location = Locations.OUTSIDE
+        self._is_alive = True
         self.victory_points = constants.DEATH_HIT_POINT
         self.energy = constants.DEFAULT_ENERGY_CUBE
         self.cards: List[Card] = []
+        # one card per card type held, listed under every trigger it responds to, see add_card
+        self.card_hooks = {trigger: [] for trigger in Trigger}
+        self.card_type_counts = {}
         self.allowed_to_yield = False
         self.gets_bonus_turn = False
         self.newly_dead = False
 
+    def clone(self):
+        """A copy with its own cards and status. Cards are shared, they hold no state."""
+        player = copy.copy(self)
+        player.cards = self.cards.copy()
+        player.card_hooks = {trigger: hooks.copy() for trigger, hooks in self.card_hooks.items()}
+        player.card_type_counts = self.card_type_counts.copy()
+        return player
+
+    def attach_to_board(self, board):
+        """Called by the board the player is added to (or cloned with), see Master_AI_Player."""
+        pass
+
+    @property
+    def is_alive(self):
+        return self._is_alive
+
+    @is_alive.setter
+    def is_alive(self, is_alive):
+        if is_alive != self._is_alive:
+            self._is_alive = is_alive
+            if self.game_players is not None:
+                self.game_players.player_alive_changed(self)
+
+    @property
+    def location(self):
+        return self._location
+
+    @location.setter
+    def location(self, location):
+        if location != self._location:
+            self._location = location
+            if self.game_players is not None:
+                self.game_players.player_location_changed(self)
+
     @property
     def dice_allowed(self):
         allowed_dice = constants.DEFAULT_DICE_TO_ROLL
-        if self.has_instance_of_card(GiantBrain()):
+        if self.has_instance_of_card(GiantBrain):
             allowed_dice += 1
         return allowed_dice
 
@@ -64,21 +101,18 @@ class Player:
         self.location = Locations.OUTSIDE
 
     def update_health_by(self, change_integer):
-        if self.has_instance_of_card(WereOnlyMakingItStronger()) and change_integer <= -2:
-            WereOnlyMakingItStronger().special_effect(self, None)
-        if self.has_instance_of_card(Regeneration()):
-            change_integer = Regeneration().special_effect(self, change_integer)
-        if self.has_instance_of_card(ArmorPlating()):
-            change_integer = ArmorPlating().special_effect(self, change_integer)
+        for card in self.card_hooks[Trigger.ON_HEALTH_CHANGE]:
+            change_integer = card.on_health_change(self, change_integer)
         self.current_health += change_integer
         if self.current_health > self.maximum_health:
             self.current_health = self.maximum_health
         if self.current_health <= 0:
-            if self.has_instance_of_card(ItHasAChild()):
-                ItHasAChild().special_effect(self, None)
-            else:
-                self.is_alive = False
-                self.newly_dead = True
+            for card in self.card_hooks[Trigger.ON_DEATH]:
+                card.on_death(self)
+                if self.current_health > 0:
+                    return
+            self.is_alive = False
+            self.newly_dead = True
 
     def update_max_health_by(self, change_integer):
         self.maximum_health += change_integer
@@ -93,8 +127,9 @@ class Player:
             self.victory_points = 0
 
     def update_energy_by(self, change_integer):
-        if self.has_instance_of_card(FriendOfChildren()):
-            change_integer = FriendOfChildren.add_extra_energy(change_integer)
+        if change_integer > 0:
+            for card in self.card_hooks[Trigger.ON_ENERGY_GAIN]:
+                change_integer = card.on_energy_gain(self, change_integer)
         self.energy += change_integer
         if self.energy < constants.DEFAULT_ENERGY_CUBE:
             self.energy = constants.DEFAULT_ENERGY_CUBE
@@ -104,18 +139,50 @@ class Player:
 
     def add_card(self, card: Card):
         self.cards.append(card)
+        card_type = type(card)
+        count = self.card_type_counts.get(card_type, 0)
+        self.card_type_counts[card_type] = count + 1
+        if count == 0:
+            # effects apply once per card type, however many copies the player holds
+            for trigger in getattr(card, 'triggers', ()):
+                self._subscribe(self.card_hooks[trigger], card)
+
+    @staticmethod
+    def _subscribe(hooks, card):
+        position = len(hooks)
+        while position > 0 and hooks[position - 1].trigger_order > card.trigger_order:
+            position -= 1
+        hooks.insert(position, card)
 
     def remove_card(self, card: Card):
         self.cards.remove(card)
-
-    def has_instance_of_card(self, card: Card):
-        for player_card in self.cards:
-            if type(player_card) == type(card):
-                return True
-        return False
+        card_type = type(card)
+        count = self.card_type_counts[card_type] - 1
+        if count:
+            self.card_type_counts[card_type] = count
+            return
+        del self.card_type_counts[card_type]
+        for trigger in getattr(card, 'triggers', ()):
+            hooks = self.card_hooks[trigger]
+            for i, subscriber in enumerate(hooks):
+                if type(subscriber) is card_type:
+                    del hooks[i]
+                    break
+
+    def set_cards(self, cards):
+        self.discard_all_cards()
+        for card in cards:
+            self.add_card(card)
+
+    def has_instance_of_card(self, card):
+        """Takes a card or a card class, matches the exact type like the effects do."""
+        return (card if isinstance(card, type) else type(card)) in self.card_type_counts
 
     def discard_all_cards(self):
         self.cards.clear()
+        self.card_type_counts.clear()
+        for hooks in self.card_hooks.values():
+            hooks.clear()
 
     def generate_player_status_as_dictionary(self):
         location_string = "Out" if self.location == Locations.OUTSIDE else "In"
@@ -2,6 +2,7 @@ import json
 from typing import List
 
 from game.cards.card import Card
+from game.values.locations import Locations
 
 
 def generate_player_status_summary(player_queue):
@@ -26,3 +27,63 @@ def json_players_hand(cards: List[Card] = []):
     for card in cards:
         json_data.append(card.to_dict())
     return json.dumps(json_data)
+
+
+def _status_values(player):
+    return {
+        "current_health": player.current_health,
+        "location": player.location,
+        "is_alive": player.is_alive,
+        "victory_points": player.victory_points,
+        "energy": player.energy,
+        "cards": tuple(player.cards)
+    }
+
+
+def _format_status_value(field, value):
+    if field == "location":
+        return "Out" if value == Locations.OUTSIDE else "In"
+    if field == "cards":
+        return json_players_hand(value)
+    return value
+
+
+class PlayerStatusTracker:
+    """
+    Remembers the player status last broadcast to a room so only changed fields have to be sent.
+
+    Every snapshot or non-empty delta bumps the version; a client that sees a gap in versions should ask for a
+    snapshot. Hands are only re-serialized when a player's cards changed.
+
+    A new tracker, e.g. for a room loaded again after it was evicted, starts over at version 1 and needs_snapshot
+    until it has sent one, so its first broadcast resets what the room's clients hold.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.__last_sent = {}
+
+    @property
+    def needs_snapshot(self):
+        return self.version == 0
+
+    def snapshot(self, player_queue):
+        self.__last_sent = {player.username: _status_values(player) for player in player_queue.players}
+        self.version += 1
+        return {"version": self.version, "players": generate_player_status_summary(player_queue)}
+
+    def delta(self, player_queue):
+        changes = []
+        for player in player_queue.players:
+            current = _status_values(player)
+            last_sent = self.__last_sent.get(player.username, {})
+            changed = {field: _format_status_value(field, value) for field, value in current.items()
+                       if field not in last_sent or last_sent[field] != value}
+            if changed:
+                changed["username"] = player.username
+                changes.append(changed)
+                self.__last_sent[player.username] = current
+        if not changes:
+            return None
+        self.version += 1
+        return {"version": self.version, "players": changes}
@@ -2,6 +2,12 @@ import pytest
 
 from game.cards.discard_cards.energy_manipulation_cards.energize import Energize
 from game.cards.discard_cards.health_manipulation_cards.fire_blast import FireBlast
+from game.cards.keep_cards.energy_manipulation_cards.energy_hoarder import EnergyHoarder
+from game.cards.keep_cards.health_manipulation_cards.armor_plating import ArmorPlating
+from game.cards.keep_cards.health_manipulation_cards.it_has_a_child import ItHasAChild
+from game.cards.keep_cards.health_manipulation_cards.regeneration import Regeneration
+from game.cards.keep_cards.victory_point_manipulation_cards.rooting_for_the_underdog import RootingForTheUnderdog
+from game.cards.trigger import Trigger
 from game.player.player import Player
 from game.values import constants
 from game.values.locations import Locations
@@ -175,3 +181,43 @@ def test_newly_dead():
     player.update_health_by(-player.current_health)
     assert player.is_newly_dead
     assert not player.is_newly_dead
+
+
+def test_has_instance_of_card_takes_card_class(player):
+    player.add_card(Energize())
+    assert player.has_instance_of_card(Energize) and not player.has_instance_of_card(FireBlast)
+
+
+def test_card_hooks_follow_added_and_removed_cards(player):
+    player.add_card(Regeneration())
+    player.add_card(ArmorPlating())
+    assert player.card_hooks[Trigger.ON_HEALTH_CHANGE] == [Regeneration(), ArmorPlating()]
+    player.remove_card(Regeneration())
+    assert player.card_hooks[Trigger.ON_HEALTH_CHANGE] == [ArmorPlating()]
+    player.discard_all_cards()
+    assert not any(player.card_hooks.values())
+
+
+def test_card_effect_applies_once_per_card_type(player):
+    player.add_card(Regeneration())
+    player.add_card(Regeneration())
+    player.current_health = 5
+    player.update_health_by(1)
+    assert player.current_health == 7
+
+    player.remove_card(Regeneration())
+    player.update_health_by(1)
+    assert player.current_health == 9
+
+
+def test_card_hooks_run_in_trigger_order(player):
+    player.add_card(RootingForTheUnderdog())
+    player.add_card(EnergyHoarder())
+    assert player.card_hooks[Trigger.ON_TURN_END] == [EnergyHoarder(), RootingForTheUnderdog()]
+
+
+def test_death_hook_keeps_player_alive(player):
+    player.add_card(ItHasAChild())
+    player.update_health_by(-constants.DEFAULT_HEALTH)
+    assert player.is_alive and player.current_health == 10
+    assert not player.has_instance_of_card(ItHasAChild)
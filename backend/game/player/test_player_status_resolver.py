@@ -5,7 +5,8 @@ from game.cards.keep_cards.energy_manipulation_cards.solar_powered import SolarP
 from game.cards.keep_cards.health_manipulation_cards.even_bigger import EvenBigger
 from game.engine.player_queue import GamePlayers
 from game.player.player import Player
-from game.player.player_status_resolver import generate_player_status_summary, player_status_summary_to_JSON
+from game.player.player_status_resolver import generate_player_status_summary, player_status_summary_to_JSON, \
+    PlayerStatusTracker
 
 
 def test_generate_player_status_summary():
@@ -68,3 +69,69 @@ def test_player_with_cards_status_summary_to_JSON():
     expected_p2_dictionary = player2.generate_player_status_as_dictionary()
     expected_summary_json: [] = json.dumps([expected_p1_dictionary, expected_p2_dictionary])
     assert actual_summary_json == expected_summary_json
+
+
+def test_status_tracker_first_delta_contains_every_field():
+    player_queue = GamePlayers()
+    player_queue.add_player_to_game(Player("p1"))
+    tracker = PlayerStatusTracker()
+    delta = tracker.delta(player_queue)
+    expected = player_queue.players[0].generate_player_status_as_dictionary()
+    assert delta == {"version": 1, "players": [expected]}
+
+
+def test_status_tracker_delta_only_contains_changed_fields():
+    player1 = Player("p1")
+    player2 = Player("p2")
+    player_queue = GamePlayers()
+    player_queue.add_player_to_game(player1)
+    player_queue.add_player_to_game(player2)
+    tracker = PlayerStatusTracker()
+    tracker.snapshot(player_queue)
+
+    player2.update_energy_by(3)
+    player2.move_to_tokyo()
+
+    assert tracker.delta(player_queue) == {
+        "version": 2, "players": [{"username": "p2", "energy": 3, "location": "In"}]}
+
+
+def test_status_tracker_sends_hand_when_cards_change():
+    player = Player("p1")
+    player_queue = GamePlayers()
+    player_queue.add_player_to_game(player)
+    tracker = PlayerStatusTracker()
+    tracker.snapshot(player_queue)
+
+    player.add_card(EvenBigger())
+
+    delta = tracker.delta(player_queue)
+    assert json.loads(delta["players"][0]["cards"])[0]["name"] == EvenBigger().name
+
+
+def test_status_tracker_no_changes_no_delta():
+    player_queue = GamePlayers()
+    player_queue.add_player_to_game(Player("p1"))
+    tracker = PlayerStatusTracker()
+    tracker.snapshot(player_queue)
+    assert tracker.delta(player_queue) is None
+    assert tracker.version == 1
+
+
+def test_status_tracker_snapshot_is_full_roster():
+    player_queue = GamePlayers()
+    player_queue.add_player_to_game(Player("p1"))
+    player_queue.add_player_to_game(Player("p2"))
+    tracker = PlayerStatusTracker()
+    tracker.delta(player_queue)
+    snapshot = tracker.snapshot(player_queue)
+    assert snapshot == {"version": 2, "players": generate_player_status_summary(player_queue)}
+
+
+def test_status_tracker_needs_snapshot_until_one_is_sent():
+    player_queue = GamePlayers()
+    player_queue.add_player_to_game(Player("p1"))
+    tracker = PlayerStatusTracker()
+    assert tracker.needs_snapshot
+    tracker.snapshot(player_queue)
+    assert not tracker.needs_snapshot
@@ -15,7 +15,7 @@ def is_attackable(attacking_player, other_player):
 def get_attackable_players(attacking_player: Player, other_players, is_dice_roll=True):
     attackable_players = []
 
-    if is_dice_roll and attacking_player.has_instance_of_card(NovaBreath()):
+    if is_dice_roll and attacking_player.has_instance_of_card(NovaBreath):
         return other_players
     else:
         for other_player in other_players:
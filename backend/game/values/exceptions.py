@@ -4,3 +4,11 @@ class InsufficientFundsException(Exception):
 
 class UnexpectedCardTypeException(Exception):
     pass
+
+
+class IllegalActionException(Exception):
+    pass
+
+
+class ReplayDivergenceException(Exception):
+    pass
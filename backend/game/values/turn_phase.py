@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class TurnPhase(Enum):
+    ROLL = 0
+    RE_ROLL = 1
+    RESOLVED = 2
+    GAME_OVER = 3
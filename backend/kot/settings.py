@@ -165,4 +165,26 @@ CHANNEL_LAYERS={
 #             "hosts": ['redis://localhost:6379/4']
 #         }
 #     },
-# }
\ No newline at end of file
+# }
+
+# seconds between write-behind flushes of resident game rooms to their event log, see lobby.game_event_log
+KOT_ROOM_FLUSH_INTERVAL = 2.0
+
+# room events appended between two full snapshots of a room's board in GameState.board
+KOT_EVENT_SNAPSHOT_INTERVAL = 50
+
+# Dice and Play analytics rows written in one bulk insert, and seconds between writes of a smaller batch
+KOT_ANALYTICS_BATCH_SIZE = 100
+KOT_ANALYTICS_FLUSH_INTERVAL = 5.0
+
+# worker threads the async consumers use for ORM and game state work
+KOT_ORM_WORKERS = 8
+
+# game commands a room applies in a row before its writer hands the worker thread to other rooms
+KOT_ROOM_COMMAND_BATCH_SIZE = 32
+
+# deliver all messages produced by one game command as a single websocket frame (list of envelopes)
+KOT_BATCH_MESSAGES = False
+
+# broadcast player status as versioned deltas instead of the full roster on every change
+KOT_PLAYER_STATUS_DELTAS = False
@@ -1,27 +1,25 @@
-import json
-import pickle
+from abc import ABC, abstractmethod
 
-from asgiref.sync import async_to_sync
-from channels.generic.websocket import WebsocketConsumer
+from django.conf import settings
 
+from game.cards.card_catalog import get_card_code, get_card_type_code
 from game.cards.discard_cards.victory_point_manipulation_cards.drop_from_high_altitude import DropFromHighAltitude
-from game.dice.dice_resolver import dice_resolution
-from game.engine.board import BoardGame
 from game.engine.dice_msg_translator import decode_selected_dice_indexes, dice_values_message_create
-from game.irepository.irepository_dice import IRepositoryDice
+from game.engine.turn import RollAction, RerollAction, ResolveAction, BuyAction, SweepAction, YieldAction, \
+    EndTurnAction
 from game.irepository.irepository_game import IRepositoryGame
-from game.irepository.irepository_play import IRepositoryPlay
 from game.irepository.irepository_player import IRepositoryPlayer
 from game.models import User, GameState
 from game.player.player import Player
 from game.player.player_status_resolver import player_status_summary_to_JSON
 from game.turn_actions.player_movement import move_players_out_of_tokyo
-from game.values.constants import DEFAULT_RE_ROLL_COUNT
-from game.values.exceptions import InsufficientFundsException
+from game.values.exceptions import InsufficientFundsException, IllegalActionException
 from game.values.locations import Locations
-from lobby.consumers_common import save_game, reconstruct_game, create_send_response_to_client
+from lobby.consumers_common import save_game, reconstruct_game, room_registry, record_game_event, analytics_writer
+from lobby.lobby_events import lobby_room_key, lobby_room_summary, create_lobby_room_event
 from lobby.server_message_types import PLAYER_STATUS_UPDATE_RESPONSE, BEGIN_TURN_RESPONSE, SERVER_RESPONSE, \
-    DICE_ROLLS_RESPONSE, CARD_STORE_RESPONSE, YIELD_ALERT, YIELD_FORCE_ALERT, END_TURN, WINNER_ALERT
+    DICE_ROLLS_RESPONSE, CARD_STORE_RESPONSE, YIELD_ALERT, YIELD_FORCE_ALERT, END_TURN, WINNER_ALERT, \
+    PLAYER_STATUS_SNAPSHOT_RESPONSE, PLAYER_STATUS_DELTA_RESPONSE
 
 
 def dice_vals_log_message(player_name, values):
@@ -30,49 +28,57 @@ def dice_vals_log_message(player_name, values):
     return msg
 
 
-class GameConsumer(WebsocketConsumer):
-    def connect(self):
-        self.room_name = self.scope['url_route']['kwargs']['room_name']
-        self.room_group_name = 'kot_%s' % self.room_name
-
-        # Join room group
-        async_to_sync(self.channel_layer.group_add)(
-            self.room_group_name,
-            self.channel_name
-        )
-        self.accept()
-
-    def disconnect(self, close_code):
-        # leave group room
-        async_to_sync(self.channel_layer.group_discard)(
-            self.room_group_name,
-            self.channel_name
-        )
-
-    def receive(self, text_data=None, bytes_data=None):
-        data = json.loads(text_data)
-        self.commands[data['command']](self, data)
-
-    def send_group_message(self, message):
-        # Send message to room group
-        async_to_sync(self.channel_layer.group_send)(
-            self.room_group_name,
-            {
-                'type': 'group_message',
-                'message': message
-            }
-        )
-
-    # Receive message from room group
-    def group_message(self, event):
-        message = event['message']
-        # Send message to WebSocket
-        self.send(text_data=json.dumps(message))
+class GameCommandHandlers(ABC):
+    """
+    Game room command handlers, mixed into the game consumer (see lobby.consumers_async.AsyncGameConsumer).
 
+    Handlers only talk to clients through send_to_client, and changes to a room's status or roster are published to
+    subscribed lobbies through send_lobby_event once the command is applied. Both are called on the thread applying
+    the command, so a consumer implements them by collecting the messages and sending them once the command is done.
+
+    With player_status_deltas enabled, player status goes out as versioned deltas of the fields that changed since
+    the last broadcast, and joining clients get a full snapshot.
+    """
+    player_status_deltas = getattr(settings, 'KOT_PLAYER_STATUS_DELTAS', False)
+
+    @abstractmethod
     def send_to_client(self, message_type, username, room, payload):
-        content = create_send_response_to_client(
-            message_type, username, room, payload)
-        self.send_group_message(content)
+        pass
+
+    @abstractmethod
+    def send_lobby_event(self, event):
+        pass
+
+    def apply_command(self, data):
+        room = data['room']
+        # handlers mutate the resident room state, only one message per room is applied at a time
+        with room_registry.lock(room):
+            entry = room_registry.get(room)
+            if entry.lobby_key is None:
+                entry.lobby_key = lobby_room_key(entry.state)
+                entry.lobby_summary = lobby_room_summary(entry.state)
+            # the turn actions the command plays go to the room's event log with the change it made
+            state = entry.state
+            actions = []
+            state.action_listener = lambda action, words_drawn: actions.append(action)
+            try:
+                self.commands[data['command']](self, data)
+            finally:
+                del state.action_listener
+                record_game_event(entry, data['command'], actions)
+            self.publish_lobby_changes(room, entry)
+            # a finished game is written back and no longer kept resident
+            room_registry.evict_if_finished(room)
+
+    def publish_lobby_changes(self, room, entry):
+        # lobby subscribers only hear about a room when its status or roster changes
+        lobby_key = lobby_room_key(entry.state)
+        if lobby_key == entry.lobby_key:
+            return
+        lobby_summary = lobby_room_summary(entry.state)
+        self.send_lobby_event(create_lobby_room_event(room, entry.lobby_summary, lobby_summary))
+        entry.lobby_key = lobby_key
+        entry.lobby_summary = lobby_summary
 
     def get_or_create_user(self, username, room):
         user, created = User.objects.get_or_create(username=username)
@@ -109,10 +115,10 @@ class GameConsumer(WebsocketConsumer):
         return game
 
     def start_web_game(self, room, state, username):
-        state.start_game()
+        if not state.is_game_active():
+            state.start_game()
+            state.apply(RollAction(state.players.current_player.username))
         self.send_to_client(SERVER_RESPONSE, username, room, "Game started..")
-        state.dice_handler.roll_initial(
-            state.players.current_player.dice_allowed, DEFAULT_RE_ROLL_COUNT)
         self.send_to_client(CARD_STORE_RESPONSE, username,
                             room, state.deck_handler.json_store())
         self.send_to_client(BEGIN_TURN_RESPONSE, username,
@@ -144,35 +150,42 @@ class GameConsumer(WebsocketConsumer):
             self.send_to_client(SERVER_RESPONSE, username,
                                 room, username + msg)
 
-        self.update_player_status(state, username, room, game)
+        # joining or reconnecting clients need the whole roster before they can apply deltas
+        self.update_player_status(state, username, room, game, full_snapshot=True)
 
     def get_state(self, room, username):
         self.get_or_create_game(username, room)
-        game = GameState.objects.get(room_name=room)
-        if not game.board:
-            state = BoardGame()
-        else:
-            state = pickle.loads(game.board)
-        return game, state
+        entry = room_registry.get(room)
+        return entry.game, entry.state
 
-    def update_player_status(self, state, username, room, game):
+    def update_player_status(self, state, username, room, game, full_snapshot=False):
         state.players.apply_eater_of_dead_action()
 
-        player_summaries = player_status_summary_to_JSON(state.players)
-        self.send_to_client(PLAYER_STATUS_UPDATE_RESPONSE,
-                            username, room, player_summaries)
+        if not self.player_status_deltas:
+            player_summaries = player_status_summary_to_JSON(state.players)
+            self.send_to_client(PLAYER_STATUS_UPDATE_RESPONSE,
+                                username, room, player_summaries)
+        elif full_snapshot or room_registry.get(room).status_tracker.needs_snapshot:
+            status_tracker = room_registry.get(room).status_tracker
+            self.send_to_client(PLAYER_STATUS_SNAPSHOT_RESPONSE,
+                                username, room, status_tracker.snapshot(state.players))
+        else:
+            status_delta = room_registry.get(room).status_tracker.delta(state.players)
+            if status_delta:
+                self.send_to_client(PLAYER_STATUS_DELTA_RESPONSE, username, room, status_delta)
 
         save_game(game, state)
 
-    def return_dice_state_handler(self, data):
+    def player_status_snapshot_handler(self, data):
         username, room, game, state = reconstruct_game(data)
-        i_repository_dice = IRepositoryDice()
+        self.update_player_status(state, username, room, game, full_snapshot=True)
 
+    def return_dice_state_handler(self, data):
+        username, room, game, state = reconstruct_game(data)
         values = state.dice_handler.dice_values
         if len(values) == 6:
-            dice_store = i_repository_dice.save_dice(username, room, values[0], values[1], values[2], values[3],
-                                                     values[4], values[5], None, None, state.dice_handler.re_rolls_left,
-                                                     None)
+            analytics_writer.save_dice(username, room, values[0], values[1], values[2], values[3], values[4],
+                                       values[5], None, None, state.dice_handler.re_rolls_left, None)
 
         rolled_dice_ui_message = dice_values_message_create(values)
         self.send_to_client(SERVER_RESPONSE, username, room,
@@ -182,14 +195,12 @@ class GameConsumer(WebsocketConsumer):
 
     def selected_dice_handler(self, data):
         username, room, game, state = reconstruct_game(data)
-        i_repository_dice = IRepositoryDice()
-
         payload = data['payload']
 
         selected_dice = decode_selected_dice_indexes(payload)
 
         try:
-            state.dice_handler.re_roll_dice(selected_dice)
+            state.apply(RerollAction(username, selected_dice))
             values = state.dice_handler.dice_values
             self.send_to_client(SERVER_RESPONSE, username,
                                 room, dice_vals_log_message(username, values))
@@ -200,14 +211,16 @@ class GameConsumer(WebsocketConsumer):
         except ValueError:
             self.send_to_client(SERVER_RESPONSE, username,
                                 room, "{} out of rolls.".format(username))
+        except IllegalActionException as illegal:
+            self.send_to_client(SERVER_RESPONSE, username, room, str(illegal))
+            return
 
         # serialize then store modified GameState object
         save_game(game, state)
         values = state.dice_handler.dice_values
         if len(values) == 6:
-            dice_store = i_repository_dice.save_dice(username, room, values[0], values[1], values[2], values[3],
-                                                     values[4], values[5], None, None, state.dice_handler.re_rolls_left,
-                                                     selected_dice)
+            analytics_writer.save_dice(username, room, values[0], values[1], values[2], values[3], values[4],
+                                       values[5], None, None, state.dice_handler.re_rolls_left, selected_dice)
 
         rolled_dice_ui_message = dice_values_message_create(values)
         self.send_to_client(DICE_ROLLS_RESPONSE, username, room, rolled_dice_ui_message)
@@ -215,18 +228,15 @@ class GameConsumer(WebsocketConsumer):
     def end_turn_handler(self, data):
         # a method to end a players turn and let the next guy go
         username, room, game, state = reconstruct_game(data)
-        state.post_roll_actions(state.players.current_player)
-
-        next_player: Player = state.get_next_player_turn()
-
-        state.dice_handler.roll_initial(
-            state.players.current_player.dice_allowed, DEFAULT_RE_ROLL_COUNT)
-
-        values = state.dice_handler.dice_values
-
-        rolled_dice_ui_message = dice_values_message_create(values)
+        try:
+            next_player: Player = state.apply(EndTurnAction(username))
+        except IllegalActionException as illegal:
+            self.send_to_client(SERVER_RESPONSE, username, room, str(illegal))
+            return
 
         if next_player:
+            values = state.apply(RollAction(next_player.username))
+            rolled_dice_ui_message = dice_values_message_create(values)
             self.send_to_client(SERVER_RESPONSE, username, room,
                                 dice_vals_log_message(next_player.username, values))
             self.send_to_client(BEGIN_TURN_RESPONSE, username,
@@ -238,10 +248,9 @@ class GameConsumer(WebsocketConsumer):
 
         self.update_player_status(state, username, room, game)
 
-        for player in state.players.players:
-            if state.check_if_winner(player):
-                self.send_to_client(WINNER_ALERT, state.players.current_player.username, room, "Winner")
-                break
+        if state.winner is not None:
+            self.send_to_client(WINNER_ALERT, state.winner.username, room, "Winner")
+            analytics_writer.forget_room(room)
 
     def gamelog_send_handler(self, data):
         username, room, game, state = reconstruct_game(data)
@@ -260,27 +269,27 @@ class GameConsumer(WebsocketConsumer):
 
     def yield_tokyo_request_handler(self, data):
         username, room, game, state = reconstruct_game(data)
-        player = state.players.get_player_by_username_from_alive(username)
-
-        if player.allowed_to_yield:
-            state.yield_tokyo_to_current_player(player)
+        try:
+            state.apply(YieldAction(username, True))
+        except IllegalActionException:
+            print("{} can't yield tokyo!".format(username))
+        else:
             self.send_to_client(SERVER_RESPONSE, username, room,
                                 "{} yields Tokyo to {}!".format(username, state.players.current_player.username))
 
-            state.players.reset_allowed_to_yield()
-
             self.update_player_status(state, username, room, game)
 
             self.send_to_client(
                 END_TURN, state.players.current_player.username, room, "allow end turn")
-        else:
-            print("{} can't yield tokyo!".format(username))
         save_game(game, state)
 
     def keep_tokyo_request_handler(self, data):
         username, room, game, state = reconstruct_game(data)
-        player = state.players.get_player_by_username_from_alive(username)
-        player.allowed_to_yield = False
+        try:
+            state.apply(YieldAction(username, False))
+        except IllegalActionException as illegal:
+            self.send_to_client(SERVER_RESPONSE, username, room, str(illegal))
+            return
         save_game(game, state)
 
         self.send_to_client(SERVER_RESPONSE, username, room,
@@ -299,12 +308,14 @@ class GameConsumer(WebsocketConsumer):
 
     def resolve_dice_handler(self, data):
         username, room, game, state = reconstruct_game(data)
+        try:
+            state.apply(ResolveAction(username))
+        except IllegalActionException as illegal:
+            self.send_to_client(SERVER_RESPONSE, username, room, str(illegal))
+            return
         self.send_to_client(SERVER_RESPONSE, username, room,
                             "{} locked in dice".format(state.players.current_player.username))
 
-        dice_resolution(state.dice_handler.dice_values, state.players.get_current_player(),
-                        state.players.get_all_alive_players_minus_current_player())
-
         self.update_player_status(state, username, room, game)
 
         self.trigger_yield_popup_if_necessary(state, room)
@@ -333,20 +344,16 @@ class GameConsumer(WebsocketConsumer):
     def buy_card_request_handler(self, data):
         username, room, game, state = reconstruct_game(data)
 
-        if username != state.players.current_player.username:
-            return
-
         index_to_buy = data['payload']
         try:
-            bought = state.deck_handler.buy_card_from_store(index_to_buy, state.players.current_player,
-                                                            state.players.get_all_alive_players_minus_current_player())
+            bought = state.apply(BuyAction(username, index_to_buy))
             if bought:
-                i_repository_play = IRepositoryPlay()
-                i_repository_play.save_play_card_purchased(username, room, bought.name, bought.card_type,
-                                                           state.players.current_player.location,
-                                                           state.players.current_player.victory_points,
-                                                           state.players.current_player.energy,
-                                                           state.players.current_player.current_health)
+                analytics_writer.save_play_card_purchased(username, room, get_card_code(bought),
+                                                          get_card_type_code(bought),
+                                                          state.players.current_player.location,
+                                                          state.players.current_player.victory_points,
+                                                          state.players.current_player.energy,
+                                                          state.players.current_player.current_health)
 
             if isinstance(bought, DropFromHighAltitude):
                 if state.players.get_count_in_tokyo_ignore_current_player() > 1:
@@ -369,38 +376,34 @@ class GameConsumer(WebsocketConsumer):
                                 "{} tried to buy {} but has insufficient energy!".format(
                                     username, state.deck_handler.store[index_to_buy].name)
                                 )
+        except IllegalActionException:
+            return
 
         save_game(game, state)
 
     def card_store_sweep_request_handler(self, data):
         username, room, game, state = reconstruct_game(data)
-        if state.players.current_player.username == username:
-            cards_swept = state.deck_handler.store.copy()
-            print("Cards to be swept {}".format(cards_swept))
-
-            successfully_swept_cardstore = state.deck_handler.sweep_store(
-                state.players.current_player)
-
-            if successfully_swept_cardstore is None:
-                i_repository_play = IRepositoryPlay()
-                i_repository_play.save_play_card_swept(username, room, cards_swept[2].name,
-                                                       cards_swept[2].card_type,
-                                                       cards_swept[1].name,
-                                                       cards_swept[1].card_type,
-                                                       cards_swept[0].name,
-                                                       cards_swept[0].card_type,
-                                                       state.players.current_player.location,
-                                                       state.players.current_player.victory_points,
-                                                       state.players.current_player.energy,
-                                                       state.players.current_player.current_health)
-            cards_swept.clear()
-
-            if not successfully_swept_cardstore:
-                message = "{} does not have enough funds to sweep the card store!".format(
-                    username)
-                self.send_to_client(SERVER_RESPONSE, username, room, message)
-        else:
+        try:
+            cards_swept = state.apply(SweepAction(username))
+        except InsufficientFundsException:
+            message = "{} does not have enough funds to sweep the card store!".format(
+                username)
+            self.send_to_client(SERVER_RESPONSE, username, room, message)
+        except IllegalActionException:
             print("{} tried to sweep out of turn!".format(username))
+        else:
+            print("Cards swept {}".format(cards_swept))
+            if cards_swept:
+                analytics_writer.save_play_card_swept(username, room, get_card_code(cards_swept[2]),
+                                                      get_card_type_code(cards_swept[2]),
+                                                      get_card_code(cards_swept[1]),
+                                                      get_card_type_code(cards_swept[1]),
+                                                      get_card_code(cards_swept[0]),
+                                                      get_card_type_code(cards_swept[0]),
+                                                      state.players.current_player.location,
+                                                      state.players.current_player.victory_points,
+                                                      state.players.current_player.energy,
+                                                      state.players.current_player.current_health)
 
         self.update_player_status(state, username, room, game)
 
@@ -439,5 +442,7 @@ class GameConsumer(WebsocketConsumer):
         'keep_tokyo_request': keep_tokyo_request_handler,
         'sweep_card_store_request': card_store_sweep_request_handler,
         'buy_card_request': buy_card_request_handler,
-        'force_yield_tokyo_request': force_yield_tokyo_request_handler
+        'force_yield_tokyo_request': force_yield_tokyo_request_handler,
+        'player_status_snapshot_request': player_status_snapshot_handler
     }
+
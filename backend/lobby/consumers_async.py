@@ -0,0 +1,192 @@
+import json
+
+from channels.generic.websocket import AsyncWebsocketConsumer
+from django.conf import settings
+
+from lobby.consumers import GameCommandHandlers
+from lobby.consumers_common import create_send_response_to_client, create_batched_frame, room_registry, \
+    run_in_orm_executor, run_in_room_queue
+from lobby.lobby_events import LOBBY_UPDATES_GROUP, lobby_room_message
+from lobby.lobby_index import get_lobby_rooms, parse_status, DEFAULT_PAGE_SIZE
+from lobby.server_message_types import GAME_LIST_RESPONSE
+
+
+def get_game_list(data=None):
+    # optional "status", "page" and "page_size" fields of request_game_list select the page of rooms to send
+    data = data or {}
+    return get_lobby_rooms(data.get('status'), data.get('page', 1), data.get('page_size', DEFAULT_PAGE_SIZE))
+
+
+class AsyncGameConsumer(GameCommandHandlers, AsyncWebsocketConsumer):
+    """
+    Game room consumer running on the event loop.
+
+    Each inbound command is queued on its room's command queue and applied by the room's single writer on the
+    bounded ORM executor, in the order the room received it. Messages the handlers produce are collected in the
+    outbox, lobby events in the lobby outbox, and both are sent from the event loop once the command is done.
+
+    With batch_messages enabled the whole outbox goes out as one list frame, encoded once for the group.
+    """
+    batch_messages = getattr(settings, 'KOT_BATCH_MESSAGES', False)
+
+    async def connect(self):
+        self.room_name = self.scope['url_route']['kwargs']['room_name']
+        self.room_group_name = 'kot_%s' % self.room_name
+        self.outbox = []
+        self.lobby_outbox = []
+        room_registry.add_client(self.room_name)
+
+        # Join room group
+        await self.channel_layer.group_add(
+            self.room_group_name,
+            self.channel_name
+        )
+        await self.accept()
+
+    async def disconnect(self, close_code):
+        # leave group room
+        await self.channel_layer.group_discard(
+            self.room_group_name,
+            self.channel_name
+        )
+        # queued behind the room's commands, the last client to leave writes the room back and evicts it
+        await run_in_room_queue(self.room_name, room_registry.remove_client, self.room_name)
+
+    async def receive(self, text_data=None, bytes_data=None):
+        data = json.loads(text_data)
+        outbox, lobby_outbox = await run_in_room_queue(data['room'], self.apply_command_collecting_messages, data)
+        if self.batch_messages:
+            if outbox:
+                await self.send_group_frame(create_batched_frame(outbox))
+        else:
+            for message in outbox:
+                await self.send_group_message(message)
+        for event in lobby_outbox:
+            await self.channel_layer.group_send(LOBBY_UPDATES_GROUP, event)
+
+    def apply_command_collecting_messages(self, data):
+        self.outbox = []
+        self.lobby_outbox = []
+        try:
+            self.apply_command(data)
+            return self.outbox, self.lobby_outbox
+        finally:
+            self.outbox = []
+            self.lobby_outbox = []
+
+    async def send_group_message(self, message):
+        # Send message to room group
+        await self.channel_layer.group_send(
+            self.room_group_name,
+            {
+                'type': 'group_message',
+                'message': message
+            }
+        )
+
+    async def send_group_frame(self, text):
+        await self.channel_layer.group_send(
+            self.room_group_name,
+            {
+                'type': 'group_frame',
+                'text': text
+            }
+        )
+
+    # Receive message from room group
+    async def group_message(self, event):
+        message = event['message']
+        # Send message to WebSocket
+        await self.send(text_data=json.dumps(message))
+
+    # Receive an already encoded frame from room group
+    async def group_frame(self, event):
+        await self.send(text_data=event['text'])
+
+    def send_to_client(self, message_type, username, room, payload):
+        # called from the executor thread, delivered by receive once the command finishes
+        self.outbox.append(create_send_response_to_client(message_type, username, room, payload))
+
+    def send_lobby_event(self, event):
+        self.lobby_outbox.append(event)
+
+
+class AsyncLobbyConsumer(AsyncWebsocketConsumer):
+    async def connect(self):
+        self.room_name = self.scope['url_route']['kwargs']['room_name']
+        self.room_group_name = 'kot_lobby_%s' % self.room_name
+        self.subscriber = None
+        self.subscription_status = None
+
+        # Join room group
+        await self.channel_layer.group_add(
+            self.room_group_name,
+            self.channel_name
+        )
+        await self.accept()
+
+    async def disconnect(self, close_code):
+        # leave group room
+        await self.channel_layer.group_discard(
+            self.room_group_name,
+            self.channel_name
+        )
+        await self.channel_layer.group_discard(LOBBY_UPDATES_GROUP, self.channel_name)
+
+    async def receive(self, text_data=None, bytes_data=None):
+        data = json.loads(text_data)
+        await self.commands[data['command']](self, data)
+
+    async def send_self_message(self, message_type, payload):
+        content = create_send_response_to_client(message_type, self.subscriber, self.room_name, payload)
+        await self.send(text_data=json.dumps(content))
+
+    async def send_group_message(self, message):
+        # Send message to room group
+        await self.channel_layer.group_send(
+            self.room_group_name,
+            {
+                'type': 'group_message',
+                'message': message
+            }
+        )
+
+    # Receive message from room group
+    async def group_message(self, event):
+        message = event['message']
+        # Send message to WebSocket
+        await self.send(text_data=json.dumps(message))
+
+    async def send_to_client(self, message_type, username, room, payload):
+        content = create_send_response_to_client(message_type, username, room, payload)
+        await self.send_group_message(content)
+
+    async def request_game_list(self, data):
+        username = data['user']
+        room = data['room']
+
+        rooms = await run_in_orm_executor(get_game_list, data)
+        await self.send_to_client(GAME_LIST_RESPONSE, username, room, rooms)
+
+    async def subscribe_game_list(self, data):
+        self.subscriber = data['user']
+        self.subscription_status = parse_status(data.get('status'))
+        # join before reading the snapshot so no change falls in between, replayed updates are harmless
+        await self.channel_layer.group_add(LOBBY_UPDATES_GROUP, self.channel_name)
+        rooms = await run_in_orm_executor(get_game_list, data)
+        await self.send_self_message(GAME_LIST_RESPONSE, rooms)
+
+    async def unsubscribe_game_list(self, data):
+        await self.channel_layer.group_discard(LOBBY_UPDATES_GROUP, self.channel_name)
+
+    # Receive a room change published by a game room
+    async def lobby_room_event(self, event):
+        message = lobby_room_message(event, self.subscription_status)
+        if message:
+            await self.send_self_message(*message)
+
+    commands = {
+        'request_game_list': request_game_list,
+        'subscribe_game_list': subscribe_game_list,
+        'unsubscribe_game_list': unsubscribe_game_list
+    }
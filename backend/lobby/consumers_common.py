@@ -1,22 +1,96 @@
-import pickle
+import asyncio
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
 
-from game.engine.board import BoardGame
+from django.conf import settings
+from django.db import close_old_connections
+
+from game.irepository.analytics_writer import AnalyticsWriter, DEFAULT_BATCH_SIZE as DEFAULT_ANALYTICS_BATCH_SIZE, \
+    DEFAULT_FLUSH_INTERVAL as DEFAULT_ANALYTICS_FLUSH_INTERVAL
 from game.models import GameState
+from lobby.game_event_log import RoomEventLog, DEFAULT_SNAPSHOT_INTERVAL
+from lobby.lobby_index import update_lobby_room
+from lobby.room_command_queue import RoomCommandQueue, DEFAULT_BATCH_SIZE
+from lobby.room_registry import RoomRegistry, DEFAULT_FLUSH_INTERVAL
+
+DEFAULT_ORM_WORKERS = 8
+
+
+SNAPSHOT_INTERVAL = getattr(settings, 'KOT_EVENT_SNAPSHOT_INTERVAL', DEFAULT_SNAPSHOT_INTERVAL)
+
+
+def load_game(room):
+    game, created = GameState.objects.get_or_create(room_name=room)
+    # the room's changes are appended to its event log, GameState.board only holds the latest full snapshot
+    game.event_log = RoomEventLog(game, SNAPSHOT_INTERVAL)
+    return game, game.event_log.recover()
+
+
+def persist_game(game, state):
+    game.event_log.flush(state)
+    update_lobby_room(game.room_name, state)
+
+
+room_registry = RoomRegistry(load_game, persist_game,
+                             getattr(settings, 'KOT_ROOM_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL))
+
+
+# Dice and Play analytics rows are batched and written by their own flusher, never by a game command
+analytics_writer = AnalyticsWriter(getattr(settings, 'KOT_ANALYTICS_BATCH_SIZE', DEFAULT_ANALYTICS_BATCH_SIZE),
+                                   getattr(settings, 'KOT_ANALYTICS_FLUSH_INTERVAL', DEFAULT_ANALYTICS_FLUSH_INTERVAL))
+
+
+# bounded pool the async consumers use for ORM and game state work, keeps the event loop free for socket traffic
+orm_executor = ThreadPoolExecutor(max_workers=getattr(settings, 'KOT_ORM_WORKERS', DEFAULT_ORM_WORKERS),
+                                  thread_name_prefix='kot-orm')
+
+
+def _run_with_db_connection(func, *args):
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        close_old_connections()
+
+
+async def run_in_orm_executor(func, *args):
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(orm_executor, functools.partial(_run_with_db_connection, func, *args))
+
+
+# game commands of a room are applied in order by a single writer, rooms side by side on the ORM executor
+room_command_queue = RoomCommandQueue(orm_executor,
+                                      getattr(settings, 'KOT_ROOM_COMMAND_BATCH_SIZE', DEFAULT_BATCH_SIZE))
+
+
+async def run_in_room_queue(room, func, *args):
+    future = room_command_queue.submit(room, _run_with_db_connection, func, *args)
+    return await asyncio.wrap_future(future)
 
 
 def reconstruct_game(data):
     username = data['user']
     room = data['room']
 
-    game = GameState.objects.get(room_name=room)
-    # deserialize then store GameState object
-    state: BoardGame = pickle.loads(game.board)
-    return username, room, game, state
+    entry = room_registry.get(room)
+    return username, room, entry.game, entry.state
+
+
+def record_game_event(entry, command, actions):
+    # called under the room lock once a command is applied
+    if entry.game.event_log.record(command, actions, entry.state):
+        entry.dirty = True
 
 
 def save_game(game, state):
-    game.board = pickle.dumps(state)
-    game.save()
+    # the resident state is written back by the room registry flusher
+    room_registry.mark_dirty(game.room_name, state)
+
+
+def create_batched_frame(messages):
+    # one websocket frame carrying every envelope produced by a command, encoded once for the whole group
+    return json.dumps(messages)
 
 
 def create_send_response_to_client(command, username, room, payload):
@@ -0,0 +1,96 @@
+from django.db import transaction
+
+from game.engine.board import BoardGame
+from game.engine.event_log import encode_actions, decode_actions, snapshot_delta, apply_snapshot_delta
+from game.engine.snapshot import is_board_snapshot
+from game.engine.replay import ActionLog, snapshot_hash
+from game.models import GameEvent, GameState
+
+DEFAULT_SNAPSHOT_INTERVAL = 50
+
+FLUSH_COMMAND = 'flush'
+
+
+class RoomEventLog:
+    """
+    Append-only log of the changes made to a room's BoardGame, on top of the full snapshot in GameState.board.
+
+    Every command that changes the room is recorded as a GameEvent holding the turn actions it played and the delta
+    of the board's snapshot (game/engine/event_log.py). Flushing appends the queued events, and only every
+    snapshot_interval events (and on the room's first flush) rewrites GameState.board with a full snapshot and the
+    sequence of the last event it covers. recover() rebuilds the board from that snapshot and the events after it.
+    """
+
+    def __init__(self, game: GameState, snapshot_interval=DEFAULT_SNAPSHOT_INTERVAL):
+        self.game = game
+        self.snapshot_interval = snapshot_interval
+        # snapshot and sequence of the last event recorded, flushed or not
+        self.snapshot = bytes(game.board)
+        self.sequence = game.event_sequence
+        self.pending = []
+
+    def recover(self):
+        """Returns the room's board, the latest full snapshot with the events logged after it replayed."""
+        events = GameEvent.objects.filter(room_name=self.game.room_name, sequence__gt=self.sequence) \
+            .order_by('sequence').values_list('sequence', 'changes')
+        for sequence, changes in events:
+            self.snapshot = apply_snapshot_delta(self.snapshot, changes)
+            self.sequence = sequence
+        if not self.snapshot:
+            return BoardGame()
+        board = BoardGame.from_bytes(self.snapshot)
+        if not is_board_snapshot(self.snapshot):
+            # a board pickled before there were snapshots, stored again as a snapshot so it is converted only once
+            self.snapshot = board.to_bytes()
+            GameState.objects.filter(pk=self.game.pk).update(board=self.snapshot)
+            self.game.board = self.snapshot
+        return board
+
+    def record(self, command, actions, state):
+        """
+        Queues an event for the turn actions command played and the change it made to state.
+        Returns False when there was nothing to record.
+        """
+        snapshot = state.to_bytes()
+        changes = snapshot_delta(self.snapshot, snapshot)
+        if not changes and not actions:
+            return False
+        self.sequence += 1
+        self.pending.append(GameEvent(room_name=self.game.room_name, sequence=self.sequence, command=command,
+                                      actions=encode_actions(actions), changes=changes))
+        self.snapshot = snapshot
+        return True
+
+    def flush(self, state):
+        """Appends the queued events, and a change of state no command recorded, then snapshots when one is due."""
+        self.record(FLUSH_COMMAND, [], state)
+        take_snapshot = not self.game.board or self.sequence - self.game.event_sequence >= self.snapshot_interval
+        with transaction.atomic():
+            GameEvent.objects.bulk_create(self.pending)
+            if take_snapshot:
+                GameState.objects.filter(pk=self.game.pk).update(board=self.snapshot, event_sequence=self.sequence)
+        self.pending = []
+        if take_snapshot:
+            self.game.board = self.snapshot
+            self.game.event_sequence = self.sequence
+
+
+def room_action_log(room):
+    """
+    ActionLog (see game.engine.replay) of the game played in room, from the first turn action on, with a checkpoint
+    after every command. The room's event log must go back to its creation. Returns None before the first action.
+    """
+    snapshot = b""
+    log = None
+    events = GameEvent.objects.filter(room_name=room).order_by('sequence').values_list('actions', 'changes')
+    for actions, changes in events:
+        actions = decode_actions(actions)
+        snapshot = apply_snapshot_delta(snapshot, changes)
+        if actions and log is None:
+            # the command that starts the game may also seat its last player
+            board = BoardGame.from_bytes(snapshot)
+            log = ActionLog(board.seed, [(player.username, player.monster_name) for player in board.players.players])
+        if log is not None:
+            log.actions += [(None, action) for action in actions]
+            log.checkpoints[len(log.actions)] = snapshot_hash(snapshot)
+    return log
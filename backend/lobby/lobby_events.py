@@ -0,0 +1,49 @@
+from game.player.player_status_resolver import player_status_summary_to_JSON
+from lobby.server_message_types import ROOM_ADDED, ROOM_UPDATED, ROOM_REMOVED
+
+# every lobby consumer that subscribed to the game list listens on this group
+LOBBY_UPDATES_GROUP = 'kot_lobby_updates'
+
+
+def lobby_room_key(state):
+    # what the lobby shows of a room, per turn changes like health or energy are left to request_game_list
+    return state.status, tuple((player.username, player.monster_name, player.is_alive)
+                               for player in state.players.players)
+
+
+def lobby_room_summary(state):
+    return {
+        'status': state.status.name.lower(),
+        'player_count': len(state.players.players),
+        'players': player_status_summary_to_JSON(state.players)
+    }
+
+
+def create_lobby_room_event(room, previous, current):
+    return {
+        'type': 'lobby_room_event',
+        'room': room,
+        'previous': previous,
+        'current': current
+    }
+
+
+def _is_listed(summary, status):
+    # same rooms as lobby_index.get_lobby_rooms lists
+    if summary is None or not summary['player_count']:
+        return False
+    return status is None or summary['status'] == status.name.lower()
+
+
+def lobby_room_message(event, status=None):
+    """
+    Translates a room event into the (message_type, payload) a subscriber filtering on status should get, or None
+    when the room is not part of its list before nor after the change.
+    """
+    was_listed = _is_listed(event['previous'], status)
+    if _is_listed(event['current'], status):
+        payload = dict(event['current'], room=event['room'])
+        return (ROOM_UPDATED if was_listed else ROOM_ADDED), payload
+    if was_listed:
+        return ROOM_REMOVED, {'room': event['room']}
+    return None
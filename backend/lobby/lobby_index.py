@@ -0,0 +1,53 @@
+from game.models import GameState
+from game.player.player_status_resolver import player_status_summary_to_JSON
+from game.values.status import Status
+from lobby.game_event_log import RoomEventLog
+from lobby.models import LobbyRoom
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def update_lobby_room(room, state):
+    LobbyRoom.objects.update_or_create(
+        room_name=room,
+        defaults={
+            'status': str(state.status.value),
+            'player_count': len(state.players.players),
+            'players': player_status_summary_to_JSON(state.players),
+        })
+
+
+def parse_status(status):
+    # the lobby filters by status name, e.g. "setup" for rooms still waiting for players
+    if status is None or isinstance(status, Status):
+        return status
+    try:
+        return Status[str(status).upper()]
+    except KeyError:
+        raise ValueError("Unknown room status {}".format(status))
+
+
+def get_lobby_rooms(status=None, page=1, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Returns one page of lobby rooms as {room_name: players_json}, most recently updated first.
+    A page holding fewer than page_size rooms is the last one. Rooms nobody joined are left out, as they are from
+    the updates pushed to lobby subscribers (see lobby.lobby_events).
+    """
+    page = max(int(page), 1)
+    page_size = min(max(int(page_size), 1), MAX_PAGE_SIZE)
+    rooms = LobbyRoom.objects.only('room_name', 'players').filter(player_count__gt=0)
+    status = parse_status(status)
+    if status is not None:
+        rooms = rooms.filter(status=str(status.value))
+    start = (page - 1) * page_size
+    return {room.room_name: room.players for room in rooms[start:start + page_size]}
+
+
+def rebuild_lobby_index():
+    # one-off backfill for rooms saved before the index existed
+    for game in GameState.objects.all():
+        event_log = RoomEventLog(game)
+        state = event_log.recover()
+        if event_log.snapshot:
+            update_lobby_room(game.room_name, state)
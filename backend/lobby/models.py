@@ -1,3 +1,25 @@
 from django.db import models
 
-# Create your models here.
+
+class LobbyRoom(models.Model):
+    """
+    Lobby listing of a game room, updated every time the room is saved so the lobby never has to
+    deserialize game boards.
+    """
+    ROOM_STATUS = (
+        ('0', 'SETUP'),
+        ('1', 'ACTIVE'),
+        ('2', 'COMPLETED'),
+    )
+    room_name = models.CharField(max_length=30, unique=True)
+    status = models.CharField(max_length=1, choices=ROOM_STATUS, db_index=True)
+    player_count = models.IntegerField(default=0)
+    # player_status_summary_to_JSON of the room, sent to the lobby as is
+    players = models.TextField(default='[]')
+    last_updated = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        ordering = ['-last_updated', '-id']
+
+    def __str__(self):
+        return self.room_name
@@ -0,0 +1,65 @@
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+DEFAULT_BATCH_SIZE = 32
+
+
+class RoomCommandQueue:
+    """
+    Applies the commands of every room one at a time and in arrival order, each room on one worker thread at most.
+
+    submit(room, func, *args) queues a command and returns a concurrent.futures.Future of its result. The first
+    command of an idle room schedules a drain of that room on the executor; commands arriving while it runs are
+    queued behind it instead of taking an executor thread to wait on the room lock. So a busy room holds one
+    thread however many messages its players send, and different rooms are drained side by side on the executor's
+    other threads.
+
+    A drain hands its thread back after batch_size commands and queues itself again, so one busy room can not keep
+    a thread from the other rooms.
+    """
+
+    def __init__(self, executor, batch_size=DEFAULT_BATCH_SIZE):
+        self.executor = executor
+        self.batch_size = batch_size
+        self.__commands = {}
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        """Number of rooms with commands queued or being applied."""
+        return len(self.__commands)
+
+    def submit(self, room, func, *args):
+        future = Future()
+        with self.__lock:
+            commands = self.__commands.get(room)
+            if commands is not None:
+                # a drain of the room is scheduled or running and will get to it
+                commands.append((future, func, args))
+                return future
+            self.__commands[room] = deque([(future, func, args)])
+        self.executor.submit(self.__drain, room)
+        return future
+
+    def __drain(self, room):
+        for _ in range(self.batch_size):
+            with self.__lock:
+                commands = self.__commands[room]
+                if not commands:
+                    del self.__commands[room]
+                    return
+                future, func, args = commands.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = func(*args)
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        with self.__lock:
+            if not self.__commands[room]:
+                del self.__commands[room]
+                return
+        self.executor.submit(self.__drain, room)
@@ -0,0 +1,149 @@
+import atexit
+import logging
+import threading
+
+from django.db import close_old_connections
+
+from game.player.player_status_resolver import PlayerStatusTracker
+
+DEFAULT_FLUSH_INTERVAL = 2.0
+
+
+class RoomEntry:
+    def __init__(self, game, state):
+        self.game = game
+        self.state = state
+        self.lock = threading.RLock()
+        self.dirty = False
+        self.status_tracker = PlayerStatusTracker()
+        # what lobby subscribers were last told about the room, see lobby.lobby_events
+        self.lobby_key = None
+        self.lobby_summary = None
+
+
+class RoomRegistry:
+    """
+    Keeps the live BoardGame of every active room resident in this process.
+
+    Handlers mutate the resident state while holding the room lock and then mark the room dirty. Dirty rooms are
+    written back by a background flusher every flush_interval seconds (write-behind), so a websocket message costs
+    an in-memory mutation instead of a load/save round-trip. Rooms must be served by a single process, which is
+    already the case with the InMemoryChannelLayer.
+
+    load_room(room) returns the (game, state) pair for a room, persist_room(game, state) writes it back.
+
+    Consumers report the clients of a room with add_client(room) and remove_client(room); a room is evicted, and
+    written back one last time, when its last client leaves or its game has a winner (see evict_if_finished).
+    """
+
+    def __init__(self, load_room, persist_room, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        self.__load_room = load_room
+        self.__persist_room = persist_room
+        self.flush_interval = flush_interval
+        self.__rooms = {}
+        self.__clients = {}
+        self.__rooms_lock = threading.Lock()
+        self.__flusher = None
+        self.__stop_flusher = threading.Event()
+
+    def __contains__(self, room):
+        return room in self.__rooms
+
+    def __len__(self):
+        return len(self.__rooms)
+
+    def get(self, room) -> RoomEntry:
+        entry = self.__rooms.get(room)
+        if entry is None:
+            game, state = self.__load_room(room)
+            with self.__rooms_lock:
+                # another thread may have loaded the room while we were reading it, keep the first one
+                entry = self.__rooms.setdefault(room, RoomEntry(game, state))
+            self.start_flusher()
+        return entry
+
+    def lock(self, room):
+        return self.get(room).lock
+
+    def mark_dirty(self, room, state=None):
+        entry = self.get(room)
+        with entry.lock:
+            if state is not None:
+                entry.state = state
+            entry.dirty = True
+
+    def flush(self, room):
+        entry = self.__rooms.get(room)
+        if entry is None:
+            return
+        with entry.lock:
+            if entry.dirty:
+                self.__persist_room(entry.game, entry.state)
+                entry.dirty = False
+
+    def flush_dirty_rooms(self):
+        for room in list(self.__rooms):
+            try:
+                self.flush(room)
+            except Exception:
+                # room stays dirty and is retried on the next flush
+                logging.exception('Unable to persist room %s', room)
+
+    def evict(self, room):
+        entry = self.__rooms.get(room)
+        if entry is None:
+            return
+        with entry.lock:
+            # a failed write raises and keeps the room resident, so its changes are not lost
+            self.flush(room)
+            with self.__rooms_lock:
+                self.__rooms.pop(room, None)
+
+    def evict_if_finished(self, room):
+        entry = self.__rooms.get(room)
+        if entry is not None and entry.state.winner is not None:
+            self.evict(room)
+
+    def client_count(self, room):
+        return self.__clients.get(room, 0)
+
+    def add_client(self, room):
+        with self.__rooms_lock:
+            self.__clients[room] = self.__clients.get(room, 0) + 1
+
+    def remove_client(self, room):
+        with self.__rooms_lock:
+            clients = self.__clients.get(room, 0) - 1
+            if clients > 0:
+                self.__clients[room] = clients
+                return
+            self.__clients.pop(room, None)
+        self.evict(room)
+
+    def start_flusher(self):
+        if self.__flusher is not None or self.flush_interval is None:
+            return
+        with self.__rooms_lock:
+            if self.__flusher is not None:
+                return
+            self.__flusher = threading.Thread(target=self.__run_flusher, name='kot-room-flusher', daemon=True)
+            self.__flusher.start()
+        atexit.register(self.flush_dirty_rooms)
+
+    def stop_flusher(self):
+        if self.__flusher is None:
+            return
+        self.__stop_flusher.set()
+        self.__flusher.join()
+        self.__flusher = None
+        self.__stop_flusher.clear()
+        self.flush_dirty_rooms()
+
+    def __run_flusher(self):
+        while not self.__stop_flusher.wait(self.flush_interval):
+            # the flusher thread keeps its own database connection, drop it once it is stale or broken
+            close_old_connections()
+            try:
+                self.flush_dirty_rooms()
+            finally:
+                close_old_connections()
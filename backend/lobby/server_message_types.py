@@ -8,3 +8,8 @@ YIELD_ALERT = 'yield_alert'
 YIELD_FORCE_ALERT = 'yield_force_alert'
 END_TURN = 'allow_end_turn_response'
 WINNER_ALERT = 'winner_alert'
+PLAYER_STATUS_SNAPSHOT_RESPONSE = 'player_status_snapshot_response'
+PLAYER_STATUS_DELTA_RESPONSE = 'player_status_delta_response'
+ROOM_ADDED = 'room_added'
+ROOM_UPDATED = 'room_updated'
+ROOM_REMOVED = 'room_removed'
@@ -0,0 +1,149 @@
+import pickle
+
+import pytest
+
+from game.deck.deck_handler import DeckHandler
+from game.dice.dice_handler import DiceHandler
+from game.engine.board import BoardGame
+from game.engine.player_queue import GamePlayers
+from game.engine.event_log import decode_actions
+from game.engine.replay import replay_game
+from game.engine.turn import RollAction, ResolveAction, EndTurnAction
+from game.models import GameEvent, GameState
+from game.player.player import Player
+from game.values.status import Status
+from lobby.game_event_log import RoomEventLog, room_action_log
+
+
+def load(room, snapshot_interval=3):
+    game, created = GameState.objects.get_or_create(room_name=room)
+    event_log = RoomEventLog(game, snapshot_interval)
+    return event_log, event_log.recover()
+
+
+def record_actions(event_log, state, *actions):
+    for action in actions:
+        state.apply(action)
+        event_log.record('test', [action], state)
+
+
+def started_room(room, snapshot_interval=3):
+    event_log, state = load(room, snapshot_interval)
+    for username in ['alice', 'bob']:
+        state.add_player(Player(username))
+        event_log.record('join', [], state)
+    state.start_game()
+    event_log.record('start', [], state)
+    event_log.flush(state)
+    return event_log, state
+
+
+@pytest.mark.django_db(transaction=True)
+def test_new_room_recovers_an_empty_board():
+    event_log, state = load('Room1')
+
+    assert isinstance(state, BoardGame)
+    assert state.players.players == []
+    assert event_log.sequence == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_first_flush_snapshots_the_room():
+    event_log, state = started_room('Room1')
+
+    game = GameState.objects.get(room_name='Room1')
+    assert bytes(game.board) == state.to_bytes()
+    assert game.event_sequence == GameEvent.objects.filter(room_name='Room1').count() == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_events_are_appended_between_snapshots():
+    event_log, state = started_room('Room1')
+    snapshot = bytes(GameState.objects.get(room_name='Room1').board)
+
+    record_actions(event_log, state, RollAction('alice'), ResolveAction('alice'))
+    event_log.flush(state)
+
+    assert bytes(GameState.objects.get(room_name='Room1').board) == snapshot
+    events = GameEvent.objects.filter(room_name='Room1', sequence__gt=3)
+    assert [decode_actions(event.actions) for event in events] == [[RollAction('alice')], [ResolveAction('alice')]]
+    assert all(len(event.changes) < len(snapshot) for event in events)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_snapshot_is_taken_every_interval():
+    event_log, state = started_room('Room1')
+
+    record_actions(event_log, state, RollAction('alice'), ResolveAction('alice'), EndTurnAction('alice'))
+    event_log.flush(state)
+
+    game = GameState.objects.get(room_name='Room1')
+    assert game.event_sequence == 6
+    assert bytes(game.board) == state.to_bytes()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_recovery_replays_the_log_after_the_snapshot():
+    event_log, state = started_room('Room1')
+    record_actions(event_log, state, RollAction('alice'), ResolveAction('alice'))
+    state.players.players[1].update_health_by(-1)
+    event_log.flush(state)
+
+    recovered_log, recovered = load('Room1')
+
+    assert recovered.to_bytes() == state.to_bytes()
+    assert recovered_log.sequence == event_log.sequence == 6
+    assert GameEvent.objects.get(room_name='Room1', sequence=6).command == 'flush'
+    assert recovered.apply(EndTurnAction('alice')).username == 'bob'
+
+
+@pytest.mark.django_db(transaction=True)
+def test_unchanged_board_is_not_recorded():
+    event_log, state = started_room('Room1')
+
+    assert not event_log.record('noop', [], state)
+    event_log.flush(state)
+
+    assert GameEvent.objects.filter(room_name='Room1').count() == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_room_action_log_replays_the_room():
+    event_log, state = started_room('Room1')
+    record_actions(event_log, state, RollAction('alice'), ResolveAction('alice'), EndTurnAction('alice'),
+                   RollAction('bob'))
+    event_log.flush(state)
+
+    log = room_action_log('Room1')
+
+    assert log.players == [('alice', None), ('bob', None)]
+    assert [action for words_drawn, action in log.actions] == [RollAction('alice'), ResolveAction('alice'),
+                                                                EndTurnAction('alice'), RollAction('bob')]
+    assert replay_game(log).to_bytes() == state.to_bytes()
+    assert room_action_log('Room2') is None
+
+
+def pickled_board(*usernames):
+    # a board as GameState.board held it before snapshots, laid out as the game classes were back then
+    def legacy(cls, **fields):
+        obj = cls.__new__(cls)
+        obj.__dict__.update(fields)
+        return obj
+
+    players = [legacy(Player, username=username, cards=[]) for username in usernames]
+    return pickle.dumps(legacy(BoardGame, players=legacy(GamePlayers, players=players, current_player=None,
+                                                         player_cycle=[]),
+                               status=Status.SETUP, winner=None, deck_handler=legacy(DeckHandler),
+                               dice_handler=legacy(DiceHandler, dice_values=[], re_rolls_left=0)), protocol=3)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_pickled_board_is_converted_once():
+    GameState.objects.create(room_name='Room1', board=pickled_board('alice', 'bob'))
+
+    event_log, state = load('Room1')
+
+    assert [player.username for player in state.players.players] == ['alice', 'bob']
+    stored = bytes(GameState.objects.get(room_name='Room1').board)
+    assert stored == event_log.snapshot == state.to_bytes()
+    assert load('Room1')[1].to_bytes() == stored
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from game.engine.board import BoardGame
+from game.player.player import Player
+from game.values.status import Status
+from lobby.lobby_events import lobby_room_key, lobby_room_summary, create_lobby_room_event, lobby_room_message
+from lobby.server_message_types import ROOM_ADDED, ROOM_UPDATED, ROOM_REMOVED
+
+
+@pytest.fixture(autouse=True)
+def state():
+    state = BoardGame()
+    state.add_player(Player("first"))
+    return state
+
+
+def room_event(previous_state, change):
+    previous = lobby_room_summary(previous_state)
+    change(previous_state)
+    return create_lobby_room_event("Room1", previous, lobby_room_summary(previous_state))
+
+
+def test_key_ignores_per_turn_changes(state):
+    key = lobby_room_key(state)
+    state.players.players[0].update_health_by(-2)
+    state.players.players[0].update_energy_by(3)
+    assert lobby_room_key(state) == key
+
+
+def test_key_changes_with_roster_and_status(state):
+    key = lobby_room_key(state)
+    state.add_player(Player("second"))
+    assert lobby_room_key(state) != key
+
+    key = lobby_room_key(state)
+    state.start_game()
+    assert lobby_room_key(state) != key
+
+
+def test_first_player_adds_room():
+    event = create_lobby_room_event("Room1", lobby_room_summary(BoardGame()), None)
+    assert lobby_room_message(event) is None
+
+    state = BoardGame()
+    event = room_event(state, lambda s: s.add_player(Player("first")))
+    message_type, payload = lobby_room_message(event)
+
+    assert message_type == ROOM_ADDED
+    assert payload["room"] == "Room1"
+    assert payload["status"] == "setup"
+    assert payload["player_count"] == 1
+    assert [player["username"] for player in json.loads(payload["players"])] == ["first"]
+
+
+def test_joining_player_updates_room(state):
+    event = room_event(state, lambda s: s.add_player(Player("second")))
+    message_type, payload = lobby_room_message(event)
+
+    assert message_type == ROOM_UPDATED
+    assert payload["player_count"] == 2
+
+
+def test_room_leaving_status_filter_is_removed(state):
+    event = room_event(state, lambda s: s.start_game())
+
+    assert lobby_room_message(event, Status.SETUP) == (ROOM_REMOVED, {"room": "Room1"})
+    assert lobby_room_message(event, Status.ACTIVE)[0] == ROOM_ADDED
+    assert lobby_room_message(event, Status.COMPLETED) is None
+    assert lobby_room_message(event)[0] == ROOM_UPDATED
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from game.engine.board import BoardGame
+from game.models import GameState
+from game.player.player import Player
+from lobby.lobby_events import create_lobby_room_event, lobby_room_message, lobby_room_summary
+from lobby.lobby_index import update_lobby_room, get_lobby_rooms, rebuild_lobby_index
+from lobby.models import LobbyRoom
+
+
+def make_state(*usernames, start=False):
+    state = BoardGame()
+    for username in usernames:
+        state.add_player(Player(username))
+    if start:
+        state.start_game()
+    return state
+
+
+@pytest.mark.django_db(transaction=True)
+def test_update_lobby_room_keeps_one_row_per_room():
+    update_lobby_room('Room1', make_state('one'))
+    update_lobby_room('Room1', make_state('one', 'two', start=True))
+
+    room = LobbyRoom.objects.get(room_name='Room1')
+    assert LobbyRoom.objects.count() == 1
+    assert room.status == '1'
+    assert room.player_count == 2
+    assert [player['username'] for player in json.loads(room.players)] == ['one', 'two']
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_lobby_rooms_most_recent_first():
+    for room in ['Room1', 'Room2', 'Room3']:
+        update_lobby_room(room, make_state(room + '_player'))
+    update_lobby_room('Room1', make_state('Room1_player', 'late_player'))
+
+    assert list(get_lobby_rooms()) == ['Room1', 'Room3', 'Room2']
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_lobby_rooms_pages():
+    for index in range(5):
+        update_lobby_room('Room{}'.format(index), make_state('player'))
+
+    assert list(get_lobby_rooms(page=1, page_size=2)) == ['Room4', 'Room3']
+    assert list(get_lobby_rooms(page=3, page_size=2)) == ['Room0']
+    assert get_lobby_rooms(page=4, page_size=2) == {}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_lobby_rooms_filters_by_status():
+    update_lobby_room('Waiting', make_state('one'))
+    update_lobby_room('Playing', make_state('one', 'two', start=True))
+
+    assert list(get_lobby_rooms(status='setup')) == ['Waiting']
+    assert list(get_lobby_rooms(status='ACTIVE')) == ['Playing']
+    with pytest.raises(ValueError):
+        get_lobby_rooms(status='paused')
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rebuild_lobby_index_from_saved_boards():
+    GameState.objects.create(room_name='Saved', board=make_state('one').to_bytes())
+    GameState.objects.create(room_name='Empty')
+
+    rebuild_lobby_index()
+
+    assert list(get_lobby_rooms()) == ['Saved']
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_lobby_rooms_leaves_out_empty_rooms():
+    update_lobby_room('Empty', make_state())
+    update_lobby_room('Joined', make_state('one'))
+
+    assert list(get_lobby_rooms()) == ['Joined']
+    assert lobby_room_message(create_lobby_room_event('Empty', None, lobby_room_summary(make_state()))) is None
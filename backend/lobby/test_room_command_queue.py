@@ -0,0 +1,67 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lobby.room_command_queue import RoomCommandQueue
+
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(max_workers=4)
+    yield executor
+    executor.shutdown()
+
+
+def test_commands_of_a_room_run_in_order_one_at_a_time(executor):
+    queue = RoomCommandQueue(executor, batch_size=3)
+    applied = []
+    running = []
+
+    def command(i):
+        running.append(i)
+        assert len(running) == 1
+        time.sleep(.001)
+        applied.append(i)
+        running.remove(i)
+        return i
+
+    futures = [queue.submit('room1', command, i) for i in range(20)]
+
+    assert [future.result(timeout=5) for future in futures] == list(range(20))
+    assert applied == list(range(20))
+
+
+def test_rooms_run_side_by_side(executor):
+    queue = RoomCommandQueue(executor)
+    both_running = threading.Barrier(2, timeout=5)
+
+    futures = [queue.submit(room, both_running.wait) for room in ('room1', 'room2')]
+
+    for future in futures:
+        future.result(timeout=5)
+
+
+def test_a_failing_command_does_not_stop_the_room(executor):
+    queue = RoomCommandQueue(executor)
+
+    def fail():
+        raise ValueError("bad command")
+
+    failed = queue.submit('room1', fail)
+    after = queue.submit('room1', lambda: 'applied')
+
+    with pytest.raises(ValueError):
+        failed.result(timeout=5)
+    assert after.result(timeout=5) == 'applied'
+
+
+def test_idle_rooms_are_forgotten(executor):
+    queue = RoomCommandQueue(executor, batch_size=2)
+    futures = [queue.submit('room{}'.format(i % 3), lambda: None) for i in range(10)]
+    for future in futures:
+        future.result(timeout=5)
+
+    executor.shutdown()
+    assert len(queue) == 0
@@ -0,0 +1,130 @@
+import pytest
+
+from game.engine.board import BoardGame
+from game.player.player import Player
+from lobby.room_registry import RoomRegistry
+
+
+class FakeGameState:
+    def __init__(self, room_name):
+        self.room_name = room_name
+
+
+@pytest.fixture(autouse=True)
+def storage():
+    return {'loads': [], 'saves': []}
+
+
+@pytest.fixture(autouse=True)
+def registry(storage):
+    def load_room(room):
+        storage['loads'].append(room)
+        return FakeGameState(room), BoardGame()
+
+    def persist_room(game, state):
+        storage['saves'].append((game.room_name, state))
+
+    return RoomRegistry(load_room, persist_room, flush_interval=None)
+
+
+def test_room_is_loaded_once_and_stays_resident(registry, storage):
+    state = registry.get('room1').state
+    state.add_player(Player('resident'))
+    assert registry.get('room1').state is state
+    assert storage['loads'] == ['room1']
+
+
+def test_rooms_are_independent(registry):
+    assert registry.get('room1').state is not registry.get('room2').state
+    assert registry.lock('room1') is not registry.lock('room2')
+
+
+def test_only_dirty_rooms_are_flushed(registry, storage):
+    registry.get('room1')
+    registry.get('room2')
+    registry.mark_dirty('room2')
+    registry.flush_dirty_rooms()
+    assert [room for room, _ in storage['saves']] == ['room2']
+
+    registry.flush_dirty_rooms()
+    assert len(storage['saves']) == 1
+
+
+def test_mark_dirty_replaces_state(registry, storage):
+    registry.get('room1')
+    new_state = BoardGame()
+    registry.mark_dirty('room1', new_state)
+    registry.flush('room1')
+    assert registry.get('room1').state is new_state
+    assert storage['saves'] == [('room1', new_state)]
+
+
+def test_evict_flushes_and_forgets_room(registry, storage):
+    registry.mark_dirty('room1')
+    registry.evict('room1')
+    assert 'room1' not in registry
+    assert len(storage['saves']) == 1
+
+
+def test_last_client_leaving_evicts_room(registry, storage):
+    registry.add_client('room1')
+    registry.add_client('room1')
+    registry.mark_dirty('room1')
+
+    registry.remove_client('room1')
+    assert 'room1' in registry
+    assert registry.client_count('room1') == 1
+
+    registry.remove_client('room1')
+    assert 'room1' not in registry
+    assert registry.client_count('room1') == 0
+    assert len(storage['saves']) == 1
+
+
+def test_finished_game_is_evicted(registry, storage):
+    state = registry.get('room1').state
+    registry.evict_if_finished('room1')
+    assert 'room1' in registry
+
+    state.winner = Player('winner')
+    registry.mark_dirty('room1')
+    registry.evict_if_finished('room1')
+    assert 'room1' not in registry
+    assert storage['saves'] == [('room1', state)]
+
+
+def test_failed_evict_keeps_room_resident():
+    def persist_room(game, state):
+        raise IOError("database is locked")
+
+    registry = RoomRegistry(lambda room: (FakeGameState(room), BoardGame()), persist_room, flush_interval=None)
+    registry.mark_dirty('room1')
+    with pytest.raises(IOError):
+        registry.evict('room1')
+    assert 'room1' in registry
+    assert registry.get('room1').dirty
+
+
+def test_failed_persist_keeps_room_dirty():
+    attempts = []
+
+    def persist_room(game, state):
+        attempts.append(game.room_name)
+        if len(attempts) == 1:
+            raise IOError("database is locked")
+
+    registry = RoomRegistry(lambda room: (FakeGameState(room), BoardGame()), persist_room, flush_interval=None)
+    registry.mark_dirty('room1')
+    registry.flush_dirty_rooms()
+    assert registry.get('room1').dirty
+    registry.flush_dirty_rooms()
+    assert not registry.get('room1').dirty
+    assert attempts == ['room1', 'room1']
+
+
+def test_background_flusher_writes_dirty_rooms(storage):
+    registry = RoomRegistry(lambda room: (FakeGameState(room), BoardGame()),
+                            lambda game, state: storage['saves'].append(game.room_name), flush_interval=0.01)
+    registry.mark_dirty('room1')
+    registry.stop_flusher()
+    assert storage['saves'] == ['room1']
@@ -0,0 +1,81 @@
+"""
+Replays a recorded game through the engine at full speed, see game/engine/replay.py.
+
+    python replay_game.py game.json                    replay a saved action log, checking its state hashes
+    python replay_game.py game.json --turn 12          stop at the start of turn 12 and show the players
+    python replay_game.py --room Room1 --save game.json
+                                                       take the action log of a room from the database
+    python replay_game.py --record game.json --seed 7  play an offline AI game and save its action log
+"""
+
+import argparse
+import os
+import time
+
+from game.engine.board import BoardGame
+from game.engine.replay import ActionLog, GameReplay, record_game, state_hash
+from game.player.ai_players.attack_ai_player import Attack_AI_Player
+from game.player.ai_players.final_ai_player import Final_AI_Player
+from game.player.ai_players.points_ai_player import Points_AI_Player
+from game.player.player_status_resolver import player_status_summary_to_JSON
+from run_offline_game import run_game
+
+
+def load_room_action_log(room):
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'kot.settings')
+    import django
+    django.setup()
+    from lobby.game_event_log import room_action_log
+    return room_action_log(room)
+
+
+def record_offline_game(seed):
+    board = BoardGame(seed)
+    board.add_player(Final_AI_Player(board.players, username="Final AI"))
+    board.add_player(Attack_AI_Player(board.players, username="Attack AI"))
+    board.add_player(Points_AI_Player(board.players, username="Points AI"))
+    winner, log = record_game(board, run_game)
+    print(f"Recorded {len(log.actions)} actions, the winner is {winner.username}")
+    return log
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded King of Tokyo game")
+    parser.add_argument("log", nargs="?", help="action log file to replay")
+    parser.add_argument("--room", help="replay the game of a room from its event log instead")
+    parser.add_argument("--record", metavar="LOG", help="play an offline AI game and save its action log to LOG")
+    parser.add_argument("--seed", type=int, help="seed of the recorded game")
+    parser.add_argument("--save", metavar="LOG", help="save the action log of --room to LOG")
+    parser.add_argument("--turn", type=int, help="stop at the start of this turn")
+    parser.add_argument("--no-verify", action="store_true", help="do not check the recorded state hashes")
+    args = parser.parse_args()
+
+    if args.record:
+        log = record_offline_game(args.seed)
+        log.save(args.record)
+        return
+    if args.room:
+        log = load_room_action_log(args.room)
+        if log is None:
+            parser.error(f"no turn action was logged for room {args.room}")
+        if args.save:
+            log.save(args.save)
+    elif args.log:
+        log = ActionLog.load(args.log)
+    else:
+        parser.error("give an action log, --room or --record")
+
+    replay = GameReplay(log, verify=not args.no_verify)
+    start = time.perf_counter()
+    board = replay.run() if args.turn is None else replay.run_to_turn(args.turn)
+    elapsed = time.perf_counter() - start
+
+    print(f"Replayed {replay.played} of {len(log.actions)} actions in {elapsed * 1000:.1f} ms, "
+          f"turn {replay.turn}, state {state_hash(board)}")
+    if board.winner is not None:
+        print(f"The winner is {board.winner.username}")
+    print(player_status_summary_to_JSON(board.players))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ from game.player.ai_players.final_ai_player import Final_AI_Player
 from game.player.ai_players.attack_ai_player import Attack_AI_Player
 from game.player.ai_players.master_ai_player import Master_AI_Player
 from game.player.ai_players.points_ai_player import Points_AI_Player
-from game.dice.dice_resolver import dice_resolution
+from game.engine.turn import RollAction, RerollAction, ResolveAction, YieldAction, EndTurnAction
 from game.player.player import Player
 from typing import List
 
@@ -16,61 +16,56 @@ def run_game(game_state, verbose=False):
     start_player = game_state.players.current_player
     while game_state.is_game_active():
         current_player = game_state.players.current_player
+        username = current_player.username
         if verbose:
-            print(f"\n{current_player.username} Turn {turn_counter}")
+            print(f"\n{username} Turn {turn_counter}")
 
-        # Tell the game to do initial turn actions such as the required first roll
-        game_state.start_turn_actions(current_player)
+        # The required first roll, turn start cards take effect first
+        game_state.apply(RollAction(username))
 
         # Print what current player rolled
         if verbose:
             print(
-                f"{current_player.username} rolled {game_state.dice_handler.dice_values}")
+                f"{username} rolled {game_state.dice_handler.dice_values}")
 
         # Select what dice to re-roll as long as there are allowed re-rolls
         # (Press enter to select nothing)
         while game_state.dice_handler.re_rolls_left != 0:
             if verbose:
-                print(f"{current_player.username} has \
+                print(f"{username} has \
                 {game_state.dice_handler.re_rolls_left} re-rolls left")
 
             # Get what user selected to re-roll
             if issubclass(type(current_player), Master_AI_Player):
                 to_re_roll = current_player.choose_dice_to_re_roll(
-                    game_state.dice_handler.dice_values, verbose=verbose)
+                    game_state.dice_handler.dice_values, verbose=verbose,
+                    re_rolls_left=game_state.dice_handler.re_rolls_left)
             else:
                 to_re_roll = current_player.choose_dice_to_re_roll(
                     game_state.dice_handler.dice_values)
 
             # log what was chosen
             if verbose:
-                print(f"{current_player.username} rerolls {to_re_roll}")
+                print(f"{username} rerolls {to_re_roll}")
 
-            # tell game state to perform re-roll
-            game_state.re_roll(to_re_roll)
+            game_state.apply(RerollAction(username, to_re_roll))
             if verbose:
-                print(f"{current_player.username} \
+                print(f"{username} \
                     rolled {game_state.dice_handler.dice_values}")
 
         # Give a chance for real player to hit enter to continue, AI just returns
         current_player.acknowledge()
 
-        # Game state acts on the resulting dice (heals, attacks, et)
-        dice_resolution(game_state.dice_handler.dice_values, current_player,
-                        game_state.players.get_all_alive_players_minus_current_player())
+        # Game state acts on the resulting dice (heals, attacks, et), then
+        # everyone attacked in Tokyo gets a chance to yield it
+        for player in game_state.apply(ResolveAction(username)):
+            game_state.apply(YieldAction(player.username, player.decide_to_yield()))
 
         # TODO: there is currently no opportunity to buy/use cards
 
-        # Give everyone a chance to yield tokyo if they can
-        for player in game_state.players.get_all_alive_players_minus_current_player():
-            if player.allowed_to_yield and player.decide_to_yield():
-                game_state.yield_tokyo_to_current_player(player)
-
-        # Checks if anyone has won and give chance for special card actions
-        game_state.post_roll_actions(game_state.players.current_player)
-
-        # Advance the game to the next active player (also resets some states)
-        game_state.get_next_player_turn()
+        # Checks if anyone has won, gives a chance for special card actions
+        # and advances the game to the next active player
+        game_state.apply(EndTurnAction(username))
 
         # Increment turn counter if back at starting player
         if game_state.players.current_player == start_player:
@@ -1,33 +1,23 @@
-from game.player.player import Player
-import copy
+import sys
 from statistics import mean
-from typing import DefaultDict
 
-from run_offline_game import run_game
-from game.engine.terminal_board import TerminalBoardGame
+from game.engine.simulation import simulate_games
+from game.engine.tournament import Scenario, run_tournament
 from game.player.ai_players.attack_ai_player import Attack_AI_Player
 from game.player.ai_players.chaos_ai_player import Chaos_AI_Player
 from game.player.ai_players.final_ai_player import Final_AI_Player
 from game.player.ai_players.points_ai_player import Points_AI_Player
 
 MAIN_PLAYER_NAME = "Final AI Bob"
+OPPONENTS = [("Chaos", Chaos_AI_Player, "CHAOS AI George"),
+             ("Attack", Attack_AI_Player, "Attack AI George"),
+             ("Points", Points_AI_Player, "Points AI George")]
 
 
 def run_multiple_games(title, players, count=100):
     print(f"\nRunning scenario: {title}")
-    win_counts = DefaultDict(int)
-    for i in range(count):
-        player_copy = copy.deepcopy(players)
-        print(f"Running game {i}\r", end="")
-
-        game_state = TerminalBoardGame()
-
-        for player in player_copy:
-            player.player_queue = game_state.players
-            game_state.add_player(player)
-
-        winner = run_game(game_state)
-        win_counts[winner.username] += 1
+    # same rules as run_game, played headless on one reused game
+    win_counts = simulate_games(players, count)
 
     print(f"Win percenteges:")
     for winner in win_counts:
@@ -61,39 +51,44 @@ def test_final_vs_points(final_ai, count=1):
     return run_multiple_games(f"Final AI vs {count}x Points AI", players)
 
 
-if __name__ == "__main__":
-
-    aggression_win_rates = {}
-
-    for passiveness in [0, 10]:  # range(10, 11):
-        passiveness /= 10
-
-        print(f"\n\n----Testing passiveness {passiveness}----")
+def passiveness_sweep_scenarios(passiveness_levels, max_opponents=5):
+    scenarios = []
+    for passiveness in passiveness_levels:
         main_player = Final_AI_Player(
             None, username=MAIN_PLAYER_NAME, passiveness=passiveness)
+        for opponent_count in range(1, max_opponents + 1):
+            for opponent_name, opponent_class, opponent_username in OPPONENTS:
+                players = [main_player]
+                for i in range(1, opponent_count + 1):
+                    players.append(opponent_class(
+                        None, username=f"{opponent_username}{i}"))
+                scenarios.append(Scenario(
+                    f"passiveness {passiveness}: Final AI vs {opponent_count}x {opponent_name} AI", players))
+    return scenarios
 
-        win_percentages = []
-
-        for opponent_count in range(1, 6):
-            percentages_chaos = test_final_vs_chaos(
-                main_player, count=opponent_count)
-            percentages_attack = test_final_vs_attack(
-                main_player, count=opponent_count)
-            percentages_points = test_final_vs_points(
-                main_player, count=opponent_count)
 
-            chaos_win_percent = percentages_chaos[MAIN_PLAYER_NAME] / \
-                sum(percentages_chaos.values())
-
-            attack_win_percent = percentages_attack[MAIN_PLAYER_NAME] / \
-                sum(percentages_attack.values())
+if __name__ == "__main__":
+    # usage: python test_ai.py [checkpoint.json], rerun with the same checkpoint to resume an interrupted sweep
+    checkpoint_path = sys.argv[1] if len(sys.argv) > 1 else None
+    passiveness_levels = [0, 1.0]
+    scenarios = passiveness_sweep_scenarios(passiveness_levels)
 
-            points_win_percent = percentages_points[MAIN_PLAYER_NAME] / \
-                sum(percentages_points.values())
+    results = run_tournament(scenarios, 100, checkpoint_path=checkpoint_path,
+                             on_shard=lambda shard: print(f"Finished {shard.title} #{shard.shard}"))
 
-            win_percentages.append(chaos_win_percent)
-            win_percentages.append(attack_win_percent)
-            win_percentages.append(points_win_percent)
+    aggression_win_rates = {}
+    for passiveness in passiveness_levels:
+        print(f"\n\n----Testing passiveness {passiveness}----")
+        win_percentages = []
+        for scenario in scenarios:
+            if not scenario.title.startswith(f"passiveness {passiveness}:"):
+                continue
+            result = results[scenario.title]
+            low, high = result.confidence_interval(MAIN_PLAYER_NAME)
+            win_rate = result.win_rate(MAIN_PLAYER_NAME)
+            print(f"{scenario.title}: {win_rate * 100:.2f}% "
+                  f"(95% CI {low * 100:.2f}% - {high * 100:.2f}%)")
+            win_percentages.append(win_rate)
 
         mean_win_rate = mean(win_percentages) * 100
 
@@ -104,5 +99,3 @@ if __name__ == "__main__":
     print("Best:                                    ")
     print(f"\Passive level: {best_key} ")
     print(f"\tWin rate: {aggression_win_rates[best_key]:.2f}%")
-
-    # print(aggression_win_rates)
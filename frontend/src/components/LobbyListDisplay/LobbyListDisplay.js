@@ -18,9 +18,13 @@ class LobbyListDisplay extends React.Component {
     GameInstance.addGameListResponseCallback(
       this.gameListResponseHandler.bind(this)
     );
+    GameInstance.addLobbyRoomCallbacks(
+      this.roomChangedHandler.bind(this),
+      this.roomRemovedHandler.bind(this)
+    );
 
     this.waitForSocketConnection(() => {
-      const request = this.createRequestGameListCommand(
+      const request = this.createSubscribeGameListCommand(
         this.state.username,
         this.state.gameRoom
       );
@@ -43,9 +47,10 @@ class LobbyListDisplay extends React.Component {
     }, 100); // wait 100 milisecond for the connection...
   }
 
-  createRequestGameListCommand(user, room) {
+  createSubscribeGameListCommand(user, room) {
+    // the server answers with the current list, then pushes room changes
     return {
-      command: "request_game_list",
+      command: "subscribe_game_list",
       user: user,
       room: room
     };
@@ -82,6 +87,33 @@ class LobbyListDisplay extends React.Component {
     }
   }
 
+  roomChangedHandler(message) {
+    const content = message.content;
+    if (!(content instanceof Object)) return;
+
+    let player_list = [];
+    try {
+      for (const player of JSON.parse(content.players)) {
+        player_list.push(player.username);
+      }
+    } catch (e) {}
+
+    const entry = { room_name: content.room, users: player_list.join() };
+    const data = this.state.data instanceof Array ? this.state.data : [];
+    const others = data.filter(game => game.room_name !== content.room);
+    this.setState({ data: [entry, ...others] });
+  }
+
+  roomRemovedHandler(message) {
+    const content = message.content;
+    if (!(content instanceof Object) || !(this.state.data instanceof Array))
+      return;
+
+    this.setState({
+      data: this.state.data.filter(game => game.room_name !== content.room)
+    });
+  }
+
   setRedirect = e => {
     this.setState({
       gameRoom: e.target.id,
@@ -38,6 +38,12 @@ class GameService {
     constructor() {
         this.socketRef = null;
         this.YieldAlert = new YieldAlert()
+        // player status rebuilt from player_status_snapshot_response and player_status_delta_response
+        this.playerStatus = null;
+        this.playerStatusSnapshotRequested = false;
+
+        EventEmitter.on("player_status_snapshot_response", this.playerStatusSnapshotHandler.bind(this));
+        EventEmitter.on("player_status_delta_response", this.playerStatusDeltaHandler.bind(this));
     }
 
     connect(roomName, base_path) {
@@ -66,10 +72,61 @@ class GameService {
 
     socketNewMessage(data) {
         const parsedData = JSON.parse(data);
-        const command = parsedData.command;
-        const action = parsedData.action;
+        // batched rooms deliver every message produced by one command as a single list frame
+        const messages = Array.isArray(parsedData) ? parsedData : [parsedData];
+
+        for (const message of messages) {
+            EventEmitter.emit(message.command, message.action);
+        }
+    }
+
+    playerStatusSnapshotHandler(action) {
+        // a snapshot always replaces what we hold, the room may have been reloaded and started its versions over
+        this.playerStatus = {version: action.content.version, players: action.content.players};
+        this.playerStatusSnapshotRequested = false;
+        this.emitPlayerStatus(action);
+    }
+
+    playerStatusDeltaHandler(action) {
+        const delta = action.content;
+        if (this.playerStatus !== null && delta.version <= this.playerStatus.version) {
+            return;
+        }
+        if (this.playerStatus === null || delta.version !== this.playerStatus.version + 1) {
+            // a delta went missing, only a snapshot can bring us back in step
+            this.requestPlayerStatusSnapshot(action);
+            return;
+        }
 
-        EventEmitter.emit(command, action);
+        const players = this.playerStatus.players.map(player => {
+            const changes = delta.players.find(changed => changed.username === player.username);
+            return changes ? {...player, ...changes} : player;
+        });
+        for (const changed of delta.players) {
+            if (!players.some(player => player.username === changed.username)) {
+                players.push(changed);
+            }
+        }
+        this.playerStatus = {version: delta.version, players: players};
+        this.emitPlayerStatus(action);
+    }
+
+    requestPlayerStatusSnapshot(action) {
+        if (this.playerStatusSnapshotRequested) {
+            return;
+        }
+        this.playerStatusSnapshotRequested = true;
+        this.sendMessage({
+            command: "player_status_snapshot_request",
+            user: action.user,
+            room: action.room,
+            payload: ""
+        });
+    }
+
+    emitPlayerStatus(action) {
+        // components read the whole roster as a JSON string, as sent by player_status_update_response
+        EventEmitter.emit("player_status_update_response", {...action, content: JSON.stringify(this.playerStatus.players)});
     }
 
     addCallback(callback_lookup_key, playerValueCallback) {
@@ -80,6 +137,12 @@ class GameService {
         EventEmitter.on("game_list_response", gameListResponseCallback);
     }
 
+    addLobbyRoomCallbacks(roomChangedCallback, roomRemovedCallback) {
+        EventEmitter.on("room_added", roomChangedCallback);
+        EventEmitter.on("room_updated", roomChangedCallback);
+        EventEmitter.on("room_removed", roomRemovedCallback);
+    }
+
     addServerResponseCallback(serverResponseCallback) {
         EventEmitter.on("server_response", serverResponseCallback);
     }